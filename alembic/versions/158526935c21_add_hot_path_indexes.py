@@ -0,0 +1,63 @@
+"""add hot path indexes
+
+Revision ID: 158526935c21
+Revises: 69512801f1a1
+Create Date: 2026-10-18 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '158526935c21'
+down_revision: Union[str, Sequence[str], None] = '69512801f1a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A user saving the same job twice is harmless, drop the extra rows so the
+    # unique index can be built. Duplicate users/applications are left to fail loudly.
+    op.execute(
+        "DELETE FROM savejob WHERE id NOT IN "
+        "(SELECT MIN(id) FROM savejob GROUP BY user_id, job_id)"
+    )
+
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+
+    op.create_index(op.f('ix_job_user_id'), 'job', ['user_id'], unique=False)
+
+    op.create_index('ix_applicants_applicant_applied_for', 'applicants', ['applicant', 'applied_for'], unique=True)
+    op.create_index(op.f('ix_applicants_applied_for'), 'applicants', ['applied_for'], unique=False)
+    op.create_index(op.f('ix_applicants_status'), 'applicants', ['status'], unique=False)
+
+    op.create_index('ix_savejob_user_id_job_id', 'savejob', ['user_id', 'job_id'], unique=True)
+    op.create_index(op.f('ix_savejob_job_id'), 'savejob', ['job_id'], unique=False)
+
+    op.create_index(op.f('ix_interviews_applicant_id'), 'interviews', ['applicant_id'], unique=False)
+
+    op.create_index(op.f('ix_public_interview_attempts_interview_id'), 'public_interview_attempts', ['interview_id'], unique=False)
+    op.create_index(op.f('ix_public_interview_attempts_user_id'), 'public_interview_attempts', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_public_interview_attempts_user_id'), table_name='public_interview_attempts')
+    op.drop_index(op.f('ix_public_interview_attempts_interview_id'), table_name='public_interview_attempts')
+
+    op.drop_index(op.f('ix_interviews_applicant_id'), table_name='interviews')
+
+    op.drop_index(op.f('ix_savejob_job_id'), table_name='savejob')
+    op.drop_index('ix_savejob_user_id_job_id', table_name='savejob')
+
+    op.drop_index(op.f('ix_applicants_status'), table_name='applicants')
+    op.drop_index(op.f('ix_applicants_applied_for'), table_name='applicants')
+    op.drop_index('ix_applicants_applicant_applied_for', table_name='applicants')
+
+    op.drop_index(op.f('ix_job_user_id'), table_name='job')
+
+    op.drop_index(op.f('ix_users_email'), table_name='users')
@@ -0,0 +1,91 @@
+"""add job full text search
+
+Revision ID: 4b1f0c6e9a27
+Revises: da038082d2c6
+Create Date: 2026-10-18 11:48:03.219574
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b1f0c6e9a27'
+down_revision: Union[str, Sequence[str], None] = 'da038082d2c6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+JOB = sa.table(
+    'job',
+    sa.column('id', sa.Integer), sa.column('title', sa.String), sa.column('company', sa.String),
+    sa.column('location', sa.String), sa.column('description', sa.Text), sa.column('skills', sa.JSON),
+)
+
+
+def _documents(bind) -> list[dict]:
+    """Search rows formatted like database.search._document (skills list joined with spaces)."""
+    documents = []
+    for job in bind.execute(sa.select(JOB)).mappings():
+        skills = job['skills'] or []
+        if isinstance(skills, (list, tuple)):
+            skills = " ".join(str(skill) for skill in skills)
+        documents.append({
+            'job_id': job['id'],
+            'title': job['title'] or '',
+            'company': job['company'] or '',
+            'location': job['location'] or '',
+            'description': job['description'] or '',
+            'skills': skills or '',
+        })
+    return documents
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Search tables live outside the ORM metadata, see database/search.py
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("""
+            CREATE TABLE job_search (
+                job_id INTEGER PRIMARY KEY REFERENCES job (id) ON DELETE CASCADE,
+                document TSVECTOR NOT NULL,
+                location TSVECTOR NOT NULL
+            )
+        """)
+        op.execute("CREATE INDEX ix_job_search_document ON job_search USING GIN (document)")
+        op.execute("CREATE INDEX ix_job_search_location ON job_search USING GIN (location)")
+        documents = _documents(op.get_bind())
+        if documents:
+            op.get_bind().execute(sa.text("""
+                INSERT INTO job_search (job_id, document, location)
+                VALUES (
+                    :job_id,
+                    setweight(to_tsvector('english', :title), 'A') ||
+                    setweight(to_tsvector('english', :company || ' ' || :skills), 'B') ||
+                    setweight(to_tsvector('english', :description), 'C'),
+                    to_tsvector('simple', :location)
+                )
+            """), documents)
+    else:
+        op.execute("""
+            CREATE VIRTUAL TABLE job_fts USING fts5(
+                title, company, location, description, skills,
+                tokenize = 'porter unicode61 remove_diacritics 2'
+            )
+        """)
+        documents = _documents(op.get_bind())
+        if documents:
+            op.get_bind().execute(sa.text("""
+                INSERT INTO job_fts (rowid, title, company, location, description, skills)
+                VALUES (:job_id, :title, :company, :location, :description, :skills)
+            """), documents)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP TABLE job_search")
+    else:
+        op.execute("DROP TABLE job_fts")
@@ -0,0 +1,48 @@
+"""add interview turns table
+
+Revision ID: 7aae7a529ed3
+Revises: 4b1f0c6e9a27
+Create Date: 2026-10-18 12:31:45.880412
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7aae7a529ed3'
+down_revision: Union[str, Sequence[str], None] = '4b1f0c6e9a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('interview_turns',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('interview_id', sa.Integer(), nullable=True),
+    sa.Column('attempt_id', sa.Integer(), nullable=True),
+    sa.Column('seq', sa.Integer(), nullable=False),
+    sa.Column('role', sa.String(length=20), nullable=False),
+    sa.Column('text', sa.Text(), nullable=False),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('latency_ms', sa.Integer(), nullable=True),
+    sa.Column('llm_ms', sa.Integer(), nullable=True),
+    sa.Column('stt_ms', sa.Integer(), nullable=True),
+    sa.Column('tts_ms', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['attempt_id'], ['public_interview_attempts.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['interview_id'], ['interviews.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_interview_turns_attempt_id_seq', 'interview_turns', ['attempt_id', 'seq'], unique=True)
+    op.create_index('ix_interview_turns_interview_id_seq', 'interview_turns', ['interview_id', 'seq'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_interview_turns_interview_id_seq', table_name='interview_turns')
+    op.drop_index('ix_interview_turns_attempt_id_seq', table_name='interview_turns')
+    op.drop_table('interview_turns')
@@ -0,0 +1,33 @@
+"""add job and resume summaries
+
+Revision ID: 7b3e58d1c2fa
+Revises: c4a97e3d5b18
+Create Date: 2026-10-18 18:22:40.518734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b3e58d1c2fa'
+down_revision: Union[str, Sequence[str], None] = 'c4a97e3d5b18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows are summarized lazily on first interview (database/summaries.py)
+    op.add_column('job', sa.Column('job_summary', sa.Text(), nullable=True))
+    op.add_column('public_interviews', sa.Column('job_summary', sa.Text(), nullable=True))
+    op.add_column('resume_texts', sa.Column('summary', sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('resume_texts', 'summary')
+    op.drop_column('public_interviews', 'job_summary')
+    op.drop_column('job', 'job_summary')
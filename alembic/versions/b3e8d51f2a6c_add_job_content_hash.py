@@ -0,0 +1,55 @@
+"""add job content hash
+
+Revision ID: b3e8d51f2a6c
+Revises: 7aae7a529ed3
+Create Date: 2026-10-18 13:05:12.417093
+
+"""
+import hashlib
+import re
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e8d51f2a6c'
+down_revision: Union[str, Sequence[str], None] = '7aae7a529ed3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Frozen copy of database.ingest.job_content_hash at the time of this revision
+def _normalize(value):
+    return re.sub(r"\s+", " ", value or "").strip().lower()
+
+
+def _content_hash(title, company, location, posted_on):
+    key = "\x1f".join(_normalize(value) for value in (title, company, location, posted_on))
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('job', sa.Column('content_hash', sa.String(length=64), nullable=True))
+
+    # Backfill. Jobs that duplicate an older one keep a NULL hash so the unique index can be built.
+    conn = op.get_bind()
+    seen = set()
+    updates = []
+    for row in conn.execute(sa.text("SELECT id, title, company, location, posted_on FROM job ORDER BY id")):
+        content_hash = _content_hash(row.title, row.company, row.location, row.posted_on)
+        if content_hash not in seen:
+            seen.add(content_hash)
+            updates.append({"id": row.id, "content_hash": content_hash})
+    if updates:
+        conn.execute(sa.text("UPDATE job SET content_hash = :content_hash WHERE id = :id"), updates)
+
+    op.create_index(op.f('ix_job_content_hash'), 'job', ['content_hash'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_job_content_hash'), table_name='job')
+    op.drop_column('job', 'content_hash')
@@ -0,0 +1,41 @@
+"""add resume texts table
+
+Revision ID: c4a97e3d5b18
+Revises: e61c0a7d94b2
+Create Date: 2026-10-18 16:05:12.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a97e3d5b18'
+down_revision: Union[str, Sequence[str], None] = 'e61c0a7d94b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing resumes are extracted lazily on first read (database/resume_text.py)
+    op.create_table('resume_texts',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('resume_url', sa.String(length=256), nullable=False),
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('page_count', sa.Integer(), nullable=False),
+    sa.Column('text', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_resume_texts_content_hash'), 'resume_texts', ['content_hash'], unique=False)
+    op.create_index(op.f('ix_resume_texts_resume_url'), 'resume_texts', ['resume_url'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_resume_texts_resume_url'), table_name='resume_texts')
+    op.drop_index(op.f('ix_resume_texts_content_hash'), table_name='resume_texts')
+    op.drop_table('resume_texts')
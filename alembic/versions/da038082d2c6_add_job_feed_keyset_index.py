@@ -0,0 +1,29 @@
+"""add job feed keyset index
+
+Revision ID: da038082d2c6
+Revises: 158526935c21
+Create Date: 2026-10-18 11:02:17.540932
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'da038082d2c6'
+down_revision: Union[str, Sequence[str], None] = '158526935c21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Serves the per-source dashboard feed: WHERE source = ? ORDER BY created_at DESC, id DESC
+    op.create_index('ix_job_source_created_at_id', 'job', ['source', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_source_created_at_id', table_name='job')
@@ -0,0 +1,40 @@
+"""add resume analyses table
+
+Revision ID: e61c0a7d94b2
+Revises: b3e8d51f2a6c
+Create Date: 2026-10-18 14:22:40.118305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e61c0a7d94b2'
+down_revision: Union[str, Sequence[str], None] = 'b3e8d51f2a6c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('resume_analyses',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('cache_key', sa.String(length=64), nullable=False),
+    sa.Column('job_id', sa.Integer(), nullable=False),
+    sa.Column('result', sa.JSON(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['job_id'], ['job.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_resume_analyses_cache_key'), 'resume_analyses', ['cache_key'], unique=True)
+    op.create_index(op.f('ix_resume_analyses_job_id'), 'resume_analyses', ['job_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_resume_analyses_job_id'), table_name='resume_analyses')
+    op.drop_index(op.f('ix_resume_analyses_cache_key'), table_name='resume_analyses')
+    op.drop_table('resume_analyses')
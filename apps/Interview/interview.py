@@ -4,10 +4,11 @@ from fastapi.exceptions import HTTPException
 from apps.auth.utils import get_current_user
 from database.models import Applicant, Interview
 from sqlalchemy.orm import Session
-from database.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.database import get_db, get_async_db
 from config import templates
-import datetime
-from utils.ai_model import evaluate_interview_ai
+from datetime import datetime
+from apps.Interview.service import save_interview_evaluation
 import cloudinary.uploader
 
 
@@ -38,67 +39,21 @@ async def chat(request: Request, applicant_id: int, current_user=Depends(get_cur
 
 
 @interview_router.post("/save-interview/{applicant_id}")
-async def save_interview(applicant_id: int, data: dict, db: Session = Depends(get_db)):
-    applicant = db.query(Applicant).filter_by(id=applicant_id).first()
+async def save_interview(applicant_id: int, data: dict, db: AsyncSession = Depends(get_async_db)):
+    applicant = await db.get(Applicant, applicant_id)
     if not applicant:
         return JSONResponse(status_code=404, content={"detail": "Applicant not found"})
     transcript = data.get("transcript", [])
     if not transcript:
         return JSONResponse(status_code=400, content={"detail": "Transcript is empty"})
-    system_prompt = """
-        You are an expert technical interviewer AI. You will receive a transcript of a candidate's interview session.
-        Your task is to analyze how well the candidate performed, considering the following:
-        - Technical correctness
-        - Clarity of explanation
-        - Confidence and communication skills
-        - Problem-solving ability
-        - Relevance and depth of responses
-
-        You must provide your response strictly in JSON format as:
-        {
-        "score": <float from 0-100>,
-        "status": "<pass or fail>",
-        "feedback": "<detailed paragraph>"
-        }
-
-        Rules:
-        - Score under 50 → status must be "fail".
-        - Score 50 and above → status must be "pass".
-        - Give clear, constructive feedback describing strong areas and what to improve.
-        """
-    ai_result = await evaluate_interview_ai(transcript, system_prompt)
-    score = ai_result.get("score", 0)
-    status = ai_result.get("status", "fail")
-    feedback = ai_result.get("feedback", "No feedback generated.")
-    interview = db.query(Interview).filter_by(applicant_id=applicant_id).first()
-    if interview:
-        interview.transcript = transcript
-        interview.question_count = sum(1 for t in transcript if t.get("sender") == "AI")
-        interview.completed_at = datetime.utcnow()
-        interview.score = score
-        interview.status = status
-        interview.feedback = feedback
-    else:
-        interview = Interview(
-            applicant_id=applicant_id,
-            transcript=transcript,
-            question_count=sum(1 for t in transcript if t.get("sender") == "AI"),
-            completed_at=datetime.utcnow(),
-            score=score,
-            status=status,
-            feedback=feedback
-        )
-        db.add(interview)
-
-    db.commit()
-    db.refresh(interview)
+    interview = await save_interview_evaluation(db, applicant_id, transcript)
 
     return {
         "message": "Interview saved and evaluated by Gemini AI",
         "interview_id": interview.id,
-        "score": score,
-        "status": status,
-        "feedback": feedback
+        "score": interview.score,
+        "status": interview.status,
+        "feedback": interview.feedback
     }
 
 
@@ -0,0 +1,65 @@
+"""
+Scoring of finished applicant interviews, shared by /save-interview and the
+/ws/chat websocket so the socket no longer posts back to its own server.
+"""
+from datetime import datetime
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.models import Interview
+from utils.ai_model import evaluate_interview_ai
+
+
+EVALUATION_SYSTEM_PROMPT = """
+    You are an expert technical interviewer AI. You will receive a transcript of a candidate's interview session.
+    Your task is to analyze how well the candidate performed, considering the following:
+    - Technical correctness
+    - Clarity of explanation
+    - Confidence and communication skills
+    - Problem-solving ability
+    - Relevance and depth of responses
+
+    You must provide your response strictly in JSON format as:
+    {
+    "score": <float from 0-100>,
+    "status": "<pass or fail>",
+    "feedback": "<detailed paragraph>"
+    }
+
+    Rules:
+    - Score under 50 → status must be "fail".
+    - Score 50 and above → status must be "pass".
+    - Give clear, constructive feedback describing strong areas and what to improve.
+    """
+
+
+async def save_interview_evaluation(db: AsyncSession, applicant_id: int, transcript: list) -> Interview:
+    """Evaluate `transcript` with the AI and store it with the score on the applicant's interview."""
+    ai_result = await evaluate_interview_ai(transcript, EVALUATION_SYSTEM_PROMPT)
+    score = ai_result.get("score", 0)
+    status = ai_result.get("status", "fail")
+    feedback = ai_result.get("feedback", "No feedback generated.")
+    question_count = sum(1 for t in transcript if t.get("sender") == "AI")
+
+    interview = await db.scalar(select(Interview).filter_by(applicant_id=applicant_id).limit(1))
+    if interview:
+        interview.transcript = transcript
+        interview.question_count = question_count
+        interview.completed_at = datetime.utcnow()
+        interview.score = score
+        interview.status = status
+        interview.feedback = feedback
+    else:
+        interview = Interview(
+            applicant_id=applicant_id,
+            transcript=transcript,
+            question_count=question_count,
+            completed_at=datetime.utcnow(),
+            score=score,
+            status=status,
+            feedback=feedback
+        )
+        db.add(interview)
+
+    await db.commit()
+    await db.refresh(interview)
+    return interview
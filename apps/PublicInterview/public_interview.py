@@ -1,9 +1,14 @@
 from fastapi import APIRouter, Request, Depends, Form, UploadFile, File
 from fastapi.responses import JSONResponse, RedirectResponse
-from apps.auth.utils import get_current_user
+from apps.auth.utils import get_current_user, get_current_user_async
 from database.models import PublicInterview, Job, PublicInterviewAttempt, User
 from sqlalchemy.orm import Session
-from database.database import get_db, engine
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.database import get_db, get_async_db, engine
+from database.resume_text import save_resume_text, parse_resume_pdf
+from database.summaries import summarize_job
+from utils.pdf_extract import PdfLimitError
+import asyncio
 import os
 from datetime import datetime
 from database.schema import PublicInterviewCreate, PublicInterviewUpdate
@@ -27,7 +32,7 @@ async def create_public_interview(
         return templates.TemplateResponse("create_public_interview.html", {"request":request, "current_user":current_user})
     elif request.method=="POST":
         if current_user.is_recruiter:
-            new_interview = PublicInterview(created_by=current_user.id, title=interview.title, role=interview.role, skills=interview.skills, description=interview.description, category=interview.category, status=interview.status)
+            new_interview = PublicInterview(created_by=current_user.id, title=interview.title, role=interview.role, skills=interview.skills, description=interview.description, job_summary=await summarize_job(interview.description), category=interview.category, status=interview.status)
             db.add(new_interview)
             db.commit()
             db.refresh(new_interview)
@@ -60,6 +65,8 @@ async def edit_public_interview(
             return templates.TemplateResponse("edit_public_interview.html", {"request":request, "current_user":current_user, "interview":ex_interview})
     elif request.method=="PUT":
         db_interview = db.query(PublicInterview).filter_by(id=interview_id).first()
+        if interview.description != db_interview.description:
+            db_interview.job_summary = await summarize_job(interview.description)
         db_interview.title = interview.title
         db_interview.skills = interview.skills
         db_interview.role = interview.role
@@ -132,14 +139,19 @@ async def all_public_interview(
 async def upload_resume(
     interview_id: int,
     resume: UploadFile = File(...),
-    db: Session = Depends(get_db),
-    current_user=Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async)
 ):
     if not resume:
         raise HTTPException(status_code=400, detail="Resume file is required.")
 
     contents = await resume.read()
-    upload = cloudinary.uploader.upload(
+    try:
+        parsed = await parse_resume_pdf(contents)
+    except PdfLimitError as e:
+        raise HTTPException(status_code=400, detail=f"Resume rejected: {e}")
+    upload = await asyncio.to_thread(
+        cloudinary.uploader.upload,
         contents,
         resource_type="raw",
         public_id=resume.filename,
@@ -147,6 +159,7 @@ async def upload_resume(
         unique_filename=False 
     )
     resume_url = upload.get("secure_url")
+    await save_resume_text(db, resume_url, contents, parsed)
 
     attempt = PublicInterviewAttempt(
         interview_id=interview_id,
@@ -154,8 +167,8 @@ async def upload_resume(
         resume=resume_url,
     )
     db.add(attempt)
-    db.commit()
-    db.refresh(attempt)
+    await db.commit()
+    await db.refresh(attempt)
 
     return {
         "message": "Resume uploaded successfully",
@@ -4,7 +4,7 @@ from database.models import User
 from database.schema import AddUser, LoginUser, UserResponse
 from database.database import get_db
 from sqlalchemy.orm import Session
-from apps.auth.utils import get_password_hash, create_access_token, verify_password, ACCESS_TOKEN_EXPIRY_MINUTES
+from apps.auth.utils import hash_password, create_access_token, check_password, ACCESS_TOKEN_EXPIRY_MINUTES
 from datetime import timedelta
 from fastapi.responses import JSONResponse, RedirectResponse
 from config import templates
@@ -31,7 +31,7 @@ async def post_registration(
     new_user = User(
         name=user.name,
         email=user.email,
-        password=get_password_hash(user.password),
+        password=await hash_password(user.password),
         is_recruiter=user.is_recruiter
     )
     db.add(new_user)
@@ -55,8 +55,12 @@ async def post_login(
     if not existed_user:
         return JSONResponse(status_code=400, content={"error": "User not registered"})
     
-    if not verify_password(user.password, existed_user.password):
+    valid, new_hash = await check_password(user.password, existed_user.password)
+    if not valid:
         return JSONResponse(status_code=400, content={"error": "Incorrect Password"})
+    if new_hash:
+        existed_user.password = new_hash
+        db.commit()
     
     access_token = create_access_token(
         data={"sub": existed_user.email},
@@ -1,13 +1,18 @@
 from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import jwt
 from fastapi import Depends, Request, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from passlib.context import CryptContext
 from fastapi.security import HTTPBearer
-from sqlalchemy.orm import Session
-from database.database import get_db
+from sqlalchemy import select
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.database import get_db, get_async_db
 from database.models import User
 from config import Config
+from utils.cache import TTLCache
 
 
 
@@ -19,7 +24,25 @@ security = HTTPBearer()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
-pwd_context = CryptContext(schemes=["argon2"], deprecated="auto")
+# Unset cost parameters keep the passlib defaults. Changing them rehashes passwords on the next login.
+ARGON2_SETTINGS = {
+    f"argon2__{name}": value
+    for name, value in (
+        ("time_cost", Config.ARGON2_TIME_COST),
+        ("memory_cost", Config.ARGON2_MEMORY_COST),
+        ("parallelism", Config.ARGON2_PARALLELISM),
+    )
+    if value
+}
+pwd_context = CryptContext(schemes=["argon2"], deprecated="auto", **ARGON2_SETTINGS)
+
+# Argon2 releases the GIL, so a small thread pool keeps it off the event loop
+password_hash_executor = ThreadPoolExecutor(max_workers=Config.PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+password_hash_jobs = 0  # running + queued, only touched from the event loop
+
+# Token subject (email) -> User column values, minus the password hash
+user_cache = TTLCache("users", maxsize=Config.USER_CACHE_SIZE, ttl=Config.USER_CACHE_TTL_SECONDS)
+USER_CACHE_COLUMNS = [column.key for column in User.__table__.columns if column.key != "password"]
 
 def verify_password(plain_password, hashed_password):
     return pwd_context.verify(plain_password, hashed_password)
@@ -29,6 +52,33 @@ def get_password_hash(password):
     return pwd_context.hash(password)
 
 
+async def run_password_job(func, *args):
+    """
+    Run a hashing call on the password pool. Rejects with 503 once
+    PASSWORD_HASH_WORKERS + PASSWORD_HASH_MAX_QUEUE jobs are already waiting.
+    """
+    global password_hash_jobs
+    if password_hash_jobs >= Config.PASSWORD_HASH_WORKERS + Config.PASSWORD_HASH_MAX_QUEUE:
+        raise HTTPException(status_code=503, detail="Server is busy, please try again", headers={"Retry-After": "1"})
+    password_hash_jobs += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(password_hash_executor, func, *args)
+    finally:
+        password_hash_jobs -= 1
+
+
+async def hash_password(password):
+    return await run_password_job(pwd_context.hash, password)
+
+
+async def check_password(plain_password, hashed_password):
+    """
+    Verify off the event loop. Returns (valid, new_hash); new_hash is set when the
+    stored hash uses outdated Argon2 parameters and should be saved in its place.
+    """
+    return await run_password_job(pwd_context.verify_and_update, plain_password, hashed_password)
+
+
 def create_access_token(data:dict, expires_delta:timedelta):
     to_encode = data.copy()
     if expires_delta:
@@ -42,7 +92,8 @@ def create_access_token(data:dict, expires_delta:timedelta):
     return encoded_jwt
 
 
-def get_current_user(request: Request, db: Session = Depends(get_db)):
+def _token_email(request: Request) -> str:
+    """Email (token subject) of the logged-in user; redirects to /login without a valid session."""
     token = request.cookies.get("access_token")
     next_url = request.url.path    # default to dashboard
     
@@ -59,9 +110,53 @@ def get_current_user(request: Request, db: Session = Depends(get_db)):
     email = payload.get("sub")
     if not email:
         raise HTTPException(status_code=401, detail="Invalid token payload")
-    
+    return email
+
+
+def _cached_user(email: str) -> User | None:
+    """Detached User built from user_cache, or None on a miss."""
+    cached = user_cache.get(email)
+    if cached is None:
+        return None
+    user = User(**cached)
+    make_transient_to_detached(user)
+    return user
+
+
+def get_current_user(request: Request, db: Session = Depends(get_db)):
+    email = _token_email(request)
+    cached = _cached_user(email)
+    if cached is not None:
+        # Attach without a SELECT; relationships and the password still load lazily through db
+        return db.merge(cached, load=False)
+
     user = db.query(User).filter_by(email=email).first()
     if not user:
-        raise HTTPException(status_code=404, headers={"Location": f"/login?next={next_url}"})
+        raise HTTPException(status_code=404, headers={"Location": f"/login?next={request.url.path}"})
     
+    user_cache.set(email, {key: getattr(user, key) for key in USER_CACHE_COLUMNS})
     return user
+
+
+async def get_current_user_async(request: Request, db: AsyncSession = Depends(get_async_db)):
+    """
+    get_current_user for routes on get_async_db: shares the route's AsyncSession
+    instead of opening a sync one. The password is not loaded on cache hits and
+    cannot lazy load through an AsyncSession.
+    """
+    email = _token_email(request)
+    cached = _cached_user(email)
+    if cached is not None:
+        return await db.merge(cached, load=False)
+
+    user = await db.scalar(select(User).filter_by(email=email).limit(1))
+    if not user:
+        raise HTTPException(status_code=404, headers={"Location": f"/login?next={request.url.path}"})
+
+    user_cache.set(email, {key: getattr(user, key) for key in USER_CACHE_COLUMNS})
+    return user
+
+
+def invalidate_user(email: str):
+    """Drop a user from the get_current_user(_async) cache. Call after any change to the users row."""
+    user_cache.pop(email)
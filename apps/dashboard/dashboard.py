@@ -1,33 +1,48 @@
-from fastapi import APIRouter, Request, Depends, Form, UploadFile, File
+from fastapi import APIRouter, Request, Depends, Form, UploadFile, File, Query
 from fastapi.responses import JSONResponse, RedirectResponse
-from apps.auth.utils import get_current_user
+from apps.auth.utils import get_current_user, get_current_user_async
 from database.models import Job, Applicant, User, SaveJob, Interview, PublicInterview
-from sqlalchemy.orm import Session
-from database.database import get_db
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.database import get_db, get_async_db
+from database.search import index_job, remove_job, search_jobs
+from database.ingest import ingest_jobs, job_content_hash, MAX_BULK_JOBS
+from database.analysis_cache import cached_analyze_resume, invalidate_job_analyses, resume_text_key, resume_url_key
+from database.resume_text import load_resume_text, save_resume_text, parse_resume_pdf
+from database.summaries import summarize_job
+from utils.pdf_extract import PdfLimitError
 from database.schema import JobResponse, JobCreate, ApplicantResponse, JobEdit, UpdateUser, SaveJobResponse
 import cloudinary.uploader
-from apps.auth.utils import get_password_hash, verify_password
+from apps.auth.utils import hash_password, check_password, invalidate_user
 from typing import List
 from config import templates
 import subprocess
 from datetime import datetime, timedelta
-import requests
 import sys
-from utils.ai_model import analyze_resume
-import io
+from utils.pagination import keyset_page, split_page
 from smtplib import SMTP
-from sqlalchemy import and_
+from sqlalchemy import select, func, or_
+from sqlalchemy.exc import IntegrityError
 from email.mime.text import MIMEText
-from PyPDF2 import PdfReader
 import os
 from email.mime.multipart import MIMEMultipart
 from dotenv import load_dotenv
 import asyncio
+import json
 
 load_dotenv()
 
 dashboard_router = APIRouter()
 
+# Dashboard tab -> Job.source
+JOB_FEED_SOURCES = {
+    "linkedin": "linkedin",
+    "rozee": "rozee.pk",
+    "user-posted": "manual",
+}
+JOB_FEED_PAGE_SIZE = 10
+APPLICANTS_PAGE_SIZE = 20
+
 
 @dashboard_router.get("/")
 async def landing_page(request:Request, db:Session=Depends(get_db)):
@@ -37,22 +52,94 @@ async def landing_page(request:Request, db:Session=Depends(get_db)):
 
 @dashboard_router.get("/dashboard", response_model=list[JobResponse])
 async def dashboard(request:Request, 
-    current_user: str = Depends(get_current_user),
-    db:Session=Depends(get_db)
+    current_user: str = Depends(get_current_user_async),
+    db:AsyncSession=Depends(get_async_db)
     ):
-    jobs = db.query(Job).order_by(Job.created_at.desc()).all()
-    applications_count = db.query(Applicant).filter(Applicant.applicant == current_user.id).count()
-    saved_count = db.query(SaveJob).filter(SaveJob.user_id == current_user.id).count()
-    shortlisted_count = db.query(Applicant).filter(
-        Applicant.applicant == current_user.id,
-        Applicant.status == "shortlisted"
-    ).count()
+    feeds = {}
+    for tab, source in JOB_FEED_SOURCES.items():
+        query = keyset_page(select(Job).filter(Job.source == source), Job.created_at, Job.id, None, JOB_FEED_PAGE_SIZE)
+        jobs, next_cursor = split_page((await db.scalars(query)).all(), JOB_FEED_PAGE_SIZE)
+        feeds[tab] = {"source": source, "jobs": jobs, "next_cursor": next_cursor}
+    source_counts = dict((await db.execute(
+        select(Job.source, func.count(Job.id)).group_by(Job.source)
+    )).all())
+    for feed in feeds.values():
+        feed["count"] = source_counts.get(feed["source"], 0)
+    applied_for = (await db.scalars(
+        select(Applicant.applied_for).filter(Applicant.applicant == current_user.id)
+    )).all()
+    saved = (await db.scalars(
+        select(SaveJob.job_id).filter(SaveJob.user_id == current_user.id)
+    )).all()
+    shortlisted_count = await db.scalar(
+        select(func.count(Applicant.id)).filter(
+            Applicant.applicant == current_user.id,
+            Applicant.status == "shortlisted"
+        )
+    )
     stats = {
-        "applications": applications_count,
-        "saved": saved_count,
+        "applications": len(applied_for),
+        "saved": len(saved),
         "shortlisted": shortlisted_count
     }
-    return templates.TemplateResponse("dashboard.html", {"request":request, "jobs":jobs, "current_user":current_user, "stats":stats})
+    return templates.TemplateResponse("dashboard.html", {
+        "request":request,
+        "feeds":feeds,
+        "current_user":current_user,
+        "stats":stats,
+        "applied_job_ids":set(applied_for),
+        "saved_job_ids":set(saved)
+    })
+
+
+@dashboard_router.get("/api/jobs/feed")
+async def job_feed(
+    request: Request,
+    source: str,
+    cursor: str | None = None,
+    limit: int = Query(JOB_FEED_PAGE_SIZE, ge=1, le=50),
+    current_user=Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    One page of the dashboard job feed for a source, newest first.
+    Pass the returned next_cursor back to get the following page.
+    """
+    try:
+        query = keyset_page(select(Job).filter(Job.source == source), Job.created_at, Job.id, cursor, limit)
+    except ValueError as e:
+        return JSONResponse({"message": str(e)}, status_code=400)
+    jobs, next_cursor = split_page((await db.scalars(query)).all(), limit)
+
+    job_ids = [job.id for job in jobs]
+    saved_ids = set((await db.scalars(
+        select(SaveJob.job_id).filter(SaveJob.user_id == current_user.id, SaveJob.job_id.in_(job_ids))
+    )).all())
+    applied_ids = set((await db.scalars(
+        select(Applicant.applied_for).filter(Applicant.applicant == current_user.id, Applicant.applied_for.in_(job_ids))
+    )).all())
+
+    return {
+        "jobs": [
+            {
+                "id": job.id,
+                "title": job.title,
+                "company": job.company,
+                "source": job.source,
+                "posted": job.created_at.strftime('%b %d, %Y'),
+                "saved": job.id in saved_ids,
+                "applied": job.id in applied_ids,
+                "detail_url": str(request.url_for("get_job_detail", job_id=job.id)),
+                "save_url": str(request.url_for("save_job", job_id=job.id)),
+                "apply_url": str(request.url_for("apply_job", job_id=job.id)),
+                "edit_url": str(request.url_for("get_edit_job", job_id=job.id)),
+                "delete_url": str(request.url_for("delete_job", job_id=job.id)),
+            }
+            for job in jobs
+        ],
+        "next_cursor": next_cursor,
+        "has_more": next_cursor is not None,
+    }
 
 
 @dashboard_router.get("/add-job")
@@ -68,12 +155,8 @@ async def add_job(
     current_user=Depends(get_current_user)
     ):
     if current_user.is_recruiter:
-        existing_job = db.query(Job).filter(
-            Job.title == job.title,
-            Job.company == job.company,
-            Job.location == job.location,
-            Job.posted_on == job.posted_on
-        ).first()
+        content_hash = job_content_hash(job.title, job.company, job.location, job.posted_on)
+        existing_job = db.query(Job.id).filter(Job.content_hash == content_hash).first()
 
         if existing_job:
             request.session["message"] = {"text": "Job already exists!", "type": "warning"}
@@ -96,11 +179,15 @@ async def add_job(
             posted_on = job.posted_on,
             source = job.source,
             skills = job.skills,
+            content_hash = content_hash,
+            job_summary = await summarize_job(job.description),
             user_id = current_user.id
             )
         if not new_job:
             return JSONResponse({"msg":"No data entered"})
         db.add(new_job)
+        db.flush()
+        index_job(db, new_job)
         db.commit()
         db.refresh(new_job)
         return new_job
@@ -108,6 +195,42 @@ async def add_job(
     return RedirectResponse(url="/dashboard", headers={"success":"Job Added Successfully"}, status_code=302)
 
 
+@dashboard_router.post("/api/jobs/bulk")
+async def bulk_add_jobs(
+    request: Request,
+    on_conflict: str = Query("skip", pattern="^(skip|update)$"),
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user)
+):
+    """
+    Ingest many jobs in one transaction. The body is a JSON array of JobCreate
+    records, or one record per line with Content-Type application/x-ndjson.
+    Existing jobs (same title/company/location/posted_on) are skipped, or
+    refreshed with ?on_conflict=update.
+    """
+    if not current_user.is_recruiter:
+        return JSONResponse({"message":"Only recruiter can add jobs"}, status_code=403)
+
+    body = await request.body()
+    try:
+        if "ndjson" in request.headers.get("content-type", ""):
+            records = [json.loads(line) for line in body.splitlines() if line.strip()]
+        else:
+            records = json.loads(body)
+    except ValueError as e:
+        return JSONResponse({"message": f"Invalid JSON: {e}"}, status_code=400)
+    if not isinstance(records, list):
+        return JSONResponse({"message":"Expected a JSON array of jobs"}, status_code=400)
+    if len(records) > MAX_BULK_JOBS:
+        return JSONResponse({"message": f"At most {MAX_BULK_JOBS} jobs per request"}, status_code=413)
+
+    results = ingest_jobs(db, records, current_user.id, on_conflict=on_conflict)
+    summary = {status: 0 for status in ("created", "updated", "skipped", "duplicate", "invalid")}
+    for result in results:
+        summary[result["status"]] += 1
+    return {"received": len(records), **summary, "results": results}
+
+
 @dashboard_router.get("/delete-job/{job_id}")
 async def delete_job(request:Request, job_id:int, db:Session=Depends(get_db), current_user=Depends(get_current_user)):
     if current_user.is_recruiter:
@@ -117,6 +240,7 @@ async def delete_job(request:Request, job_id:int, db:Session=Depends(get_db), cu
             return JSONResponse({"message":"Only the owner can delete this job"})
         if not delete_job:
             return JSONResponse({"message":"Can not delete the job"})
+        remove_job(db, delete_job.id)
         db.delete(delete_job)
         db.commit()
     request.session["message"] = {"text": "Job deleted successfully!", "type": "success"}
@@ -154,6 +278,8 @@ async def put_edit_job(
             return JSONResponse({"message":"Only the owner can edit this job"})
         if not db_job:
             return JSONResponse({"message":"Job not found"})
+        if job.description != db_job.description:
+            db_job.job_summary = await summarize_job(job.description)
         db_job.title=job.title 
         db_job.link=job.link 
         db_job.logo=job.logo 
@@ -168,6 +294,13 @@ async def put_edit_job(
         db_job.industry=job.industry
         db_job.source=job.source
         db_job.salary=job.salary
+        content_hash = job_content_hash(db_job.title, db_job.company, db_job.location, db_job.posted_on)
+        if db.query(Job.id).filter(Job.content_hash == content_hash, Job.id != db_job.id).first():
+            db.rollback()
+            return JSONResponse({"message":"Another job with the same title, company, location and posting date already exists"}, status_code=400)
+        db_job.content_hash = content_hash
+        index_job(db, db_job)
+        invalidate_job_analyses(db, db_job.id)
         db.commit()
         db.refresh(db_job)
         request.session["message"] = {"text": "Job updated successfully!", "type": "success"}
@@ -179,13 +312,13 @@ async def put_edit_job(
 async def apply_job(
     request:Request,
     job_id: int,
-    db: Session = Depends(get_db),
-    current_user=Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async)
 ):
-    db_job = db.query(Applicant).filter_by(applied_for=job_id, applicant=current_user.id).first()
+    db_job = await db.scalar(select(Applicant).filter_by(applied_for=job_id, applicant=current_user.id).limit(1))
     if db_job:
         return JSONResponse({"message":"You have already applied for job"})
-    job = db.query(Job).filter_by(id=job_id).first()
+    job = await db.get(Job, job_id)
     return templates.TemplateResponse("applyjob.html", {"request":request, "job":job, "current_user":current_user})
 
 
@@ -197,10 +330,10 @@ async def apply_job(
     number:str = Form(...),
     email:str = Form(...),
     resume: UploadFile = File(...),
-    db: Session = Depends(get_db),
-    current_user=Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async)
 ):
-    db_job = db.query(Applicant).filter_by(applied_for=job_id, applicant=current_user.id).first()
+    db_job = await db.scalar(select(Applicant).filter_by(applied_for=job_id, applicant=current_user.id).limit(1))
     if db_job:
         return JSONResponse({"message":"You have already applied for job"})
     if current_user.is_recruiter:
@@ -208,7 +341,12 @@ async def apply_job(
     file_url = None
     if resume:
         contents = await resume.read()
-        upload = cloudinary.uploader.upload(
+        try:
+            parsed = await parse_resume_pdf(contents)
+        except PdfLimitError as e:
+            return JSONResponse(status_code=400, content={"message": f"Resume rejected: {e}"})
+        upload = await asyncio.to_thread(
+            cloudinary.uploader.upload,
             contents,
             resource_type="raw",
             public_id=resume.filename,
@@ -216,6 +354,7 @@ async def apply_job(
             unique_filename=False 
         )
         file_url = upload.get("secure_url")
+        await save_resume_text(db, file_url, contents, parsed)
     applicant = Applicant(
         applicant = current_user.id,
         applied_for=job_id,
@@ -225,8 +364,12 @@ async def apply_job(
         number=number
     )
     db.add(applicant)
-    db.commit()
-    db.refresh(applicant)
+    try:
+        await db.commit()
+    except IntegrityError:
+        # A concurrent request (e.g. a double click) applied first; unique (applicant, applied_for)
+        await db.rollback()
+        return JSONResponse({"message":"You have already applied for job"})
     return RedirectResponse(url="/dashboard", headers={"success":"Job Applied Successfully"}, status_code=302)
 
 
@@ -238,18 +381,79 @@ async def get_applicants(
     status: str = None,
     interview: str = None,
     date: str = None,
-    db: Session = Depends(get_db),
-    current_user = Depends(get_current_user)
+    page: int = Query(1, ge=1),
+    page_size: int = Query(APPLICANTS_PAGE_SIZE, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db),
+    current_user = Depends(get_current_user_async)
 ):
     if current_user.is_recruiter:
-        jobs = db.query(Job.id).filter_by(user_id=current_user.id).subquery()
-        applicants = db.query(Applicant).filter(Applicant.applied_for.in_(jobs)).all()
-        
+        owned = (
+            select(Applicant)
+            .join(Job, Applicant.applied_for == Job.id)
+            .filter(Job.user_id == current_user.id)
+        )
+
+        # Facets are over all of the recruiter's applicants, not the filtered page
+        status_counts = dict((await db.execute(
+            owned.with_only_columns(Applicant.status, func.count(Applicant.id)).group_by(Applicant.status)
+        )).all())
+        positions = (await db.scalars(
+            owned.with_only_columns(Job.title).distinct().order_by(Job.title)
+        )).all()
+
+        filtered = owned
+        if search:
+            term = f"%{search}%"
+            filtered = filtered.outerjoin(User, Applicant.applicant == User.id).filter(or_(
+                User.name.ilike(term),
+                User.email.ilike(term),
+                Applicant.number.contains(search),
+                Job.title.ilike(term),
+                Job.company.ilike(term),
+            ))
+        if position:
+            filtered = filtered.filter(Job.title == position)
+        if status:
+            filtered = filtered.filter(Applicant.status == status)
+        if interview == "has_interview":
+            filtered = filtered.filter(Applicant.interview.has())
+        elif interview == "no_interview":
+            filtered = filtered.filter(~Applicant.interview.has())
+        elif interview == "passed":
+            filtered = filtered.filter(Applicant.interview.has(Interview.status == "pass"))
+        elif interview == "failed":
+            filtered = filtered.filter(Applicant.interview.has(Interview.status == "fail"))
+        if date:
+            try:
+                day = datetime.strptime(date, "%Y-%m-%d")
+                filtered = filtered.filter(Applicant.applied_time >= day, Applicant.applied_time < day + timedelta(days=1))
+            except ValueError:
+                date = None
+
+        filtered_count = await db.scalar(
+            filtered.with_only_columns(func.count(Applicant.id)).order_by(None)
+        )
+        pages = max((filtered_count + page_size - 1) // page_size, 1)
+        page = min(page, pages)
+        applicants = (await db.scalars(
+            filtered
+            .options(selectinload(Applicant.user), selectinload(Applicant.job), selectinload(Applicant.interview))
+            .order_by(Applicant.applied_time.desc(), Applicant.id.desc())
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+        )).all()
+
         # Pass query parameters to template
         return templates.TemplateResponse("getapplicants.html", {
             "current_user": current_user,
             "request": request,
             "applicants": applicants,
+            "status_counts": status_counts,
+            "positions": positions,
+            "total_count": sum(status_counts.values()),
+            "filtered_count": filtered_count,
+            "page": page,
+            "pages": pages,
             "search_query": search,
             "position_query": position,
             "status_query": status,
@@ -317,12 +521,14 @@ async def post_profile(
         if not user.current_password:
             return JSONResponse({"message": "Current password is required"})
 
-        if not verify_password(user.current_password, db_user.password):
+        valid, _ = await check_password(user.current_password, db_user.password)
+        if not valid:
             return JSONResponse({"message": "Current password is incorrect"})
 
-        db_user.password = get_password_hash(user.new_password)
+        db_user.password = await hash_password(user.new_password)
 
     db.commit()
+    invalidate_user(db_user.email)
     db.refresh(db_user)
     return {
         "success": "Profile updated successfully",
@@ -346,7 +552,12 @@ async def save_job(
 
     save_job = SaveJob(job_id=job_id, user_id=current_user.id)
     db.add(save_job)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # Saved by a concurrent request since the check above; unique (user_id, job_id)
+        db.rollback()
+        return JSONResponse({"message": "You already saved this job"})
     db.refresh(save_job)
     return RedirectResponse(url="/dashboard", headers={"success": "Job Saved Successfully"}, status_code=302)
 
@@ -516,27 +727,13 @@ async def get_search(
     request: Request,
     title: str = None,
     location: str = None,
-    current_user=Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user=Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     results = []
 
     if title or location:
-        query = db.query(Job)
-
-        if title and location:
-            query = query.filter(
-                and_(
-                    Job.title.ilike(f"%{title}%"),
-                    Job.location.ilike(f"%{location}%")
-                )
-            )
-        elif title:
-            query = query.filter(Job.title.ilike(f"%{title}%"))
-        elif location:
-            query = query.filter(Job.location.ilike(f"%{location}%"))
-
-        results = query.all()
+        results = await search_jobs(db, query=title, location=location)
 
     return templates.TemplateResponse(
         "search.html",
@@ -590,50 +787,32 @@ def scrape_linkedin(request:Request, job_title, location):
 
 
 async def extract_pdf_text(pdf_input):
-    text = ""
-
-    # If input is a URL
-    if isinstance(pdf_input, str) and (pdf_input.startswith("http://") or pdf_input.startswith("https://")):
-        try:
-            response = requests.get(pdf_input)
-            response.raise_for_status()
-            pdf_file = io.BytesIO(response.content)
-            reader = PdfReader(pdf_file)
-            for page in reader.pages:
-                text += page.extract_text() or ""
-            return text
-        except Exception as e:
-            raise ValueError(f"Error reading PDF from URL: {str(e)}")
+    """
+    Text of a resume that is not stored (UploadFile or bytes). Stored resumes are
+    read with database.resume_text.load_resume_text instead.
+    """
+    if hasattr(pdf_input, 'read') and hasattr(pdf_input, 'filename'):
+        await pdf_input.seek(0)
+        pdf_input = await pdf_input.read()
 
-    # If input is UploadFile (FastAPI) - ASYNC VERSION
-    try:
-        if hasattr(pdf_input, 'read') and hasattr(pdf_input, 'filename'):
-            # Reset to beginning and read
-            await pdf_input.seek(0)
-            pdf_bytes = await pdf_input.read()
-            pdf_file = io.BytesIO(pdf_bytes)
-            reader = PdfReader(pdf_file)
-            for page in reader.pages:
-                text += page.extract_text() or ""
-            return text
-    except Exception as e:
-        raise ValueError(f"Error reading UploadFile: {str(e)}")
-
-    # If input is already bytes
     if isinstance(pdf_input, (bytes, bytearray)):
-        pdf_file = io.BytesIO(pdf_input)
-        reader = PdfReader(pdf_file)
-        for page in reader.pages:
-            text += page.extract_text() or ""
+        text, page_count = await parse_resume_pdf(bytes(pdf_input))
+        if not page_count:
+            raise ValueError("Error reading UploadFile: not a readable PDF")
         return text
 
-    raise ValueError(f"Invalid input type: {type(pdf_input)}. Must be URL string, UploadFile, or bytes.")
+    raise ValueError(f"Invalid input type: {type(pdf_input)}. Must be UploadFile or bytes.")
 
 @dashboard_router.get("/applicant-reviewer/{applicant_id}")
-async def applicant_reviewer(applicant_id:int, request:Request, db:Session=Depends(get_db), current_user=Depends(get_current_user)):
-    applicant = db.query(Applicant).filter_by(id=applicant_id).first()
+async def applicant_reviewer(
+    applicant_id:int,
+    request:Request,
+    refresh: bool = Query(False),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async)
+):
+    applicant = await db.scalar(select(Applicant).filter_by(id=applicant_id).options(selectinload(Applicant.job)))
 
-    resume = await extract_pdf_text(applicant.resume)
     system_prompt = """
         {
             "role": "professional career advisor and recruitment analyst",
@@ -702,8 +881,15 @@ async def applicant_reviewer(applicant_id:int, request:Request, db:Session=Depen
             ]
         }
         """
-    result = await analyze_resume(applicant.job.requirements, applicant.job.description, applicant.job.responsibilities, applicant.job.skills, resume, system_prompt)
-    return templates.TemplateResponse("applicant_reviewer.html", {"request":request, "current_user":current_user, "result":result, "applicant":applicant})
+    result, cached = await cached_analyze_resume(
+        db,
+        applicant.job,
+        resume_url_key(applicant.resume),
+        lambda: load_resume_text(db, applicant.resume),
+        system_prompt,
+        refresh=refresh
+    )
+    return templates.TemplateResponse("applicant_reviewer.html", {"request":request, "current_user":current_user, "result":result, "applicant":applicant, "cached":cached})
 
 
 
@@ -723,29 +909,21 @@ async def job_search(
     title: str = "",
     location: str = "",
     source: str = "",
-    db: Session = Depends(get_db),
-    current_user=Depends(get_current_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async)
 ):
-    query = db.query(Job)
-    if title:
-        query = query.filter(Job.title.contains(title))
-    if location:
-        query = query.filter(Job.location.contains(location))
-    if source:
-        query = query.filter(Job.source == source)
-
-    results = query.all()
-    return results
+    return await search_jobs(db, query=title, location=location, source=source or None)
 
 
 @dashboard_router.post("/api/ai/assess")
 async def job_search(
     job_id: str = Form(None),
     resume: UploadFile = File(None),
-    db: Session = Depends(get_db),
-    current_user=Depends(get_current_user)
+    refresh: bool = Form(False),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user_async)
 ):
-    job = db.query(Job).filter(Job.id==int(job_id)).first()
+    job = await db.get(Job, int(job_id))
     if resume:
         resume_text = await extract_pdf_text(resume)
     system_prompt = """
@@ -836,7 +1014,12 @@ async def job_search(
                 ]
             }
         """
-    result = await analyze_resume(job.requirements, job.description, job.responsibilities, job.skills, resume_text, system_prompt)
+    async def _resume_text():
+        return resume_text
+
+    result, _ = await cached_analyze_resume(
+        db, job, resume_text_key(resume_text), _resume_text, system_prompt, refresh=refresh
+    )
     return result
 
 
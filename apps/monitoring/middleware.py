@@ -0,0 +1,53 @@
+import logging
+import time
+from collections import deque
+from fastapi import Request
+from config import Config
+from database.database import QueryStats, current_query_stats
+
+
+logger = logging.getLogger("db.queries")
+
+# Most recent requests that touched the database, newest last
+recent_requests: deque = deque(maxlen=Config.DB_QUERY_HISTORY)
+
+
+async def query_stats_middleware(request: Request, call_next):
+    """
+    Count the statements each request runs, report them as X-DB-* response headers
+    and log requests that run more than DB_QUERY_WARN_COUNT queries or any
+    statement slower than DB_SLOW_QUERY_MS.
+    """
+    stats = QueryStats()
+    token = current_query_stats.set(stats)
+    start = time.perf_counter()
+    try:
+        response = await call_next(request)
+    finally:
+        current_query_stats.reset(token)
+    elapsed_ms = round((time.perf_counter() - start) * 1000, 3)
+
+    if stats.count == 0:
+        return response
+
+    summary = stats.as_dict()
+    if Config.DB_QUERY_HEADERS:
+        response.headers["X-DB-Query-Count"] = str(summary["queries"])
+        response.headers["X-DB-Time-Ms"] = str(summary["db_time_ms"])
+
+    recent_requests.append({
+        "method": request.method,
+        "path": request.url.path,
+        "status": response.status_code,
+        "total_ms": elapsed_ms,
+        **summary,
+    })
+
+    slow = [query for query in summary["slowest"] if query["ms"] >= Config.DB_SLOW_QUERY_MS]
+    if summary["queries"] > Config.DB_QUERY_WARN_COUNT or slow:
+        logger.warning(
+            "%s %s ran %d queries in %.1f ms (request %.1f ms); slowest: %s",
+            request.method, request.url.path, summary["queries"], summary["db_time_ms"], elapsed_ms,
+            summary["slowest"][0]["statement"] if summary["slowest"] else "-",
+        )
+    return response
@@ -0,0 +1,52 @@
+from fastapi import APIRouter, Depends, Query
+from fastapi.exceptions import HTTPException
+from apps.auth.utils import get_current_user
+from config import Config
+from apps.monitoring.middleware import recent_requests
+from database.database import get_pool_stats
+from utils.cache import get_cache_stats
+
+
+
+def require_debug_access(current_user=Depends(get_current_user)):
+    """
+    The debug endpoints expose recent SQL, request paths and cache contents of all
+    users: hidden unless Config.DEBUG_ENDPOINTS is set, and then recruiters only.
+    """
+    if not Config.DEBUG_ENDPOINTS:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not current_user.is_recruiter:
+        raise HTTPException(status_code=403, detail="Only recruiters can access debug endpoints")
+    return current_user
+
+
+monitoring_router = APIRouter(dependencies=[Depends(require_debug_access)])
+
+
+@monitoring_router.get("/debug/db-pool")
+async def db_pool_stats():
+    """
+    Connection pool occupancy and checkout wait times for the sync and async engines.
+    """
+    return get_pool_stats()
+
+
+@monitoring_router.get("/debug/db-queries")
+async def db_query_stats(
+    min_queries: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500),
+):
+    """
+    Query count, DB time and slowest statements of recent requests, newest first.
+    Use min_queries to look for N+1 pages.
+    """
+    requests = [entry for entry in reversed(recent_requests) if entry["queries"] >= min_queries]
+    return requests[:limit]
+
+
+@monitoring_router.get("/debug/caches")
+async def cache_stats():
+    """
+    Size and hit/miss counters of the in-process caches.
+    """
+    return get_cache_stats()
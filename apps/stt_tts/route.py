@@ -1,25 +1,11 @@
-import os
 import base64
-from io import BytesIO
-from dotenv import load_dotenv
+from contextlib import aclosing
 from fastapi import APIRouter, HTTPException, File, UploadFile, Form
 from fastapi.responses import StreamingResponse
-from elevenlabs import ElevenLabs
-
-load_dotenv()
+from apps.stt_tts.service import voice_service, MIN_AUDIO_BYTES
 
 voice_router = APIRouter()
 
-ELEVEN_API_KEY = os.getenv("ELEVEN_LABS")
-if not ELEVEN_API_KEY:
-    raise RuntimeError("ELEVEN_LABS API key not found in environment variables")
-
-client = ElevenLabs(api_key=ELEVEN_API_KEY)
-
-
-VOICE_ID = os.getenv("VOICE_ID")
-TTS_MODEL = "eleven_flash_v2"
-STT_MODEL = "scribe_v1"
 
 @voice_router.post("/stt")
 async def stt_route(file: UploadFile = File(...)):
@@ -30,16 +16,11 @@ async def stt_route(file: UploadFile = File(...)):
         raise HTTPException(status_code=400, detail="File must be audio/video format")
     try:
         audio_bytes = await file.read()
-        if len(audio_bytes) < 1000:
+        if len(audio_bytes) < MIN_AUDIO_BYTES:
             raise HTTPException(status_code=400, detail="Audio too short")
-        audio_io = BytesIO(audio_bytes)
-        transcript = client.speech_to_text.convert(
-            file=audio_io,
-            model_id=STT_MODEL
-        )
         return {
             "success": True,
-            "text": transcript.text
+            "text": await voice_service.transcribe(audio_bytes)
         }
     except Exception as e:
         print(f"❌ STT Error: {e}")
@@ -55,16 +36,11 @@ async def stt_base64_route(audio_base64: str = Form(...)):
         if not audio_base64.strip():
             raise HTTPException(status_code=400, detail="Audio data required")
         audio_bytes = base64.b64decode(audio_base64)
-        if len(audio_bytes) < 1000:
+        if len(audio_bytes) < MIN_AUDIO_BYTES:
             raise HTTPException(status_code=400, detail="Audio too short")
-        audio_io = BytesIO(audio_bytes)
-        transcript = client.speech_to_text.convert(
-            file=audio_io,
-            model_id=STT_MODEL
-        )
         return {
             "success": True,
-            "text": transcript.text
+            "text": await voice_service.transcribe(audio_bytes)
         }
     except Exception as e:
         print(f"❌ STT-Base64 Error: {e}")
@@ -80,24 +56,7 @@ async def tts_route(text: str = Form(...)):
         raise HTTPException(status_code=400, detail="Text cannot be empty")
 
     try:
-        audio_data = client.text_to_speech.convert(
-            voice_id=VOICE_ID,
-            model_id=TTS_MODEL,
-            text=text,
-            voice_settings={
-                "stability": 0.35,
-                "similarity_boost": 0.8,
-                "style": 0.7,
-                "use_speaker_boost": True
-            }
-        )
-
-        if hasattr(audio_data, "__iter__") and not isinstance(audio_data, bytes):
-            audio_bytes = b"".join(audio_data)
-        else:
-            audio_bytes = audio_data
-
-        audio_b64 = base64.b64encode(audio_bytes).decode("utf-8")
+        audio_b64 = await voice_service.synthesize_base64(text)
         return {"success": True, "audio": audio_b64}
 
     except Exception as e:
@@ -109,19 +68,24 @@ async def tts_route(text: str = Form(...)):
 async def tts_stream_route(text: str = Form(...)):
     """
     Convert text → stream MP3 directly to the browser (for real-time playback).
+    Chunks are forwarded as ElevenLabs produces them; the upstream request is
+    closed if the browser disconnects.
     """
     if not text.strip():
         raise HTTPException(status_code=400, detail="Text cannot be empty")
 
     try:
-        audio_data = client.text_to_speech.convert(
-            voice_id=VOICE_ID,
-            model_id=TTS_MODEL,
-            text=text
-        )
-        audio_bytes = b"".join(audio_data) if hasattr(audio_data, "__iter__") and not isinstance(audio_data, bytes) else audio_data
-        return StreamingResponse(iter([audio_bytes]), media_type="audio/mpeg")
-
+        chunks = voice_service.stream(text, voice_settings=None)
+        # Wait for the first chunk here so provider errors still become a 500
+        first_chunk = await anext(chunks)
     except Exception as e:
         print(f"Stream Error: {e}")
         raise HTTPException(status_code=500, detail=f"TTS stream failed: {str(e)}")
+
+    async def body():
+        async with aclosing(chunks):
+            yield first_chunk
+            async for chunk in chunks:
+                yield chunk
+
+    return StreamingResponse(body(), media_type="audio/mpeg")
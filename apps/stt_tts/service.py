@@ -0,0 +1,122 @@
+"""
+ElevenLabs speech-to-text and text-to-speech, callable in-process.
+
+The HTTP routes in route.py and the interview websockets both go through
+`voice_service`, which owns one pooled async HTTP client for the ElevenLabs API
+and the synthesized audio cache.
+"""
+import os
+import base64
+from contextlib import aclosing
+from io import BytesIO
+from typing import AsyncIterator
+import httpx
+from dotenv import load_dotenv
+from elevenlabs import AsyncElevenLabs
+from config import Config
+from utils.audio_cache import AudioCache, audio_cache_key
+
+load_dotenv()
+
+ELEVEN_API_KEY = os.getenv("ELEVEN_LABS")
+if not ELEVEN_API_KEY:
+    raise RuntimeError("ELEVEN_LABS API key not found in environment variables")
+
+VOICE_ID = os.getenv("VOICE_ID")
+TTS_MODEL = "eleven_flash_v2"
+STT_MODEL = "scribe_v1"
+TTS_VOICE_SETTINGS = {
+    "stability": 0.35,
+    "similarity_boost": 0.8,
+    "style": 0.7,
+    "use_speaker_boost": True
+}
+# Recordings shorter than this are treated as silence
+MIN_AUDIO_BYTES = 1000
+
+
+class VoiceService:
+    """
+    One AsyncElevenLabs client over a shared, size-limited connection pool, so
+    every STT/TTS call reuses warm connections and never blocks the event loop.
+    """
+
+    def __init__(self, api_key: str, voice_id: str | None, max_connections: int, timeout: float):
+        self.voice_id = voice_id
+        self.http = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=timeout,
+        )
+        self.client = AsyncElevenLabs(api_key=api_key, httpx_client=self.http)
+        self.cache = AudioCache(
+            "tts_audio",
+            directory=Config.TTS_CACHE_DIR,
+            memory_items=Config.TTS_CACHE_MEMORY_ITEMS,
+            max_disk_bytes=Config.TTS_CACHE_DISK_BYTES,
+            ttl=Config.TTS_CACHE_TTL_SECONDS,
+        )
+
+    async def transcribe(self, audio_bytes: bytes) -> str:
+        """Recognized text of an audio clip; "" for clips under MIN_AUDIO_BYTES."""
+        if len(audio_bytes) < MIN_AUDIO_BYTES:
+            return ""
+        transcript = await self.client.speech_to_text.convert(file=BytesIO(audio_bytes), model_id=STT_MODEL)
+        return transcript.text
+
+    async def synthesize(self, text: str, voice_settings: dict | None = TTS_VOICE_SETTINGS) -> bytes:
+        """
+        MP3 bytes for `text`, from the TTS cache when the same text was already spoken
+        with this voice, model and settings; otherwise from ElevenLabs.
+        """
+        key = audio_cache_key(text, self.voice_id, TTS_MODEL, voice_settings)
+        audio_bytes = await self.cache.get(key)
+        if audio_bytes is not None:
+            return audio_bytes
+
+        options = {"voice_settings": voice_settings} if voice_settings else {}
+        audio_bytes = b"".join([
+            chunk async for chunk in self.client.text_to_speech.convert(
+                self.voice_id, text=text, model_id=TTS_MODEL, **options
+            )
+        ])
+        await self.cache.set(key, audio_bytes)
+        return audio_bytes
+
+    async def stream(self, text: str, voice_settings: dict | None = TTS_VOICE_SETTINGS) -> AsyncIterator[bytes]:
+        """
+        MP3 chunks of at most TTS_STREAM_CHUNK_BYTES as ElevenLabs produces them, or
+        the cached clip. A clip is cached once fully streamed if it is no larger than
+        TTS_STREAM_CACHE_MAX_BYTES. Closing this iterator early (client went away)
+        closes the upstream request.
+        """
+        key = audio_cache_key(text, self.voice_id, TTS_MODEL, voice_settings)
+        audio_bytes = await self.cache.get(key)
+        if audio_bytes is not None:
+            yield audio_bytes
+            return
+
+        options = {"voice_settings": voice_settings} if voice_settings else {}
+        upstream = self.client.text_to_speech.stream(
+            self.voice_id, text=text, model_id=TTS_MODEL,
+            request_options={"chunk_size": Config.TTS_STREAM_CHUNK_BYTES}, **options
+        )
+        parts, size = [], 0
+        async with aclosing(upstream):
+            async for chunk in upstream:
+                size += len(chunk)
+                if parts is not None and size <= Config.TTS_STREAM_CACHE_MAX_BYTES:
+                    parts.append(chunk)
+                else:
+                    parts = None
+                yield chunk
+        if parts:
+            await self.cache.set(key, b"".join(parts))
+
+    async def synthesize_base64(self, text: str, voice_settings: dict | None = TTS_VOICE_SETTINGS) -> str:
+        return base64.b64encode(await self.synthesize(text, voice_settings)).decode("utf-8")
+
+    async def aclose(self):
+        await self.http.aclose()
+
+
+voice_service = VoiceService(ELEVEN_API_KEY, VOICE_ID, Config.VOICE_MAX_CONNECTIONS, Config.VOICE_TIMEOUT_SECONDS)
@@ -0,0 +1,115 @@
+"""
+Speech-to-text while the candidate is still talking.
+
+A StreamingRecognizer is created per answer, fed audio chunks as the client
+produces them and reports partial transcripts through `on_partial`; finish()
+returns the final text. create_recognizer() picks the provider named by
+Config.STT_STREAMING_PROVIDER:
+
+- "elevenlabs": not incremental recognition. The client records the answer as
+  a series of fixed-length, self-contained clips and each clip goes through
+  batch STT once, as soon as it arrives.
+- "fake": local recognizer that treats chunks as UTF-8 text, for development
+  and tests without an API key.
+"""
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable
+from config import Config
+
+
+PartialCallback = Callable[[str], Awaitable[None]]
+
+
+class StreamingRecognizer(ABC):
+    """Recognition session for one answer."""
+
+    def __init__(self, on_partial: PartialCallback):
+        self.on_partial = on_partial
+
+    @abstractmethod
+    async def feed(self, chunk: bytes):
+        """Next chunk of the answer, in recording order."""
+
+    @abstractmethod
+    async def finish(self) -> str:
+        """Final transcript of everything fed so far."""
+
+    async def aclose(self):
+        pass
+
+
+class ClipRecognizer(StreamingRecognizer):
+    """
+    Batch STT on fixed-length clips, for APIs without incremental recognition.
+    MediaRecorder timeslice chunks are not decodable on their own, so the client
+    starts a new recording every STT_CLIP_MS (3 s) and sends each finished clip
+    as one chunk. Clips are transcribed concurrently, each exactly once: STT
+    traffic grows linearly with the answer, and when the candidate stops only the
+    last clip is still being transcribed. Partial and final transcripts are the
+    clip texts joined in recording order, so a word cut at a clip boundary may be
+    misheard.
+    """
+
+    def __init__(self, on_partial: PartialCallback, transcribe: Callable[[bytes], Awaitable[str]]):
+        super().__init__(on_partial)
+        self.transcribe = transcribe
+        self._texts: list[str | None] = []  # None while the clip is being transcribed
+        self._tasks: list[asyncio.Task] = []
+        self._reported = ""
+
+    async def feed(self, chunk: bytes):
+        if chunk:
+            self._texts.append(None)
+            self._tasks.append(asyncio.create_task(self._transcribe_clip(len(self._texts) - 1, chunk)))
+
+    async def _transcribe_clip(self, index: int, clip: bytes):
+        try:
+            self._texts[index] = (await self.transcribe(clip)).strip()
+        except Exception as e:
+            print(f"Partial STT error: {e}")
+            self._texts[index] = ""
+        # Report the clips transcribed so far, up to the first one still in flight
+        done = []
+        for text in self._texts:
+            if text is None:
+                break
+            done.append(text)
+        partial = " ".join(text for text in done if text)
+        if partial and partial != self._reported:
+            self._reported = partial
+            await self.on_partial(partial)
+
+    async def finish(self) -> str:
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        return " ".join(text for text in self._texts if text)
+
+    async def aclose(self):
+        for task in self._tasks:
+            task.cancel()
+
+
+class FakeRecognizer(StreamingRecognizer):
+    """Each chunk is UTF-8 text; the transcript is the text received so far."""
+
+    def __init__(self, on_partial: PartialCallback):
+        super().__init__(on_partial)
+        self._text = ""
+
+    async def feed(self, chunk: bytes):
+        if chunk:
+            self._text += chunk.decode("utf-8", errors="ignore")
+            await self.on_partial(self._text.strip())
+
+    async def finish(self) -> str:
+        return self._text.strip()
+
+
+def create_recognizer(on_partial: PartialCallback, provider: str | None = None) -> StreamingRecognizer:
+    provider = provider or Config.STT_STREAMING_PROVIDER
+    if provider == "fake":
+        return FakeRecognizer(on_partial)
+    if provider == "elevenlabs":
+        from apps.stt_tts.service import voice_service
+        return ClipRecognizer(on_partial, voice_service.transcribe)
+    raise ValueError(f"Unknown STT_STREAMING_PROVIDER {provider!r}")
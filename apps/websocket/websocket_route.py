@@ -1,41 +1,295 @@
-import httpx
 from fastapi import WebSocket, WebSocketDisconnect, APIRouter, Depends, Request
-from sqlalchemy.orm import Session
-from utils.ai_model import stream_ai_response, evaluate_interview_ai
-from utils.conversationMemory import ConversationMemory, summarize_text_local
-from database.models import Applicant, Interview, PublicInterview, PublicInterviewAttempt
-from database.database import sessionLocal, get_db
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from utils.ai_model import stream_ai_response, ai_client
+from utils.conversationMemory import ConversationMemory
+from database.models import Applicant, Interview, PublicInterview, PublicInterviewAttempt, InterviewTurn
+from database.database import asyncSessionLocal, get_async_db
 from datetime import datetime
-from apps.dashboard.dashboard import extract_pdf_text
+from database.resume_text import load_resume_text
+from database.summaries import load_job_summary, load_resume_summary
+from apps.stt_tts.service import voice_service
+from apps.stt_tts.streaming import create_recognizer
+from config import Config
+from apps.Interview.service import save_interview_evaluation
 import json
+import time
+import re
+import asyncio
+import base64
+import struct
+from contextlib import aclosing
 
 
 
 websocket_router = APIRouter()
 
-SAVE_INTERVIEW_URL = "http://localhost:8000/save-interview"
-STT_URL = "http://localhost:8000/stt"
+
+def elapsed_ms(start: float) -> int:
+    return int((time.perf_counter() - start) * 1000)
+
+
+async def stream_question(websocket: WebSocket, chunks, index: int, **extra) -> str:
+    """
+    Forward interviewer tokens to the client as question_delta messages while the
+    model is still generating. Returns the full text; the caller sends question_done.
+    """
+    text = ""
+    # Close the model stream (and free its AI concurrency slot) even if the client disconnects mid-question
+    async with aclosing(chunks):
+        async for chunk in chunks:
+            if chunk.startswith(("[ERROR]", "[DEBUG]")):
+                continue
+            text += chunk
+            await websocket.send_json({"type": "question_delta", "index": index, "delta": chunk, **extra})
+    return text
+
+
+# End of a sentence: terminal punctuation, optional closing quote/bracket, then whitespace
+SENTENCE_END_RE = re.compile(r"[.!?]+[\"')\]]*\s+")
+# Shorter sentences are merged with the next one rather than sent to TTS alone
+MIN_TTS_CHARS = 25
+FALLBACK_FIRST_QUESTION = "Can you tell me about yourself?"
+
+
+def split_sentences(buffer: str, min_chars: int = MIN_TTS_CHARS) -> tuple[list[str], str]:
+    """Split complete sentences off the front of streamed text. Returns (sentences, rest)."""
+    sentences, start = [], 0
+    for match in SENTENCE_END_RE.finditer(buffer):
+        if match.end() - start >= min_chars:
+            sentences.append(buffer[start:match.end()].strip())
+            start = match.end()
+    return sentences, buffer[start:]
+
+
+async def text_chunks(text: str):
+    yield text
+
+
+# Binary audio frames of the public interview socket (negotiated with ?audio=binary):
+# header (kind, flags, question index, segment seq) followed by the raw audio bytes.
+AUDIO_FRAME_HEADER = struct.Struct("!BBHH")
+FRAME_QUESTION_AUDIO = 1  # server -> client, MP3 of one question sentence
+FRAME_ANSWER_AUDIO = 2  # client -> server, WebM recording of an answer
+FRAME_ANSWER_CHUNK = 3  # client -> server, next self-contained clip of an answer being recorded (stt mode "stream")
+FLAG_END_INTERVIEW = 0x01
+FLAG_LAST_CHUNK = 0x02
+
+
+def pack_audio_frame(kind: int, index: int, seq: int, audio: bytes, flags: int = 0) -> bytes:
+    return AUDIO_FRAME_HEADER.pack(kind, flags, index, seq) + audio
+
+
+def unpack_audio_frame(frame: bytes) -> tuple[int, int, int, int, bytes]:
+    """(kind, flags, index, seq, audio) of a binary frame."""
+    kind, flags, index, seq = AUDIO_FRAME_HEADER.unpack_from(frame)
+    return kind, flags, index, seq, frame[AUDIO_FRAME_HEADER.size:]
+
+
+async def receive_answer(websocket: WebSocket) -> dict:
+    """
+    Next candidate message as a dict: JSON text frames as sent, binary answer frames
+    as {"audio": <bytes>, "end_interview": bool} and binary answer chunks as
+    {"audio_chunk": <bytes>, "final": bool, "end_interview": bool}.
+    """
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000))
+    if message.get("bytes") is not None:
+        kind, flags, _, _, audio = unpack_audio_frame(message["bytes"])
+        end_interview = bool(flags & FLAG_END_INTERVIEW)
+        if kind == FRAME_ANSWER_AUDIO:
+            return {"audio": audio, "end_interview": end_interview}
+        if kind == FRAME_ANSWER_CHUNK:
+            return {"audio_chunk": audio, "final": bool(flags & FLAG_LAST_CHUNK), "end_interview": end_interview}
+        raise ValueError(f"Unexpected audio frame kind {kind}")
+    return json.loads(message["text"])
+
+
+def answer_stt_mode(query_params) -> str:
+    """
+    "stream" if answers arrive as audio_chunk clips transcribed while the candidate
+    talks, else "batch". ?stt=stream|batch wins over Config.STT_TRANSCRIBE_CLIPS;
+    the client follows the mode echoed in the welcome message.
+    """
+    requested = query_params.get("stt")
+    if requested in ("stream", "batch"):
+        return requested
+    return "stream" if Config.STT_TRANSCRIBE_CLIPS else "batch"
+
+
+async def transcribe_answer_stream(websocket: WebSocket, data: dict) -> tuple[str, int, dict]:
+    """
+    Feed the audio_chunk messages of one answer, starting with `data`, to a streaming
+    recognizer until the final chunk, sending partial user_transcript updates on the
+    way. Returns (text, ms from the final chunk to the final text, final message).
+    """
+    async def send_partial(text):
+        await websocket.send_json({"type": "user_transcript", "text": text, "partial": True})
+
+    recognizer = create_recognizer(send_partial)
+    try:
+        while True:
+            chunk = data["audio_chunk"]
+            await recognizer.feed(base64.b64decode(chunk) if isinstance(chunk, str) else chunk)
+            if data.get("final"):
+                break
+            data = await receive_answer(websocket)
+            if "audio_chunk" not in data:
+                raise ValueError("Expected the next audio_chunk of the answer")
+
+        stt_start = time.perf_counter()
+        try:
+            text = (await recognizer.finish()).strip()
+        except Exception as e:
+            print(f"STT error: {e}")
+            text = ""
+        return text, elapsed_ms(stt_start), data
+    finally:
+        await recognizer.aclose()
+
+
+async def synthesize_speech(text: str) -> bytes | None:
+    """MP3 for one sentence, or None if TTS failed."""
+    try:
+        return await voice_service.synthesize(text)
+    except Exception as e:
+        print(f"TTS error: {e}")
+        return None
+
+
+async def transcribe_speech(audio: bytes | str) -> str:
+    """Candidate's recorded answer (raw bytes or base64) as text, or "" if STT failed."""
+    try:
+        audio_bytes = base64.b64decode(audio) if isinstance(audio, str) else audio
+        return (await voice_service.transcribe(audio_bytes)).strip()
+    except Exception as e:
+        print(f"STT error: {e}")
+        return ""
+
+
+async def stream_question_with_speech(
+    websocket: WebSocket, chunks, index: int, synthesize, binary_audio: bool = False
+) -> tuple[str, int, int]:
+    """
+    stream_question plus sentence-pipelined TTS: every completed sentence is sent to
+    TTS while the model keeps generating, and the audio goes out in sentence order
+    (seq 0, 1, ...), as binary frames or base64 question_audio messages.
+    Returns (text, audio segments sent, ms of TTS left after the model finished).
+    """
+    send_lock = asyncio.Lock()
+    pending_audio: asyncio.Queue = asyncio.Queue()
+
+    async def send(message):
+        async with send_lock:
+            if isinstance(message, bytes):
+                await websocket.send_bytes(message)
+            else:
+                await websocket.send_json(message)
+
+    async def send_audio_in_order():
+        segments = 0
+        while (task := await pending_audio.get()) is not None:
+            audio = await task
+            if audio:
+                if binary_audio:
+                    await send(pack_audio_frame(FRAME_QUESTION_AUDIO, index, segments, audio))
+                else:
+                    await send({
+                        "type": "question_audio", "index": index, "seq": segments,
+                        "audio": base64.b64encode(audio).decode("utf-8")
+                    })
+                segments += 1
+        return segments
+
+    def speak(sentence):
+        pending_audio.put_nowait(asyncio.create_task(synthesize(sentence)))
+
+    sender = asyncio.create_task(send_audio_in_order())
+    text = buffer = ""
+    try:
+        async with aclosing(chunks):
+            async for chunk in chunks:
+                if chunk.startswith(("[ERROR]", "[DEBUG]")):
+                    continue
+                text += chunk
+                buffer += chunk
+                await send({"type": "question_delta", "index": index, "delta": chunk})
+                sentences, buffer = split_sentences(buffer)
+                for sentence in sentences:
+                    speak(sentence)
+        if buffer.strip():
+            speak(buffer.strip())
+        generated_at = time.perf_counter()
+        pending_audio.put_nowait(None)
+        segments = await sender
+    except BaseException:
+        sender.cancel()
+        while not pending_audio.empty():
+            task = pending_audio.get_nowait()
+            if task is not None:
+                task.cancel()
+        raise
+    return text, segments, elapsed_ms(generated_at)
+
+
+async def append_turn(
+    db: AsyncSession,
+    seq: int,
+    role: str,
+    text: str,
+    interview_id: int | None = None,
+    attempt_id: int | None = None,
+    started_at: datetime | None = None,
+    **timings
+) -> int:
+    """
+    Append one transcript row and commit it (along with anything else pending
+    on the session). Returns the next sequence number.
+    """
+    now = datetime.utcnow()
+    db.add(InterviewTurn(
+        interview_id=interview_id,
+        attempt_id=attempt_id,
+        seq=seq,
+        role=role,
+        text=text,
+        started_at=started_at,
+        created_at=now,
+        latency_ms=int((now - started_at).total_seconds() * 1000) if started_at else None,
+        **timings
+    ))
+    await db.commit()
+    return seq + 1
 
 
 @websocket_router.websocket("/ws/chat/{applicant_id}")
 async def websocket_chat(websocket: WebSocket, applicant_id: int):
     await websocket.accept()
-    db: Session = sessionLocal()
+    db: AsyncSession = asyncSessionLocal()
     try:
-        applicant = db.query(Applicant).filter(Applicant.id == applicant_id).first()
+        applicant = await db.scalar(
+            select(Applicant).filter(Applicant.id == applicant_id).options(selectinload(Applicant.job))
+        )
         if not applicant:
             await websocket.send_json({"type": "error", "message": "Applicant not found"})
             return
 
-        interview = db.query(Interview).filter_by(applicant_id=applicant_id).first()
+        interview = await db.scalar(select(Interview).filter_by(applicant_id=applicant_id).limit(1))
         if not interview:
             interview = Interview(applicant_id=applicant_id, transcript=[], question_count=0)
             db.add(interview)
-            db.commit()
-            db.refresh(interview)
-        resume_text = extract_pdf_text(applicant.resume)
+            await db.commit()
+            await db.refresh(interview)
+        resume_text = await load_resume_text(db, applicant.resume)
         # Initialize memory and system prompt
-        memory = ConversationMemory(applicant.job.description, resume_text)
+        memory = ConversationMemory(
+            applicant.job.description, resume_text,
+            job_summary=await load_job_summary(db, applicant.job),
+            resume_summary=await load_resume_summary(db, applicant.resume),
+        )
         system_prompt = """
                 You are a professional AI interviewer conducting a voice-based technical screening. 
                 Your main objective is to assess the candidate's suitability for the job through a natural, human-like conversation.
@@ -95,11 +349,15 @@ async def websocket_chat(websocket: WebSocket, applicant_id: int):
             """
 
 
-        # Load any previous conversation
+        # Load any previous conversation (turn rows, or the snapshot for interviews that predate them)
+        turns = (await db.scalars(
+            select(InterviewTurn).filter_by(interview_id=interview.id).order_by(InterviewTurn.seq)
+        )).all()
         conversation_buffer = []
-        for msg in interview.transcript:
+        for msg in ([{"sender": t.role, "message": t.text} for t in turns] or interview.transcript or []):
             await memory.add_message(msg["sender"], msg["message"])
             conversation_buffer.append(msg)
+        seq = turns[-1].seq + 1 if turns else 0
 
         await websocket.send_json({
             "type": "welcome",
@@ -107,15 +365,15 @@ async def websocket_chat(websocket: WebSocket, applicant_id: int):
         })
         if interview.question_count == 0:
             prompt = "Begin the interview with a brief welcome and the first question."
-            ai_response = ""
+            started_at, llm_start = datetime.utcnow(), time.perf_counter()
 
-            async for chunk in stream_ai_response(prompt, system_prompt, memory):
-                if not chunk.startswith(("[ERROR]", "[DEBUG]")):
-                    ai_response += chunk
+            ai_response = await stream_question(
+                websocket, stream_ai_response(prompt, system_prompt, memory), 1, total_questions=10
+            )
 
             if ai_response.strip():
                 await websocket.send_json({
-                    "type": "question",
+                    "type": "question_done",
                     "question": ai_response.strip(),
                     "index": 1,
                     "total_questions": 10
@@ -123,46 +381,57 @@ async def websocket_chat(websocket: WebSocket, applicant_id: int):
                 await memory.add_message("AI", ai_response)
                 conversation_buffer.append({"sender": "AI", "message": ai_response})
                 interview.question_count = 1
-                db.commit()
+                seq = await append_turn(
+                    db, seq, "AI", ai_response, interview_id=interview.id,
+                    started_at=started_at, llm_ms=elapsed_ms(llm_start)
+                )
         while interview.question_count < 10:
             try:
                 data = await websocket.receive()
+                started_at = datetime.utcnow()
+                stt_ms = None
                 user_message = ""
                 if data.get("type") == "websocket.receive" and data.get("text"):
                     payload = json.loads(data["text"])
                     user_message = payload.get("answer", "").strip()
                 elif data.get("type") == "websocket.receive" and data.get("bytes"):
                     audio_data = data["bytes"]
-                    async with httpx.AsyncClient() as client:
-                        response = await client.post(STT_URL, files={"file": ("audio.webm", audio_data, "audio/webm")})
-                    if response.status_code == 200:
-                        user_message = response.json().get("text", "").strip()
+                    stt_start = time.perf_counter()
+                    user_message = await transcribe_speech(audio_data)
+                    stt_ms = elapsed_ms(stt_start)
 
                 if not user_message:
                     await websocket.send_json({"type": "ack", "message": "Please provide your answer"})
                     continue
                 await memory.add_message("User", user_message)
                 conversation_buffer.append({"sender": "User", "message": user_message})
+                seq = await append_turn(
+                    db, seq, "User", user_message, interview_id=interview.id,
+                    started_at=started_at, stt_ms=stt_ms
+                )
                 await websocket.send_json({"type": "ack", "message": "Answer received"})
 
-                ai_response = ""
-                async for chunk in stream_ai_response(user_message, system_prompt, memory):
-                    if not chunk.startswith(("[ERROR]", "[DEBUG]")):
-                        ai_response += chunk
+                started_at, llm_start = datetime.utcnow(), time.perf_counter()
+                ai_response = await stream_question(
+                    websocket, stream_ai_response(user_message, system_prompt, memory),
+                    interview.question_count + 1, total_questions=10
+                )
 
                 if ai_response.strip():
                     interview.question_count += 1
                     conversation_buffer.append({"sender": "AI", "message": ai_response})
                     await memory.add_message("AI", ai_response)
                     await websocket.send_json({
-                        "type": "question",
+                        "type": "question_done",
                         "question": ai_response.strip(),
                         "index": interview.question_count,
                         "total_questions": 10
                     })
 
-                    interview.transcript = conversation_buffer
-                    db.commit()
+                    seq = await append_turn(
+                        db, seq, "AI", ai_response, interview_id=interview.id,
+                        started_at=started_at, llm_ms=elapsed_ms(llm_start)
+                    )
 
             except WebSocketDisconnect:
                 break
@@ -173,19 +442,19 @@ async def websocket_chat(websocket: WebSocket, applicant_id: int):
         await memory.add_message("AI", completion_msg)
         conversation_buffer.append({"sender": "AI", "message": completion_msg})
 
-        interview.transcript = conversation_buffer
+        # The JSON column is only a snapshot of the finished interview
+        interview.transcript = list(conversation_buffer)
         interview.completed_at = datetime.utcnow()
-        db.commit()
+        seq = await append_turn(db, seq, "AI", completion_msg, interview_id=interview.id)
         await websocket.send_json({
             "type": "complete",
             "message": completion_msg,
             "summary": f"Completed {interview.question_count} questions"
         })
         try:
-            async with httpx.AsyncClient() as client:
-                await client.post(f"{SAVE_INTERVIEW_URL}/{applicant_id}", json={"transcript": conversation_buffer})
+            await save_interview_evaluation(db, applicant_id, conversation_buffer)
         except Exception as e:
-            print(f"Error saving interview externally: {e}")
+            print(f"Error evaluating interview: {e}")
         await websocket.close()
     except Exception as e:
         try:
@@ -193,13 +462,34 @@ async def websocket_chat(websocket: WebSocket, applicant_id: int):
         except:
             pass
     finally:
-        db.close()
+        await db.close()
 
 
 
+# Attempts with an open public interview socket in this process; a second window gets an error
+live_attempts: set[int] = set()
+ATTEMPT_IN_USE_MESSAGE = "This interview is already open in another window"
+
+
+async def replay_turns(turns: list[InterviewTurn], memory: ConversationMemory) -> list[dict]:
+    """
+    Transcript ([{"question", "answer"}, ...]) of an attempt's stored turns, also
+    replayed into `memory`, so a reconnect continues where the interview stopped.
+    """
+    transcript = []
+    for turn in turns:
+        if turn.role == "AI":
+            transcript.append({"question": turn.text})
+        elif transcript:
+            transcript[-1]["answer"] = turn.text
+        await memory.add_message(turn.role, turn.text)
+    return transcript
+
+
 @websocket_router.websocket("/ws/public-interview/{interview_id}")
-async def public_interview_ws(websocket: WebSocket, interview_id: int, db: Session = Depends(get_db)):
+async def public_interview_ws(websocket: WebSocket, interview_id: int, db: AsyncSession = Depends(get_async_db)):
     await websocket.accept()
+    registered_attempt = None
     try:
         attempt_id = websocket.query_params.get("attempt_id")
         if not attempt_id:
@@ -208,18 +498,30 @@ async def public_interview_ws(websocket: WebSocket, interview_id: int, db: Sessi
             return
 
         attempt_id = int(attempt_id)
+        binary_audio = websocket.query_params.get("audio") == "binary"
+        streaming_stt = answer_stt_mode(websocket.query_params) == "stream"
 
-        interview = db.query(PublicInterview).filter_by(id=interview_id).first()
-        attempt = db.query(PublicInterviewAttempt).filter_by(id=attempt_id, interview_id=interview_id).first()
+        interview = await db.get(PublicInterview, interview_id)
+        attempt = await db.scalar(select(PublicInterviewAttempt).filter_by(id=attempt_id, interview_id=interview_id).limit(1))
 
         if not interview or not attempt:
             await websocket.send_text(json.dumps({"type": "error", "message": "Interview or attempt not found"}))
             await websocket.close(code=4001)
             return
 
+        if attempt.id in live_attempts:
+            await websocket.send_json({"type": "error", "message": ATTEMPT_IN_USE_MESSAGE})
+            return
+        live_attempts.add(attempt.id)
+        registered_attempt = attempt.id
+
         job_description = getattr(interview, 'description', 'No description provided')
-        resume_text = await extract_pdf_text(getattr(attempt, 'resume', '')) or "No resume provided"
-        memory = ConversationMemory(job_desc=job_description, resume=resume_text)
+        resume_text = await load_resume_text(db, getattr(attempt, 'resume', '')) or "No resume provided"
+        memory = ConversationMemory(
+            job_desc=job_description, resume=resume_text,
+            job_summary=await load_job_summary(db, interview),
+            resume_summary=await load_resume_summary(db, getattr(attempt, 'resume', '')),
+        )
 
         system_prompt = f"""
             You are an experienced AI interviewer conducting a live, conversational interview for the position of **{interview.title}**.
@@ -279,83 +581,116 @@ async def public_interview_ws(websocket: WebSocket, interview_id: int, db: Sessi
             Respond with only the next interview question in plain text (no lists, JSON, or explanations).
             """
 
-        await websocket.send_json({
-            "type": "welcome",
-            "message": f"Starting AI-powered interview for {interview.title}."
-        })
-
-        question_text = ""
-        async for chunk in stream_ai_response(
-            user_message="Start the interview with your first question.",
-            system_prompt=system_prompt,
-            memory=memory
-        ):
-            question_text += chunk
-
-        question_text = question_text.strip() or "Can you tell me about yourself?"
-
-        async with httpx.AsyncClient(base_url="http://localhost:8000") as client:
-            tts_res = await client.post("/tts", data={"text": question_text})
-            tts_audio = tts_res.json().get("audio", None)
+        # A reconnect resumes the attempt from its stored turns
+        turns = (await db.scalars(
+            select(InterviewTurn).filter_by(attempt_id=attempt.id).order_by(InterviewTurn.seq)
+        )).all()
+        transcript = await replay_turns(turns, memory)
+        question_count = len(transcript)
+        seq = turns[-1].seq + 1 if turns else 0
+        max_questions = 10
 
         await websocket.send_json({
-            "type": "question",
-            "index": 1,
-            "text": question_text,
-            "audio": tts_audio
+            "type": "welcome",
+            "message": f"Starting AI-powered interview for {interview.title}.",
+            "audio_transport": "binary" if binary_audio else "base64",
+            "stt": "stream" if streaming_stt else "batch",
+            "resumed": bool(transcript)
         })
 
-        transcript = [{"question": question_text}]
-        question_count = 1
-        max_questions = 10
-
-        # Main Loop
-        async with httpx.AsyncClient(base_url="http://localhost:8000") as client:
-            while question_count < max_questions:
-                data = await websocket.receive_json()
-
-                if "audio" in data:
-                    audio_base64 = data["audio"]
-                    
-                    stt_res = await client.post("/stt-base64", data={"audio_base64": audio_base64})
-                    user_text = stt_res.json().get("text", "")
+        if not transcript:
+            started_at, llm_start = datetime.utcnow(), time.perf_counter()
+            question_text, audio_segments, tts_ms = await stream_question_with_speech(websocket, stream_ai_response(
+                user_message="Start the interview with your first question.",
+                system_prompt=system_prompt,
+                memory=memory
+            ), 1, synthesize_speech, binary_audio)
+            if not question_text.strip():
+                question_text, audio_segments, tts_ms = await stream_question_with_speech(
+                    websocket, text_chunks(FALLBACK_FIRST_QUESTION), 1, synthesize_speech, binary_audio
+                )
+            llm_ms = elapsed_ms(llm_start) - tts_ms
+            question_text = question_text.strip()
+
+            seq = await append_turn(
+                db, seq, "AI", question_text, attempt_id=attempt.id,
+                started_at=started_at, llm_ms=llm_ms, tts_ms=tts_ms
+            )
+            transcript = [{"question": question_text}]
+            question_count = 1
+        elif "answer" not in transcript[-1]:
+            # Disconnected while the candidate was answering: ask the same question again
+            question_text = transcript[-1]["question"]
+            _, audio_segments, _ = await stream_question_with_speech(
+                websocket, text_chunks(question_text), question_count, synthesize_speech, binary_audio
+            )
+
+        if "answer" not in transcript[-1]:
+            await websocket.send_json({
+                "type": "question_done",
+                "index": question_count,
+                "text": question_text,
+                "audio_segments": audio_segments
+            })
+
+        # Main Loop; a resumed attempt whose last answer is stored goes straight to the next question
+        answered = "answer" in transcript[-1]
+        user_text = transcript[-1].get("answer", "")
+        while question_count < max_questions:
+            if not answered:
+                data = await receive_answer(websocket)
+                started_at = datetime.utcnow()
+                stt_ms = None
+
+                if "audio_chunk" in data:
+                    user_text, stt_ms, data = await transcribe_answer_stream(websocket, data)
+                elif "audio" in data:
+                    stt_start = time.perf_counter()
+                    user_text = await transcribe_speech(data["audio"])
+                    stt_ms = elapsed_ms(stt_start)
                 else:
                     user_text = data.get("answer", "")
-  
+
                 await websocket.send_json({
                     "type": "user_transcript",
                     "text": user_text or "(No speech detected)"
                 })
                 transcript[-1]["answer"] = user_text
+                seq = await append_turn(
+                    db, seq, "User", user_text, attempt_id=attempt.id,
+                    started_at=started_at, stt_ms=stt_ms
+                )
 
                 if data.get("end_interview"):
                     break
+            answered = False
+
+            # Generate the next question, speaking each sentence as soon as it is complete
+            started_at, llm_start = datetime.utcnow(), time.perf_counter()
+            next_question, audio_segments, tts_ms = await stream_question_with_speech(websocket, stream_ai_response(
+                user_message=f"Candidate said: {user_text}\nContinue the interview with one next question.",
+                system_prompt=system_prompt,
+                memory=memory
+            ), question_count + 1, synthesize_speech, binary_audio)
+            llm_ms = elapsed_ms(llm_start) - tts_ms
+            next_question = next_question.strip()
+
+            if not next_question:
+                break
 
-                # Generate next question
-                next_question = ""
-                async for chunk in stream_ai_response(
-                    user_message=f"Candidate said: {user_text}\nContinue the interview with one next question.",
-                    system_prompt=system_prompt,
-                    memory=memory
-                ):
-                    next_question += chunk
-                next_question = next_question.strip()
-
-                if not next_question:
-                    break
-
-                # Convert next question to speech
-                tts_res = await client.post("/tts", data={"text": next_question})
-                next_audio = tts_res.json().get("audio", None)
+            seq = await append_turn(
+                db, seq, "AI", next_question, attempt_id=attempt.id,
+                started_at=started_at, llm_ms=llm_ms, tts_ms=tts_ms
+            )
 
-                question_count += 1
-                transcript.append({"question": next_question})
-                await websocket.send_json({
-                    "type": "question",
-                    "index": question_count,
-                    "text": next_question,
-                    "audio": next_audio
-                })
+            question_count += 1
+            transcript.append({"question": next_question})
+            await websocket.send_json({
+                "type": "question_done",
+                "index": question_count,
+                "text": next_question,
+                "audio_segments": audio_segments
+            })
 
         # Evaluation step
         await websocket.send_json({"type": "evaluation_start"})
@@ -368,8 +703,8 @@ async def public_interview_ws(websocket: WebSocket, interview_id: int, db: Sessi
         You are an expert technical interviewer evaluating a candidate's performance.
 
         JOB POSITION: {interview.title}
-        JOB DESCRIPTION: {summarize_text_local(job_description)}
-        CANDIDATE RESUME SUMMARY: {summarize_text_local(resume_text)}
+        JOB DESCRIPTION: {memory.job_summary}
+        CANDIDATE RESUME SUMMARY: {memory.resume_summary}
 
         INTERVIEW TRANSCRIPT:
         {formatted_transcript}
@@ -393,13 +728,7 @@ async def public_interview_ws(websocket: WebSocket, interview_id: int, db: Sessi
         - Be fair and objective in your assessment
         """
 
-        eval_text = ""
-        async for chunk in evaluate_interview_ai(
-            user_message=eval_prompt,
-            system_prompt="You are an expert interviewer. Output pure JSON only.",
-            memory=None
-        ):
-            eval_text += chunk
+        eval_text = await ai_client.generate(f"You are an expert interviewer. Output pure JSON only.\n\n{eval_prompt}")
 
         eval_text = eval_text.strip().replace("```json", "").replace("```", "")
         try:
@@ -410,7 +739,7 @@ async def public_interview_ws(websocket: WebSocket, interview_id: int, db: Sessi
         attempt.score = result.get("score", 0)
         attempt.feedback = result.get("feedback", "")
         attempt.transcript = transcript
-        db.commit()
+        await db.commit()
 
         await websocket.send_json({
             "type": "evaluation",
@@ -424,8 +753,13 @@ async def public_interview_ws(websocket: WebSocket, interview_id: int, db: Sessi
             "total_questions": question_count
         })
 
+    except IntegrityError:
+        # Another connection to this attempt (e.g. in another worker) wrote the same turn seq
+        await db.rollback()
+        await websocket.send_json({"type": "error", "message": ATTEMPT_IN_USE_MESSAGE})
     except Exception as e:
         await websocket.send_json({"type": "error", "message": str(e)})
     finally:
+        live_attempts.discard(registered_attempt)
         await websocket.close()
 
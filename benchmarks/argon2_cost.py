@@ -0,0 +1,110 @@
+"""
+Pick Argon2 cost parameters for this host.
+
+For each memory cost, finds the largest time cost whose median hash time stays
+under the target, then prints the settings to put in the environment
+(ARGON2_TIME_COST / ARGON2_MEMORY_COST / ARGON2_PARALLELISM). Also shows how
+long the event loop stays responsive while a burst of logins is hashed on the
+password pool.
+
+    python benchmarks/argon2_cost.py --target-ms 250
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+from passlib.hash import argon2
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+MEMORY_COSTS_KIB = (19456, 32768, 65536, 131072)
+MAX_TIME_COST = 10
+
+
+def median_hash_ms(time_cost, memory_cost, parallelism, samples):
+    handler = argon2.using(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        handler.hash("correct horse battery staple")
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def pick_costs(args):
+    best = None
+    print(f"{'memory KiB':>10} {'time cost':>9} {'median ms':>10}")
+    for memory_cost in MEMORY_COSTS_KIB:
+        chosen = None
+        for time_cost in range(1, MAX_TIME_COST + 1):
+            elapsed = median_hash_ms(time_cost, memory_cost, args.parallelism, args.samples)
+            if elapsed > args.target_ms:
+                break
+            chosen = (time_cost, elapsed)
+        if chosen:
+            print(f"{memory_cost:>10} {chosen[0]:>9} {chosen[1]:>10.1f}")
+            # Prefer more memory (harder to attack on GPUs) as long as t >= 2 fits the budget
+            if chosen[0] >= 2 or best is None:
+                best = (chosen[0], memory_cost, chosen[1])
+        else:
+            print(f"{memory_cost:>10} {'-':>9} {'> target':>10}")
+    return best
+
+
+async def loop_stall(burst):
+    """Max event loop lag while `burst` logins are verified through the password pool."""
+    from apps.auth.utils import check_password, pwd_context
+
+    stored = pwd_context.hash("correct horse battery staple")
+    lag = 0.0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal lag
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.005)
+            lag = max(lag, time.perf_counter() - start - 0.005)
+
+    tick = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(check_password("correct horse battery staple", stored) for _ in range(burst)),
+        return_exceptions=True,
+    )
+    elapsed = time.perf_counter() - start
+    done.set()
+    await tick
+    rejected = sum(1 for result in results if isinstance(result, Exception))
+    return elapsed, lag, rejected
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target-ms", type=float, default=250)
+    parser.add_argument("--parallelism", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument("--burst", type=int, default=20, help="concurrent logins for the event loop check")
+    args = parser.parse_args()
+
+    best = pick_costs(args)
+    if best:
+        time_cost, memory_cost, elapsed = best
+        print(f"\nSuggested (~{elapsed:.0f} ms per hash):")
+        print(f"ARGON2_TIME_COST={time_cost}")
+        print(f"ARGON2_MEMORY_COST={memory_cost}")
+        print(f"ARGON2_PARALLELISM={args.parallelism}")
+    else:
+        print(f"\nNo setting fits {args.target_ms} ms on this host")
+
+    elapsed, lag, rejected = asyncio.run(loop_stall(args.burst))
+    print(f"\n{args.burst} concurrent logins with the current settings: {elapsed * 1000:.0f} ms total, "
+          f"max event loop lag {lag * 1000:.1f} ms, {rejected} rejected with 503")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Per-job /add-job writes vs. one bulk ingest (database/ingest.py).
+
+Migrates a throwaway SQLite database to head, then stores the same batch of
+scraped-looking jobs twice: once the way /add-job does it (dedupe SELECT,
+insert, search index, commit per job) and once through ingest_jobs.
+
+    python benchmarks/bulk_job_ingest.py --jobs 3000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def migrate(db_path):
+    from alembic import command
+    from alembic.config import Config as AlembicConfig
+
+    cfg = AlembicConfig(os.path.join(ROOT, "alembic.ini"))
+    cfg.set_main_option("script_location", os.path.join(ROOT, "alembic"))
+    cfg.set_main_option("sqlalchemy.url", f"sqlite:///{db_path}")
+    command.upgrade(cfg, "head")
+
+
+def make_records(count, prefix):
+    return [
+        {
+            "title": f"{prefix} Engineer {i}",
+            "company": f"Company {i % 97}",
+            "location": "Lahore, Pakistan",
+            "description": "Build and run Python services. " * 20,
+            "skills": ["python", "fastapi", "sql"],
+            "posted_on": "2025-01-01",
+            "source": "linkedin",
+        }
+        for i in range(count)
+    ]
+
+
+def per_job(db, records, user_id):
+    from database.ingest import job_content_hash
+    from database.models import Job
+    from database.schema import JobCreate
+    from database.search import index_job
+
+    for record in records:
+        job = JobCreate.model_validate(record)
+        content_hash = job_content_hash(job.title, job.company, job.location, job.posted_on)
+        if db.query(Job.id).filter(Job.content_hash == content_hash).first():
+            continue
+        new_job = Job(**job.model_dump(), content_hash=content_hash, user_id=user_id)
+        db.add(new_job)
+        db.flush()
+        index_job(db, new_job)
+        db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=3000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        os.environ["DATABASE_URI"] = f"sqlite:///{db_path}"
+        migrate(db_path)
+
+        from database.database import sessionLocal
+        from database.ingest import ingest_jobs
+
+        db = sessionLocal()
+        start = time.perf_counter()
+        per_job(db, make_records(args.jobs, "Single"), 1)
+        single = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ingest_jobs(db, make_records(args.jobs, "Bulk"), 1)
+        bulk = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ingest_jobs(db, make_records(args.jobs, "Bulk"), 1)
+        rerun = time.perf_counter() - start
+        db.close()
+
+    print(f"per-job writes         {single:8.2f} s  ({args.jobs / single:8.0f} jobs/s)")
+    print(f"bulk ingest            {bulk:8.2f} s  ({args.jobs / bulk:8.0f} jobs/s)")
+    print(f"bulk re-ingest (dupes) {rerun:8.2f} s")
+    print(f"speedup                {single / bulk:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Startup cost of the local summarizer's NLTK setup.
+
+Each variant runs in a fresh interpreter, timed from inside the process after
+config and numpy are imported (the app loads both anyway):
+
+- legacy import: what importing utils/conversationMemory.py used to do, i.e.
+  import nltk and call nltk.download('punkt') and nltk.download('stopwords').
+  On a host without network access this waits on the connection attempts.
+- import: importing utils/conversationMemory.py now (nltk is not imported).
+- first summary: the first summarize_text_local call, which imports nltk and
+  checks NLTK_DATA_DIR. If the data is missing this is the time to the
+  NltkResourceError.
+
+    python benchmarks/nltk_startup.py --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+VARIANTS = {
+    "legacy import": """
+import nltk
+nltk.download('punkt', quiet=True)
+nltk.download('stopwords', quiet=True)
+""",
+    "import": """
+import utils.conversationMemory
+""",
+    "first summary": """
+from utils.conversationMemory import summarize_text_local
+result['summary'] = summarize_text_local('One sentence here. Two follow. Then three. And four. Five ends it.', 2)
+""",
+}
+
+# Loaded by the app before the summarizer either way; imported untimed
+HARNESS = """
+import json, sys, time
+import config, numpy
+result = {{}}
+start = time.perf_counter()
+{body}
+result['ms'] = (time.perf_counter() - start) * 1000
+result['nltk imported'] = 'nltk' in sys.modules
+print(json.dumps(result))
+"""
+
+
+def run_variant(body, timeout):
+    """Output of one fresh interpreter, or None if it timed out or failed."""
+    try:
+        completed = subprocess.run(
+            [sys.executable, "-c", HARNESS.format(body=body)],
+            cwd=ROOT, capture_output=True, text=True, timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return None
+    if completed.returncode:
+        print(completed.stderr.strip().splitlines()[-1], file=sys.stderr)
+        return None
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=120, help="seconds before a run counts as hung")
+    args = parser.parse_args()
+
+    print(f"{'variant':<14} {'median ms':>10} {'max ms':>9} {'nltk imported':>14}  summary")
+    for name, body in VARIANTS.items():
+        results = [run_variant(body, args.timeout) for _ in range(args.runs)]
+        done = [r for r in results if r is not None]
+        if not done:
+            print(f"{name:<14} {'timed out or failed':>35}")
+            continue
+        timings = [r["ms"] for r in done]
+        summary = done[0].get("summary", "")
+        print(f"{name:<14} {statistics.median(timings):>10.1f} {max(timings):>9.1f} "
+              f"{str(done[0]['nltk imported']):>14}  {summary[:60]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Before/after benchmark for the hot path indexes (alembic revision 158526935c21).
+
+Seeds a throwaway SQLite database at the previous revision, times the queries
+behind get_current_user, the dashboard counters, get-applicant, saved-job and
+public-interview-results, then upgrades to head and runs them again.
+
+    python benchmarks/query_plan_indexes.py --users 5000 --jobs 20000
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+BEFORE_REVISION = "69512801f1a1"
+AFTER_REVISION = "158526935c21"
+
+QUERIES = {
+    "get_current_user": ("SELECT * FROM users WHERE email = ? LIMIT 1", lambda a: (f"user{a.pick_user}@example.com",)),
+    "dashboard applications": ("SELECT count(*) FROM applicants WHERE applicant = ?", lambda a: (a.pick_user,)),
+    "dashboard shortlisted": ("SELECT count(*) FROM applicants WHERE applicant = ? AND status = 'shortlisted'", lambda a: (a.pick_user,)),
+    "dashboard saved": ("SELECT count(*) FROM savejob WHERE user_id = ?", lambda a: (a.pick_user,)),
+    "apply-job duplicate check": ("SELECT id FROM applicants WHERE applied_for = ? AND applicant = ? LIMIT 1", lambda a: (a.pick_job, a.pick_user)),
+    "created-jobs": ("SELECT * FROM job WHERE user_id = ?", lambda a: (1,)),
+    "get-applicant": ("SELECT * FROM applicants WHERE applied_for IN (SELECT id FROM job WHERE user_id = ?)", lambda a: (1,)),
+    "interview by applicant": ("SELECT * FROM interviews WHERE applicant_id = ? LIMIT 1", lambda a: (a.pick_applicant,)),
+    "saved-job": ("SELECT * FROM savejob WHERE user_id = ?", lambda a: (a.pick_user,)),
+    "public-interview-results": ("SELECT * FROM public_interview_attempts WHERE interview_id = ? ORDER BY attempted_at DESC", lambda a: (a.pick_interview,)),
+}
+
+
+def migrate(db_path, revision):
+    from alembic import command
+    from alembic.config import Config as AlembicConfig
+
+    cfg = AlembicConfig(os.path.join(ROOT, "alembic.ini"))
+    cfg.set_main_option("script_location", os.path.join(ROOT, "alembic"))
+    cfg.set_main_option("sqlalchemy.url", f"sqlite:///{db_path}")
+    command.upgrade(cfg, revision)
+
+
+def seed(conn, args):
+    rnd = random.Random(42)
+    statuses = ["pending", "reviewed", "shortlisted", "rejected"]
+    conn.executemany(
+        "INSERT INTO users (id, name, email, password, is_recruiter) VALUES (?, ?, ?, 'x', ?)",
+        ((i, f"User {i}", f"user{i}@example.com", i <= args.recruiters) for i in range(1, args.users + 1)),
+    )
+    conn.executemany(
+        "INSERT INTO job (id, title, company, location, source, created_at, user_id) VALUES (?, ?, 'Acme', 'Lahore', 'linkedin', '2025-01-01', ?)",
+        ((i, f"Job {i}", rnd.randint(1, args.recruiters)) for i in range(1, args.jobs + 1)),
+    )
+    pairs = set()
+    while len(pairs) < args.applications:
+        pairs.add((rnd.randint(args.recruiters + 1, args.users), rnd.randint(1, args.jobs)))
+    conn.executemany(
+        "INSERT INTO applicants (id, number, address, applicant, applied_for, resume, status) VALUES (?, '0300', 'addr', ?, ?, 'r.pdf', ?)",
+        ((i, u, j, rnd.choice(statuses)) for i, (u, j) in enumerate(pairs, 1)),
+    )
+    conn.executemany(
+        "INSERT INTO interviews (applicant_id, transcript, question_count) VALUES (?, '[]', 0)",
+        ((i,) for i in range(1, args.applications + 1, 3)),
+    )
+    saves = set()
+    while len(saves) < args.saves:
+        saves.add((rnd.randint(1, args.users), rnd.randint(1, args.jobs)))
+    conn.executemany("INSERT INTO savejob (user_id, job_id) VALUES (?, ?)", saves)
+    conn.executemany(
+        "INSERT INTO public_interviews (id, title, created_by) VALUES (?, ?, ?)",
+        ((i, f"Interview {i}", rnd.randint(1, args.recruiters)) for i in range(1, args.interviews + 1)),
+    )
+    conn.executemany(
+        "INSERT INTO public_interview_attempts (interview_id, user_id, resume, attempted_at) VALUES (?, ?, 'r.pdf', '2025-01-01')",
+        ((rnd.randint(1, args.interviews), rnd.randint(1, args.users)) for _ in range(args.attempts)),
+    )
+    conn.commit()
+
+
+def run_queries(conn, args, label):
+    print(f"\n=== {label} ===")
+    results = {}
+    for name, (sql, params) in QUERIES.items():
+        plan = " | ".join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params(args)))
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            conn.execute(sql, params(args)).fetchall()
+        elapsed = (time.perf_counter() - start) / args.repeat * 1000
+        results[name] = elapsed
+        print(f"{name:28s} {elapsed:9.3f} ms   {plan}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=5000)
+    parser.add_argument("--recruiters", type=int, default=50)
+    parser.add_argument("--jobs", type=int, default=20000)
+    parser.add_argument("--applications", type=int, default=50000)
+    parser.add_argument("--saves", type=int, default=30000)
+    parser.add_argument("--interviews", type=int, default=200)
+    parser.add_argument("--attempts", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    args.pick_user = args.users // 2
+    args.pick_job = args.jobs // 2
+    args.pick_applicant = args.applications // 2
+    args.pick_interview = args.interviews // 2
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        os.environ.setdefault("DATABASE_URI", f"sqlite:///{db_path}")
+
+        migrate(db_path, BEFORE_REVISION)
+        conn = sqlite3.connect(db_path)
+        seed(conn, args)
+        conn.execute("ANALYZE")
+        before = run_queries(conn, args, f"before ({BEFORE_REVISION})")
+        conn.close()
+
+        migrate(db_path, AFTER_REVISION)
+        conn = sqlite3.connect(db_path)
+        conn.execute("ANALYZE")
+        after = run_queries(conn, args, f"after ({AFTER_REVISION})")
+        conn.close()
+
+    print("\n=== speedup ===")
+    for name in QUERIES:
+        print(f"{name:28s} {before[name] / max(after[name], 1e-6):8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
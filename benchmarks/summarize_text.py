@@ -0,0 +1,142 @@
+"""
+summarize_text_local on 5-page resumes: the single-pass NumPy scorer vs. the
+previous implementation (two tokenizations of the text, per-call stopword set,
+dict scoring and heapq.nlargest), reproduced below as `legacy_summarize`.
+
+Resumes are generated from a fixed seed so runs are comparable. Every
+summary of the new implementation must equal the legacy one; the script exits
+non-zero on any mismatch. Needs the NLTK punkt and stopwords data.
+
+    python benchmarks/summarize_text.py --resumes 50 --pages 5
+"""
+import argparse
+import heapq
+import os
+import random
+import statistics
+import sys
+import textwrap
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Roughly one page of resume text per 450 words
+WORDS_PER_PAGE = 450
+SKILLS = (
+    "Python", "FastAPI", "PostgreSQL", "Docker", "Kubernetes", "React", "TypeScript", "AWS",
+    "Terraform", "Redis", "Kafka", "GraphQL", "pandas", "PyTorch", "CI/CD", "Linux",
+)
+VERBS = ("Designed", "Built", "Led", "Migrated", "Optimized", "Automated", "Maintained", "Shipped")
+OBJECTS = (
+    "a billing service", "the data pipeline", "an internal dashboard", "the search backend",
+    "customer onboarding flows", "a recommendation engine", "the deployment tooling", "API rate limiting",
+)
+OUTCOMES = (
+    "cutting latency by {n}%", "serving {n}k daily users", "reducing cloud costs by {n}%",
+    "with a team of {n} engineers", "raising test coverage to {n}%", "across {n} regions",
+)
+
+
+def legacy_summarize(text, sentence_count=3):
+    from nltk.corpus import stopwords
+    from nltk.tokenize import word_tokenize, sent_tokenize
+    from string import punctuation
+
+    try:
+        if not text.strip():
+            return "[Empty text]"
+
+        sentences = sent_tokenize(text)
+        if len(sentences) <= sentence_count:
+            return text
+
+        stop_words = set(stopwords.words("english") + list(punctuation))
+        words = [w for w in word_tokenize(text.lower()) if w.isalpha() and w not in stop_words]
+
+        freq_table = {}
+        for word in words:
+            freq_table[word] = freq_table.get(word, 0) + 1
+
+        if not freq_table:
+            return textwrap.shorten(text, width=400, placeholder="...")
+
+        max_freq = max(freq_table.values())
+        for word in freq_table:
+            freq_table[word] /= max_freq
+
+        sentence_scores = {}
+        for sent in sentences:
+            for word in word_tokenize(sent.lower()):
+                if word in freq_table:
+                    sentence_scores[sent] = sentence_scores.get(sent, 0) + freq_table[word]
+
+        summary_sentences = heapq.nlargest(sentence_count, sentence_scores, key=sentence_scores.get)
+        return " ".join(summary_sentences)
+
+    except Exception as e:
+        return f"[NLTK Summary Error] {str(e)}"
+
+
+def make_resume(rng, pages):
+    lines = [
+        "Jane Doe. Senior Software Engineer. jane.doe@example.com.",
+        f"Summary. Engineer with {rng.randint(3, 15)} years of experience in "
+        f"{', '.join(rng.sample(SKILLS, 4))}.",
+    ]
+    words = 0
+    while words < pages * WORDS_PER_PAGE:
+        if rng.random() < 0.1:
+            line = f"Experience at Company {rng.randint(1, 99)}, {rng.randint(2010, 2025)} to present."
+        else:
+            line = (f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} using {rng.choice(SKILLS)} and "
+                    f"{rng.choice(SKILLS)}, {rng.choice(OUTCOMES).format(n=rng.randint(2, 90))}.")
+        lines.append(line)
+        words += len(line.split())
+    lines.append(f"Skills. {', '.join(SKILLS)}.")
+    return "\n".join(lines)
+
+
+def time_summaries(summarize, resumes, sentence_count, runs):
+    """(median ms per resume, summaries of the last run)."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        summaries = [summarize(text, sentence_count=sentence_count) for text in resumes]
+        timings.append((time.perf_counter() - start) * 1000 / len(resumes))
+    return statistics.median(timings), summaries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=50)
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--sentences", type=int, default=4, help="sentence_count, as ConversationMemory uses")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    from utils.conversationMemory import summarize_text_local
+
+    rng = random.Random(args.seed)
+    resumes = [make_resume(rng, args.pages) for _ in range(args.resumes)]
+    print(f"{args.resumes} resumes, {statistics.mean(len(r) for r in resumes):.0f} characters on average\n")
+
+    legacy_ms, expected = time_summaries(legacy_summarize, resumes, args.sentences, args.runs)
+    current_ms, actual = time_summaries(summarize_text_local, resumes, args.sentences, args.runs)
+    print(f"{'implementation':<16} {'ms per resume':>14}")
+    print(f"{'legacy':<16} {legacy_ms:>14.2f}")
+    print(f"{'single pass':<16} {current_ms:>14.2f}")
+    print(f"\nspeedup: {legacy_ms / current_ms:.2f}x")
+
+    errors = [s for s in expected + actual if s.startswith("[NLTK Summary Error]")]
+    if errors:
+        sys.exit(f"summarizer failed (is the NLTK data installed?): {errors[0]}")
+    mismatches = sum(a != b for a, b in zip(expected, actual))
+    print(f"identical summaries: {len(resumes) - mismatches} of {len(resumes)}")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Time to first byte of /tts-stream: forwarding provider chunks vs. joining the clip first.
+
+Drives the ASGI app directly against a simulated ElevenLabs stream (a delay
+before the first chunk, then one chunk every --chunk-ms) and measures when the
+first and last body bytes leave the app. The "joined" variant reproduces the
+old route, which collected the whole clip before responding. Also checks that
+a client disconnect after the first chunk stops the upstream stream.
+
+    python benchmarks/tts_first_byte.py --chunks 40 --chunk-ms 25
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("ELEVEN_LABS", "benchmark")
+# Measure synthesis, not the audio cache
+os.environ["TTS_CACHE_MEMORY_ITEMS"] = "0"
+os.environ["TTS_CACHE_DIR"] = ""
+
+
+class SimulatedTextToSpeech:
+    def __init__(self, args):
+        self.args = args
+        self.chunks_sent = 0
+
+    async def stream(self, voice_id, text, model_id, request_options=None, **kwargs):
+        await asyncio.sleep(self.args.first_chunk_ms / 1000)
+        for i in range(self.args.chunks):
+            if i:
+                await asyncio.sleep(self.args.chunk_ms / 1000)
+            self.chunks_sent += 1
+            yield b"\xff" * self.args.chunk_bytes
+
+    convert = stream
+
+
+class SimulatedClient:
+    def __init__(self, args):
+        self.text_to_speech = SimulatedTextToSpeech(args)
+
+
+def build_app():
+    from fastapi import FastAPI, Form
+    from fastapi.responses import StreamingResponse
+    from apps.stt_tts.route import voice_router
+    from apps.stt_tts.service import voice_service
+
+    app = FastAPI()
+    app.include_router(voice_router)
+
+    @app.post("/tts-stream-joined")
+    async def joined(text: str = Form(...)):
+        audio_bytes = await voice_service.synthesize(text, voice_settings=None)
+        return StreamingResponse(iter([audio_bytes]), media_type="audio/mpeg")
+
+    return app
+
+
+async def request(app, path, disconnect_after_first=False):
+    """(first byte s, last byte s, body bytes) of one POST through the ASGI app."""
+    body = b"text=Tell+me+about+a+project+you+are+proud+of."
+    scope = {
+        "type": "http", "asgi": {"version": "3.0", "spec_version": "2.3"}, "http_version": "1.1",
+        "method": "POST", "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"",
+        "root_path": "", "server": ("bench", 80), "client": ("bench", 1),
+        "headers": [(b"content-type", b"application/x-www-form-urlencoded"), (b"content-length", str(len(body)).encode())],
+    }
+    sent_body = False
+    disconnected = asyncio.Event()
+    start = time.perf_counter()
+    first = last = None
+    size = 0
+
+    async def receive():
+        nonlocal sent_body
+        if not sent_body:
+            sent_body = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal first, last, size
+        if message["type"] == "http.response.body" and message.get("body"):
+            now = time.perf_counter() - start
+            first = first if first is not None else now
+            last = now
+            size += len(message["body"])
+            if disconnect_after_first:
+                disconnected.set()
+
+    await app(scope, receive, send)
+    return first, last, size
+
+
+async def run(args):
+    from apps.stt_tts.service import voice_service
+
+    client = SimulatedClient(args)
+    voice_service.client = client
+    app = build_app()
+
+    print(f"{'route':<20} {'first byte ms':>14} {'last byte ms':>13} {'bytes':>9}")
+    for path in ("/tts-stream-joined", "/tts-stream"):
+        results = [await request(app, path) for _ in range(args.runs)]
+        print(f"{path:<20} {statistics.median(r[0] for r in results) * 1000:>14.1f} "
+              f"{statistics.median(r[1] for r in results) * 1000:>13.1f} {results[0][2]:>9}")
+
+    client.text_to_speech.chunks_sent = 0
+    await request(app, "/tts-stream", disconnect_after_first=True)
+    await asyncio.sleep((args.chunk_ms * 5) / 1000)
+    print(f"\nclient disconnect after the first chunk: upstream produced "
+          f"{client.text_to_speech.chunks_sent} of {args.chunks} chunks")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, default=40)
+    parser.add_argument("--chunk-bytes", type=int, default=4096)
+    parser.add_argument("--first-chunk-ms", type=float, default=150)
+    parser.add_argument("--chunk-ms", type=float, default=25)
+    parser.add_argument("--runs", type=int, default=5)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
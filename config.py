@@ -12,6 +12,83 @@ SECRET_KEY = os.getenv("SECRET_KEY")
 class Config:
     SECRET_KEY = os.getenv("SECRET_KEY") 
     SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URI")
+    SQLALCHEMY_ASYNC_DATABASE_URI = os.getenv("ASYNC_DATABASE_URI")
+
+    # Connection pool
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 5))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 10))
+    DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", 30))
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+    DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+
+    # SQLite tuning (applied on every new connection)
+    SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", 5000))
+    SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", 20000))
+
+    # Postgres tuning (0 disables the statement timeout)
+    PG_STATEMENT_TIMEOUT_MS = int(os.getenv("PG_STATEMENT_TIMEOUT_MS", 0))
+
+    # /debug/* endpoints (apps/monitoring/route.py): off unless enabled, and recruiters only
+    DEBUG_ENDPOINTS = os.getenv("DEBUG_ENDPOINTS", "false").lower() == "true"
+
+    # Per-request query instrumentation (see apps/monitoring/middleware.py)
+    DB_QUERY_HEADERS = os.getenv("DB_QUERY_HEADERS", "true").lower() == "true"
+    DB_QUERY_WARN_COUNT = int(os.getenv("DB_QUERY_WARN_COUNT", 20))
+    DB_SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", 200))
+    DB_QUERY_HISTORY = int(os.getenv("DB_QUERY_HISTORY", 200))
+
+    # get_current_user cache (0 disables it)
+    USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", 1024))
+    USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", 60))
+
+    # Password hashing (benchmarks/argon2_cost.py suggests cost values for this host)
+    PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", 2))
+    PASSWORD_HASH_MAX_QUEUE = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", 32))
+    ARGON2_TIME_COST = int(os.getenv("ARGON2_TIME_COST", 0))
+    ARGON2_MEMORY_COST = int(os.getenv("ARGON2_MEMORY_COST", 0))
+    ARGON2_PARALLELISM = int(os.getenv("ARGON2_PARALLELISM", 0))
+
+    # Gemini client (utils/ai_model.py)
+    AI_MODEL = os.getenv("AI_MODEL", "gemini-2.0-flash")
+    AI_MAX_CONCURRENCY = int(os.getenv("AI_MAX_CONCURRENCY", 8))
+    AI_TIMEOUT_SECONDS = float(os.getenv("AI_TIMEOUT_SECONDS", 60))
+
+    # In-process LRU in front of the resume_analyses table
+    ANALYSIS_CACHE_SIZE = int(os.getenv("ANALYSIS_CACHE_SIZE", 256))
+    ANALYSIS_CACHE_TTL_SECONDS = float(os.getenv("ANALYSIS_CACHE_TTL_SECONDS", 3600))
+
+    # ElevenLabs client pool (apps/stt_tts/service.py)
+    VOICE_MAX_CONNECTIONS = int(os.getenv("VOICE_MAX_CONNECTIONS", 20))
+    VOICE_TIMEOUT_SECONDS = float(os.getenv("VOICE_TIMEOUT_SECONDS", 60))
+
+    # Answer transcription while the candidate talks (apps/stt_tts/streaming.py).
+    # STT_TRANSCRIBE_CLIPS makes it the default for public interviews (?stt=batch|stream overrides);
+    # provider: "elevenlabs" or "fake"
+    STT_TRANSCRIBE_CLIPS = os.getenv("STT_TRANSCRIBE_CLIPS", "false").lower() == "true"
+    STT_STREAMING_PROVIDER = os.getenv("STT_STREAMING_PROVIDER", "elevenlabs")
+
+    # PDF parsing on a process pool (utils/pdf_extract.py)
+    PDF_WORKERS = int(os.getenv("PDF_WORKERS", 2))
+    PDF_MAX_BYTES = int(os.getenv("PDF_MAX_BYTES", 10 * 1024 * 1024))
+    PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", 50))
+    PDF_TEXT_PAGES = int(os.getenv("PDF_TEXT_PAGES", 10))
+    PDF_TIMEOUT_SECONDS = float(os.getenv("PDF_TIMEOUT_SECONDS", 10))
+    PDF_WORKER_MEMORY_MB = int(os.getenv("PDF_WORKER_MEMORY_MB", 1024))
+
+    # NLTK data for the local summarizer; seeded with `python -m utils.nltk_resources`, never downloaded at runtime
+    NLTK_DATA_DIR = os.getenv("NLTK_DATA_DIR", "nltk_data")
+
+    # Synthesized speech cache (utils/audio_cache.py); an empty dir or 0 bytes keeps it in memory only
+    TTS_CACHE_DIR = os.getenv("TTS_CACHE_DIR", ".cache/tts")
+    TTS_CACHE_DISK_BYTES = int(os.getenv("TTS_CACHE_DISK_BYTES", 512 * 1024 * 1024))
+    TTS_CACHE_MEMORY_ITEMS = int(os.getenv("TTS_CACHE_MEMORY_ITEMS", 256))
+    TTS_CACHE_TTL_SECONDS = float(os.getenv("TTS_CACHE_TTL_SECONDS", 86400))
+
+    # /tts-stream: size of forwarded chunks, and largest streamed clip that is also cached
+    TTS_STREAM_CHUNK_BYTES = int(os.getenv("TTS_STREAM_CHUNK_BYTES", 4096))
+    TTS_STREAM_CACHE_MAX_BYTES = int(os.getenv("TTS_STREAM_CACHE_MAX_BYTES", 2 * 1024 * 1024))
 
 cloudinary.config( 
     cloud_name = os.getenv("CLOUDINARY_CLOUD_NAME"), 
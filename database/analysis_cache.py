@@ -0,0 +1,92 @@
+"""
+Cache for analyze_resume results.
+
+Results are stored in resume_analyses under a key hashing the job fields sent to
+the model, the resume and the system prompt text (so editing a prompt is a new
+version). An in-process LRU sits in front of the table. A stored resume is
+identified by its upload URL, which never changes for a given file, so cache hits
+for applicants skip the download; uploaded files are identified by their text.
+"""
+import hashlib
+import json
+from typing import Awaitable, Callable
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects import postgresql, sqlite
+from config import Config
+from database.models import Job, ResumeAnalysis
+from utils.ai_model import analyze_resume
+from utils.cache import TTLCache
+
+
+analysis_cache = TTLCache("resume_analysis", maxsize=Config.ANALYSIS_CACHE_SIZE, ttl=Config.ANALYSIS_CACHE_TTL_SECONDS)
+
+
+def _sha256(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def resume_text_key(resume_text: str) -> str:
+    return f"sha256:{_sha256(resume_text)}"
+
+
+def resume_url_key(resume_url: str) -> str:
+    return f"url:{resume_url}"
+
+
+def analysis_cache_key(job: Job, resume_key: str, system_prompt: str) -> str:
+    job_fields = json.dumps(
+        [job.title, job.requirements, job.description, job.responsibilities, job.skills],
+        sort_keys=True, default=str,
+    )
+    return _sha256("\x1f".join((_sha256(job_fields), resume_key, _sha256(system_prompt))))
+
+
+async def _store(db: AsyncSession, cache_key: str, job_id: int, result: dict):
+    insert = (postgresql if db.bind.dialect.name == "postgresql" else sqlite).insert(ResumeAnalysis)
+    stmt = insert.values(cache_key=cache_key, job_id=job_id, result=result)
+    await db.execute(stmt.on_conflict_do_update(
+        index_elements=[ResumeAnalysis.cache_key],
+        set_={"result": stmt.excluded.result, "created_at": stmt.excluded.created_at},
+    ))
+    await db.commit()
+
+
+async def cached_analyze_resume(
+    db: AsyncSession,
+    job: Job,
+    resume_key: str,
+    load_resume_text: Callable[[], Awaitable[str]],
+    system_prompt: str,
+    refresh: bool = False,
+) -> tuple[dict, bool]:
+    """
+    analyze_resume for `job` through the cache. `load_resume_text` is only awaited
+    on a miss. Returns (result, from_cache); refresh=True always asks the model.
+    Errors and unparseable answers are returned but not cached.
+    """
+    cache_key = analysis_cache_key(job, resume_key, system_prompt)
+    if not refresh:
+        result = analysis_cache.get(cache_key)
+        if result is None:
+            row = (await db.execute(select(ResumeAnalysis.result).filter_by(cache_key=cache_key))).first()
+            if row:
+                result = row.result
+                analysis_cache.set(cache_key, result)
+        if result is not None:
+            return result, True
+
+    resume_text = await load_resume_text()
+    result = await analyze_resume(job.requirements, job.description, job.responsibilities, job.skills, resume_text, system_prompt)
+    if "error" not in result and "raw_response" not in result:
+        await _store(db, cache_key, job.id, result)
+        analysis_cache.set(cache_key, result)
+    return result, False
+
+
+def invalidate_job_analyses(db: Session, job_id: int):
+    """Drop stored analyses of an edited job. Runs inside the caller's transaction."""
+    db.query(ResumeAnalysis).filter_by(job_id=job_id).delete(synchronize_session=False)
+    # In-memory entries need no eviction: the key hashes the job fields, so the
+    # edited job gets new keys and the old entries age out of the LRU
@@ -1,12 +1,205 @@
-from sqlalchemy.engine import create_engine
-from sqlalchemy.orm import sessionmaker
+import time
+import threading
+from contextvars import ContextVar
+from sqlalchemy import event, exc
+from sqlalchemy.engine import create_engine, make_url
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from config import Config
 
 
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+}
+
+
+def get_async_database_url(url):
+    """
+    Map a sync database URL onto its async driver (aiosqlite / asyncpg).
+    URLs that already name a driver are returned unchanged.
+    """
+    db_url = make_url(url)
+    if db_url.drivername in ASYNC_DRIVERS:
+        db_url = db_url.set(drivername=ASYNC_DRIVERS[db_url.drivername])
+    return db_url.render_as_string(hide_password=False)
+
+
+class PoolStats:
+    """Checkout counters and wait times for one connection pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record_wait(self, seconds: float, timed_out: bool = False):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait / attempts * 1000, 3) if attempts else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+            }
+
+
+class TimedPoolMixin:
+    """Times every checkout so the pool can be sized from real wait numbers."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        self.stats.record_wait(time.perf_counter() - start)
+        return connection
+
+
+class TimedQueuePool(TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedAsyncQueuePool(TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+class QueryStats:
+    """Statements run on behalf of one request: count, total time and the slowest few."""
+
+    def __init__(self, keep_slowest: int = 5):
+        self._lock = threading.Lock()
+        self.keep_slowest = keep_slowest
+        self.count = 0
+        self.total_time = 0.0
+        self.slowest: list[tuple[float, str]] = []
+
+    def record(self, seconds: float, statement: str):
+        with self._lock:
+            self.count += 1
+            self.total_time += seconds
+            if len(self.slowest) < self.keep_slowest or seconds > self.slowest[-1][0]:
+                self.slowest.append((seconds, statement))
+                self.slowest.sort(key=lambda item: item[0], reverse=True)
+                del self.slowest[self.keep_slowest:]
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                "queries": self.count,
+                "db_time_ms": round(self.total_time * 1000, 3),
+                "slowest": [
+                    {"ms": round(seconds * 1000, 3), "statement": statement}
+                    for seconds, statement in self.slowest
+                ],
+            }
+
+
+# Set per request by the query stats middleware. Worker threads (sync routes,
+# asyncio.to_thread) and async engine greenlets inherit it from the request task.
+current_query_stats: ContextVar[QueryStats | None] = ContextVar("current_query_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.record(elapsed, " ".join(statement.split())[:500])
+
+
+def _handle_error(exception_context):
+    # Failed statements never reach after_cursor_execute
+    starts = exception_context.connection.info.get("query_start") if exception_context.connection else None
+    if starts:
+        starts.pop()
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode={Config.SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous={Config.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA busy_timeout={Config.SQLITE_BUSY_TIMEOUT_MS}")
+    # Negative cache_size is in KiB rather than pages
+    cursor.execute(f"PRAGMA cache_size=-{Config.SQLITE_CACHE_SIZE_KB}")
+    cursor.close()
+
+
+def _apply_postgres_settings(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"SET statement_timeout = {Config.PG_STATEMENT_TIMEOUT_MS}")
+    cursor.close()
+
+
+def build_engine(url, use_async=False, **kwargs):
+    """
+    Create the sync or async engine with the pool and connection tuning from Config.
+    In-memory SQLite keeps SQLAlchemy's default single-connection pool.
+    """
+    db_url = make_url(url)
+    backend = db_url.get_backend_name()
+    is_memory_sqlite = backend == "sqlite" and db_url.database in (None, "", ":memory:")
+
+    if not is_memory_sqlite:
+        kwargs.setdefault("poolclass", TimedAsyncQueuePool if use_async else TimedQueuePool)
+        kwargs.setdefault("pool_size", Config.DB_POOL_SIZE)
+        kwargs.setdefault("max_overflow", Config.DB_MAX_OVERFLOW)
+        kwargs.setdefault("pool_timeout", Config.DB_POOL_TIMEOUT)
+        kwargs.setdefault("pool_recycle", Config.DB_POOL_RECYCLE)
+        kwargs.setdefault("pool_pre_ping", Config.DB_POOL_PRE_PING)
+
+    if use_async:
+        new_engine = create_async_engine(url, **kwargs)
+        sync_engine = new_engine.sync_engine
+    else:
+        new_engine = create_engine(url, **kwargs)
+        sync_engine = new_engine
+
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+
+    if backend == "sqlite":
+        event.listen(sync_engine, "connect", _apply_sqlite_pragmas)
+    elif backend == "postgresql" and Config.PG_STATEMENT_TIMEOUT_MS:
+        event.listen(sync_engine, "connect", _apply_postgres_settings)
+    return new_engine
+
+
 DATABASE_URL = Config.SQLALCHEMY_DATABASE_URI
-engine = create_engine(DATABASE_URL)
+ASYNC_DATABASE_URL = Config.SQLALCHEMY_ASYNC_DATABASE_URI or get_async_database_url(DATABASE_URL)
+
+# Sync engine: used by Alembic and the routes that have not moved to AsyncSession yet
+engine = build_engine(DATABASE_URL)
 sessionLocal = sessionmaker(autoflush=False, autocommit=False, bind=engine)
+
+# Async engine: used by the hot request paths and the interview websockets
+async_engine = build_engine(ASYNC_DATABASE_URL, use_async=True)
+asyncSessionLocal = async_sessionmaker(bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 
@@ -15,4 +208,45 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def get_async_db():
+    async with asyncSessionLocal() as db:
+        yield db
+
+
+# For helpers shared by sync routes and async routes/websockets
+async def execute(db: Session | AsyncSession, stmt):
+    if isinstance(db, AsyncSession):
+        return await db.execute(stmt)
+    return db.execute(stmt)
+
+
+async def commit(db: Session | AsyncSession):
+    if isinstance(db, AsyncSession):
+        await db.commit()
+    else:
+        db.commit()
+
+
+def _pool_stats(pool) -> dict:
+    stats = {"pool": type(pool).__name__, "status": pool.status()}
+    if isinstance(pool, QueuePool):
+        stats.update({
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": pool.overflow(),
+        })
+    if hasattr(pool, "stats"):
+        stats.update(pool.stats.as_dict())
+    return stats
+
+
+def get_pool_stats() -> dict:
+    """Current pool occupancy plus cumulative checkout/wait counters for both engines."""
+    return {
+        "sync": _pool_stats(engine.pool),
+        "async": _pool_stats(async_engine.sync_engine.pool),
+    }
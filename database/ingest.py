@@ -0,0 +1,135 @@
+"""
+Bulk job ingestion.
+
+Jobs are deduplicated on a content hash of the fields the single /add-job path
+has always compared (title, company, location, posted_on), stored in the unique
+job.content_hash column. A batch is written with a single executemany of
+INSERT ... ON CONFLICT (content_hash) ... RETURNING inside one transaction, and
+each record's outcome is read from what that statement returned.
+"""
+import hashlib
+import re
+from datetime import datetime
+from pydantic import ValidationError
+from sqlalchemy import case, null, select
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects import postgresql, sqlite
+from database.models import Job
+from database.schema import JobCreate
+from database.search import index_jobs
+
+
+MAX_BULK_JOBS = 5000
+
+# Hashes per IN (...) lookup, keeps SQLite under its bound-parameter limit
+LOOKUP_CHUNK_SIZE = 500
+
+# Columns refreshed when an existing job is re-ingested with on_conflict="update".
+# The hashed columns are equal by definition; owner and created_at are kept.
+UPDATABLE_COLUMNS = (
+    "link", "logo", "salary", "description", "responsibilities", "requirements", "skills",
+    "seniority_level", "employment_type", "job_function", "industry", "source",
+)
+
+_SPACE_RE = re.compile(r"\s+")
+
+
+def _normalize(value: str | None) -> str:
+    return _SPACE_RE.sub(" ", value or "").strip().lower()
+
+
+def job_content_hash(title: str | None, company: str | None, location: str | None, posted_on: str | None) -> str:
+    """sha256 of the normalized dedupe key. Case and whitespace differences do not make a new job."""
+    key = "\x1f".join(_normalize(value) for value in (title, company, location, posted_on))
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def _upsert(db: Session, on_conflict: str):
+    stmt = (postgresql if db.bind.dialect.name == "postgresql" else sqlite).insert(Job.__table__)
+    if on_conflict == "update":
+        return stmt.on_conflict_do_update(
+            index_elements=[Job.content_hash],
+            set_={
+                **{column: stmt.excluded[column] for column in UPDATABLE_COLUMNS},
+                # A new description makes the stored summary stale; load_job_summary recomputes it
+                "job_summary": case(
+                    (Job.description.is_distinct_from(stmt.excluded.description), null()),
+                    else_=Job.job_summary,
+                ),
+            },
+            where=Job.user_id == stmt.excluded.user_id,
+        )
+    return stmt.on_conflict_do_nothing(index_elements=[Job.content_hash])
+
+
+def ingest_jobs(db: Session, records: list[dict], user_id: int, on_conflict: str = "skip") -> list[dict]:
+    """
+    Validate and upsert a batch of JobCreate payloads owned by `user_id`, then commit.
+
+    Returns one outcome per input record, in order:
+    created / updated / skipped (already stored) / duplicate (repeated in this batch) / invalid.
+    Existing jobs are only updated (on_conflict="update") when they belong to the same user.
+    """
+    results: list[dict] = [None] * len(records)
+    rows: dict[str, dict] = {}
+    indexes: dict[str, int] = {}
+    now = datetime.utcnow()
+
+    for i, record in enumerate(records):
+        try:
+            job = JobCreate.model_validate(record)
+        except ValidationError as e:
+            results[i] = {"index": i, "status": "invalid", "errors": e.errors(include_url=False, include_context=False)}
+            continue
+
+        content_hash = job_content_hash(job.title, job.company, job.location, job.posted_on)
+        if content_hash in rows:
+            results[i] = {"index": i, "status": "duplicate", "duplicate_of": indexes[content_hash]}
+            continue
+        rows[content_hash] = {
+            **job.model_dump(),
+            "link": job.link or None,
+            "content_hash": content_hash,
+            "user_id": user_id,
+            "created_at": now,
+        }
+        indexes[content_hash] = i
+
+    if not rows:
+        return results
+
+    hashes = list(rows)
+    # executemany, batched into multi-row INSERTs by the driver ("insertmanyvalues").
+    # RETURNING reports only the rows this statement wrote: skipped conflicts return
+    # nothing, and created_at (never updated) is `now` only on rows it inserted.
+    written = {
+        row.content_hash: row
+        for row in db.connection().execute(
+            _upsert(db, on_conflict).returning(Job.content_hash, Job.id, Job.created_at),
+            [rows[h] for h in hashes],
+        )
+    }
+
+    job_ids = {content_hash: row.id for content_hash, row in written.items()}
+    skipped = [h for h in hashes if h not in written]
+    for start in range(0, len(skipped), LOOKUP_CHUNK_SIZE):
+        chunk = skipped[start:start + LOOKUP_CHUNK_SIZE]
+        job_ids.update(db.execute(select(Job.content_hash, Job.id).filter(Job.content_hash.in_(chunk))).all())
+
+    changed = []
+    for content_hash in hashes:
+        row = written.get(content_hash)
+        if row is None:
+            status = "skipped"
+        else:
+            status = "created" if row.created_at == now else "updated"
+            changed.append(row.id)
+        i = indexes[content_hash]
+        results[i] = {"index": i, "status": status, "job_id": job_ids[content_hash]}
+
+    # Keep full-text search in the same transaction as the rows it describes
+    for start in range(0, len(changed), LOOKUP_CHUNK_SIZE):
+        index_jobs(db, db.scalars(select(Job).filter(Job.id.in_(changed[start:start + LOOKUP_CHUNK_SIZE]))).all())
+
+    db.commit()
+    return results
@@ -1,5 +1,5 @@
 from database.database import Base
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, JSON, Text, Float
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, JSON, Text, Float, Index
 from datetime import datetime
 from sqlalchemy.orm import relationship, backref
 from sqlalchemy.sql import func
@@ -10,7 +10,7 @@ class User(Base):
 
     id = Column(Integer(), primary_key=True)
     name = Column(String(256), nullable=False)
-    email = Column(String(256), nullable=False)
+    email = Column(String(256), nullable=False, unique=True, index=True)
     password = Column(String(256), nullable=False)
     is_recruiter = Column(Boolean, default=False)
 
@@ -18,6 +18,9 @@ class User(Base):
 
 class Job(Base):
     __tablename__ = "job"
+    __table_args__ = (
+        Index("ix_job_source_created_at_id", "source", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     link = Column(String, nullable=True)
@@ -37,7 +40,11 @@ class Job(Base):
     posted_on = Column(String, nullable=True)
     source = Column(String, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
-    user_id = Column(Integer(), ForeignKey('users.id'))
+    user_id = Column(Integer(), ForeignKey('users.id'), index=True)
+    # sha256 of title/company/location/posted_on, see database/ingest.py
+    content_hash = Column(String(64), nullable=True, unique=True, index=True)
+    # Description summary for interview prompts, set on create/edit (database/summaries.py)
+    job_summary = Column(Text, nullable=True)
     
     user = relationship("User", backref=backref("job", cascade='all, delete-orphan'))
 
@@ -45,17 +52,20 @@ class Job(Base):
     
 class Applicant(Base):
     __tablename__="applicants"
+    __table_args__ = (
+        Index("ix_applicants_applicant_applied_for", "applicant", "applied_for", unique=True),
+    )
 
     id = Column(Integer(), primary_key=True)
     number = Column(String(256), nullable=False)
     email = Column(String(256), nullable=True)
     address = Column(String(256), nullable=False)
     applicant = Column(Integer(), ForeignKey('users.id'))
-    applied_for = Column(Integer(), ForeignKey('job.id'))
+    applied_for = Column(Integer(), ForeignKey('job.id'), index=True)
     applied_time = Column(DateTime, default = datetime.utcnow)
     interview_time = Column(DateTime, nullable=True)
     resume = Column(String(256), nullable=False)
-    status = Column(String(256), nullable=False, default="pending")
+    status = Column(String(256), nullable=False, default="pending", index=True)
 
     user = relationship("User", backref=backref("applicants", cascade='all, delete-orphan'))
     job = relationship("Job", backref=backref("applicants", cascade='all, delete-orphan'))
@@ -64,10 +74,13 @@ class Applicant(Base):
 
 class SaveJob(Base):
     __tablename__="savejob"
+    __table_args__ = (
+        Index("ix_savejob_user_id_job_id", "user_id", "job_id", unique=True),
+    )
 
     id = Column(Integer(), primary_key=True)
     user_id = Column(Integer(), ForeignKey('users.id'))
-    job_id = Column(Integer(), ForeignKey('job.id'))
+    job_id = Column(Integer(), ForeignKey('job.id'), index=True)
     
     user = relationship("User", backref=backref("savejob", cascade='all, delete-orphan'))
     job = relationship("Job", backref=backref("savejob", cascade='all, delete-orphan'))
@@ -78,7 +91,7 @@ class Interview(Base):
     __tablename__ = "interviews"
 
     id = Column(Integer, primary_key=True, index=True)
-    applicant_id = Column(Integer, ForeignKey("applicants.id"), nullable=False)
+    applicant_id = Column(Integer, ForeignKey("applicants.id"), nullable=False, index=True)
     transcript = Column(JSON, default=[])
     question_count = Column(Integer, default=0)
     created_at = Column(DateTime, server_default=func.now())
@@ -103,6 +116,7 @@ class PublicInterview(Base):
     role = Column(String(256), nullable=True)
     skills = Column(JSON, nullable=True) 
     description = Column(Text)
+    job_summary = Column(Text, nullable=True)  # see database/summaries.py
     category = Column(String(100))
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -116,8 +130,8 @@ class PublicInterviewAttempt(Base):
     __tablename__ = "public_interview_attempts"
 
     id = Column(Integer, primary_key=True, index=True)
-    interview_id = Column(Integer, ForeignKey("public_interviews.id"), nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    interview_id = Column(Integer, ForeignKey("public_interviews.id"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     transcript = Column(JSON, default=[])
     resume = Column(String(256), nullable=False)
     score = Column(Float, nullable=True)
@@ -125,4 +139,68 @@ class PublicInterviewAttempt(Base):
     attempted_at = Column(DateTime, default=datetime.utcnow, nullable=True)
     video = Column(String(256), nullable=True)
 
-    user = relationship("User", backref="public_interview_attempts")
\ No newline at end of file
+    user = relationship("User", backref="public_interview_attempts")
+
+
+class InterviewTurn(Base):
+    """
+    One message of a live interview, appended as it happens. Belongs to either a
+    job interview or a public interview attempt; the JSON transcript columns on
+    those tables are a snapshot written once the interview completes.
+    """
+    __tablename__ = "interview_turns"
+    __table_args__ = (
+        Index("ix_interview_turns_interview_id_seq", "interview_id", "seq", unique=True),
+        Index("ix_interview_turns_attempt_id_seq", "attempt_id", "seq", unique=True),
+    )
+
+    id = Column(Integer, primary_key=True)
+    interview_id = Column(Integer, ForeignKey("interviews.id", ondelete="CASCADE"), nullable=True)
+    attempt_id = Column(Integer, ForeignKey("public_interview_attempts.id", ondelete="CASCADE"), nullable=True)
+    seq = Column(Integer, nullable=False)
+    role = Column(String(20), nullable=False)  # "AI" / "User"
+    text = Column(Text, nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    # Milliseconds spent producing this turn
+    latency_ms = Column(Integer, nullable=True)
+    llm_ms = Column(Integer, nullable=True)
+    stt_ms = Column(Integer, nullable=True)
+    tts_ms = Column(Integer, nullable=True)
+
+    interview = relationship("Interview", backref=backref("turns", order_by="InterviewTurn.seq", cascade="all, delete-orphan"))
+    attempt = relationship("PublicInterviewAttempt", backref=backref("turns", order_by="InterviewTurn.seq", cascade="all, delete-orphan"))
+
+
+class ResumeAnalysis(Base):
+    """
+    Cached analyze_resume result. cache_key hashes the job fields, the resume
+    (text hash or stored resume URL) and the system prompt; see database/analysis_cache.py.
+    """
+    __tablename__ = "resume_analyses"
+
+    id = Column(Integer, primary_key=True)
+    cache_key = Column(String(64), nullable=False, unique=True, index=True)
+    job_id = Column(Integer, ForeignKey("job.id", ondelete="CASCADE"), nullable=False, index=True)
+    result = Column(JSON, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    job = relationship("Job", backref=backref("analyses", cascade="all, delete-orphan"))
+
+
+class ResumeText(Base):
+    """
+    Text extracted once from an uploaded resume PDF, keyed by its upload URL so
+    reviews and interviews never download or parse the file again; see
+    database/resume_text.py.
+    """
+    __tablename__ = "resume_texts"
+
+    id = Column(Integer, primary_key=True)
+    resume_url = Column(String(256), nullable=False, unique=True, index=True)
+    content_hash = Column(String(64), nullable=False, index=True)  # sha256 of the PDF bytes
+    page_count = Column(Integer, nullable=False, default=0)
+    text = Column(Text, nullable=False)
+    summary = Column(Text, nullable=True)  # for interview prompts; see database/summaries.py
+    created_at = Column(DateTime, default=datetime.utcnow)
@@ -0,0 +1,112 @@
+"""
+Resume text, extracted once per uploaded file.
+
+apply_job and upload_resume call save_resume_text with the PDF bytes they just
+uploaded; reviews and interviews read it back with load_resume_text. Resumes
+uploaded before the resume_texts table existed are downloaded and extracted on
+their first read, then served from the table like the rest.
+
+Both helpers accept a sync Session or an AsyncSession. Parsing goes through the
+PDF process pool (utils/pdf_extract.py) and its size/page/time limits.
+"""
+import asyncio
+import hashlib
+import re
+import httpx
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects import postgresql, sqlite
+from config import Config
+from database.database import execute, commit
+from database.models import ResumeText
+from utils.pdf_extract import extract_pdf, PdfLimitError, PdfParseError
+from utils.conversationMemory import summarize_profile
+
+
+DOWNLOAD_TIMEOUT_SECONDS = 30
+
+
+def normalize_resume_text(text: str) -> str:
+    """Collapse runs of spaces inside lines and of blank lines between them."""
+    lines = (re.sub(r"[ \t\u00a0]+", " ", line).strip() for line in text.splitlines())
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+
+
+async def parse_resume_pdf(pdf_bytes: bytes) -> tuple[str, int]:
+    """
+    (normalized text, page count) of a PDF; ("", 0) if it cannot be parsed.
+    Raises PdfLimitError for files over the PDF limits.
+    """
+    try:
+        text, page_count = await extract_pdf(pdf_bytes)
+    except PdfParseError as e:
+        print(f"Resume parse error: {e}")
+        return "", 0
+    return normalize_resume_text(text), page_count
+
+
+async def save_resume_text(
+    db: Session | AsyncSession, resume_url: str, pdf_bytes: bytes, parsed: tuple[str, int] | None = None
+) -> str:
+    """
+    Store the text of an uploaded resume and its interview summary, extracting it
+    unless the caller already has `parsed` from parse_resume_pdf. The caller commits.
+    """
+    text, page_count = parsed or await parse_resume_pdf(pdf_bytes)
+    summary = await asyncio.to_thread(summarize_profile, text) if text else None
+    insert = (postgresql if db.bind.dialect.name == "postgresql" else sqlite).insert(ResumeText)
+    stmt = insert.values(
+        resume_url=resume_url,
+        content_hash=hashlib.sha256(pdf_bytes).hexdigest(),
+        page_count=page_count,
+        text=text,
+        summary=summary,
+    )
+    await execute(db, stmt.on_conflict_do_update(
+        index_elements=[ResumeText.resume_url],
+        set_={column: stmt.excluded[column] for column in ("content_hash", "page_count", "text", "summary")},
+    ))
+    return text
+
+
+async def _download(resume_url: str) -> bytes:
+    """Resume bytes, cut off just past PDF_MAX_BYTES (extract_pdf then rejects them)."""
+    chunks, size = [], 0
+    async with httpx.AsyncClient(timeout=DOWNLOAD_TIMEOUT_SECONDS, follow_redirects=True) as client:
+        async with client.stream("GET", resume_url) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                chunks.append(chunk)
+                size += len(chunk)
+                if size > Config.PDF_MAX_BYTES:
+                    break
+    return b"".join(chunks)
+
+
+async def load_resume_text(db: Session | AsyncSession, resume_url: str | None) -> str:
+    """
+    Stored text of the resume at `resume_url`, extracting (and committing) it on
+    first use for resumes uploaded before extraction at upload time.
+    Raises ValueError if such a resume cannot be downloaded.
+    """
+    if not resume_url:
+        return ""
+    text = (await execute(db, select(ResumeText.text).filter_by(resume_url=resume_url))).scalar()
+    if text is not None:
+        return text
+
+    try:
+        pdf_bytes = await _download(resume_url)
+    except httpx.HTTPError as e:
+        raise ValueError(f"Error reading PDF from URL: {str(e)}")
+
+    try:
+        parsed = await parse_resume_pdf(pdf_bytes)
+    except PdfLimitError as e:
+        # Store it empty so an oversized old resume is not downloaded on every read
+        print(f"Resume over PDF limits ({resume_url}): {e}")
+        parsed = ("", 0)
+    text = await save_resume_text(db, resume_url, pdf_bytes, parsed)
+    await commit(db)
+    return text
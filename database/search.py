@@ -0,0 +1,160 @@
+"""
+Full-text job search.
+
+SQLite uses an FTS5 virtual table (job_fts, rowid = job.id) ranked with bm25.
+Postgres uses a job_search table of weighted tsvectors behind a GIN index,
+ranked with ts_rank. Both are created by alembic revision 4b1f0c6e9a27 and
+kept in sync by index_job / remove_job from the job write paths.
+"""
+import re
+from sqlalchemy import text, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from database.models import Job
+
+
+JOB_SEARCH_LIMIT = 100
+
+# Tables owned by this module rather than the ORM metadata (skipped by autogenerate)
+SEARCH_TABLES = ("job_fts", "job_search")
+
+# bm25 weights for (title, company, location, description, skills)
+FTS_WEIGHTS = "10.0, 4.0, 2.0, 1.0, 5.0"
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def is_search_table(name: str) -> bool:
+    """True for the search tables and the FTS5 shadow tables (job_fts_data, job_fts_idx, ...)."""
+    return any(name == table or name.startswith(f"{table}_") for table in SEARCH_TABLES)
+
+
+def _terms(query: str | None) -> list[str]:
+    return _TERM_RE.findall(query.lower()) if query else []
+
+
+def _document(job) -> dict:
+    skills = job.skills or []
+    if isinstance(skills, (list, tuple)):
+        skills = " ".join(str(skill) for skill in skills)
+    return {
+        "job_id": job.id,
+        "title": job.title or "",
+        "company": job.company or "",
+        "location": job.location or "",
+        "description": job.description or "",
+        "skills": skills or "",
+    }
+
+
+# ---------------- Write path ----------------
+
+def index_job(db: Session, job: Job):
+    """Insert or refresh the search row for a job. Runs inside the caller's transaction."""
+    index_jobs(db, [job])
+
+
+def index_jobs(db: Session, jobs: list[Job]):
+    """Batched index_job: one executemany per statement for the whole list."""
+    params = [_document(job) for job in jobs]
+    if not params:
+        return
+    if db.bind.dialect.name == "postgresql":
+        db.execute(text("""
+            INSERT INTO job_search (job_id, document, location)
+            VALUES (
+                :job_id,
+                setweight(to_tsvector('english', :title), 'A') ||
+                setweight(to_tsvector('english', :company || ' ' || :skills), 'B') ||
+                setweight(to_tsvector('english', :description), 'C'),
+                to_tsvector('simple', :location)
+            )
+            ON CONFLICT (job_id) DO UPDATE
+            SET document = EXCLUDED.document, location = EXCLUDED.location
+        """), params)
+    else:
+        db.execute(text("DELETE FROM job_fts WHERE rowid = :job_id"), params)
+        db.execute(text("""
+            INSERT INTO job_fts (rowid, title, company, location, description, skills)
+            VALUES (:job_id, :title, :company, :location, :description, :skills)
+        """), params)
+
+
+def remove_job(db: Session, job_id: int):
+    """Drop a job from the search index. Runs inside the caller's transaction."""
+    if db.bind.dialect.name == "postgresql":
+        db.execute(text("DELETE FROM job_search WHERE job_id = :job_id"), {"job_id": job_id})
+    else:
+        db.execute(text("DELETE FROM job_fts WHERE rowid = :job_id"), {"job_id": job_id})
+
+
+# ---------------- Read path ----------------
+
+def _sqlite_search(terms, location_terms, source, limit):
+    clauses = []
+    if terms:
+        clauses.append("{title company description skills} : (" + " AND ".join(f'"{t}"*' for t in terms) + ")")
+    if location_terms:
+        clauses.append("location : (" + " AND ".join(f'"{t}"*' for t in location_terms) + ")")
+    sql = f"""
+        SELECT job_fts.rowid AS job_id
+        FROM job_fts JOIN job ON job.id = job_fts.rowid
+        WHERE job_fts MATCH :match {"AND job.source = :source" if source else ""}
+        ORDER BY bm25(job_fts, {FTS_WEIGHTS})
+        LIMIT :limit
+    """
+    return sql, {"match": " AND ".join(clauses), "source": source, "limit": limit}
+
+
+def _postgres_search(terms, location_terms, source, limit):
+    conditions, rank = [], []
+    params = {"source": source, "limit": limit}
+    if terms:
+        params["query"] = " & ".join(f"{t}:*" for t in terms)
+        conditions.append("s.document @@ to_tsquery('english', :query)")
+        rank.append("ts_rank(s.document, to_tsquery('english', :query))")
+    if location_terms:
+        params["location_query"] = " & ".join(f"{t}:*" for t in location_terms)
+        conditions.append("s.location @@ to_tsquery('simple', :location_query)")
+        rank.append("ts_rank(s.location, to_tsquery('simple', :location_query))")
+    if source:
+        conditions.append("job.source = :source")
+    sql = f"""
+        SELECT s.job_id
+        FROM job_search s JOIN job ON job.id = s.job_id
+        WHERE {" AND ".join(conditions)}
+        ORDER BY {" + ".join(rank)} DESC
+        LIMIT :limit
+    """
+    return sql, params
+
+
+async def search_jobs(
+    db: AsyncSession,
+    query: str | None = None,
+    location: str | None = None,
+    source: str | None = None,
+    limit: int = JOB_SEARCH_LIMIT,
+) -> list[Job]:
+    """
+    Jobs matching every word of `query` (title, company, description, skills) and of
+    `location`, best match first. Words are prefix-matched so "dev" finds "developer".
+    Without any search words this falls back to the newest jobs for the source.
+    """
+    terms, location_terms = _terms(query), _terms(location)
+    if not terms and not location_terms:
+        stmt = select(Job).order_by(Job.created_at.desc(), Job.id.desc()).limit(limit)
+        if source:
+            stmt = stmt.filter(Job.source == source)
+        return list((await db.scalars(stmt)).all())
+
+    if db.bind.dialect.name == "postgresql":
+        sql, params = _postgres_search(terms, location_terms, source, limit)
+    else:
+        sql, params = _sqlite_search(terms, location_terms, source, limit)
+    job_ids = [row.job_id for row in (await db.execute(text(sql), params)).all()]
+    if not job_ids:
+        return []
+
+    jobs = {job.id: job for job in (await db.scalars(select(Job).filter(Job.id.in_(job_ids)))).all()}
+    return [jobs[job_id] for job_id in job_ids if job_id in jobs]
@@ -0,0 +1,58 @@
+"""
+Job description and resume summaries for interview prompts, computed once
+instead of on every interview connection.
+
+- job.job_summary / public_interviews.job_summary: set by the create and edit
+  routes with summarize_job.
+- resume_texts.summary: set by save_resume_text at upload.
+
+Rows written before these columns existed, or while the summarizer was failing,
+are summarized on first read by load_job_summary / load_resume_summary and
+committed, like load_resume_text does for resume text.
+"""
+import asyncio
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from database.database import execute, commit
+from database.models import Job, PublicInterview, ResumeText
+from database.resume_text import load_resume_text
+from utils.conversationMemory import summarize_profile
+
+
+async def summarize_job(description: str | None) -> str | None:
+    """Summary to store with a job or public interview; None if summarizing failed."""
+    return await asyncio.to_thread(summarize_profile, description)
+
+
+async def load_job_summary(db: Session | AsyncSession, posting: Job | PublicInterview) -> str | None:
+    """Stored description summary of `posting`, computed and committed if it has none yet."""
+    if posting.job_summary is None:
+        summary = await summarize_job(posting.description)
+        if summary is not None:
+            posting.job_summary = summary
+            await commit(db)
+        return summary
+    return posting.job_summary
+
+
+async def load_resume_summary(db: Session | AsyncSession, resume_url: str | None) -> str | None:
+    """
+    Stored summary of the resume at `resume_url`, computed and committed on first
+    use for resumes stored before summaries were. None if there is no resume text
+    to summarize or the summarizer failed.
+    """
+    if not resume_url:
+        return None
+    row = (await execute(db, select(ResumeText.text, ResumeText.summary).filter_by(resume_url=resume_url))).first()
+    if row is None:
+        # Not extracted yet: load_resume_text stores the text and its summary
+        await load_resume_text(db, resume_url)
+        row = (await execute(db, select(ResumeText.text, ResumeText.summary).filter_by(resume_url=resume_url))).first()
+    text, summary = row
+    if summary is None and text:
+        summary = await asyncio.to_thread(summarize_profile, text)
+        if summary is not None:
+            await execute(db, update(ResumeText).filter_by(resume_url=resume_url).values(summary=summary))
+            await commit(db)
+    return summary
@@ -8,6 +8,10 @@ from apps.websocket.websocket_route import websocket_router
 from apps.stt_tts.route import voice_router
 from apps.PublicInterview.public_interview import public_interview_router
 from apps.Interview.interview import interview_router
+from apps.monitoring.route import monitoring_router
+from apps.monitoring.middleware import query_stats_middleware
+from apps.stt_tts.service import voice_service
+from utils.pdf_extract import shutdown_pdf_pool
 from starlette.middleware.sessions import SessionMiddleware
 from config import SECRET_KEY
 from fastapi.middleware.cors import CORSMiddleware
@@ -34,6 +38,9 @@ app.add_middleware(
 
 
 app.add_middleware(SessionMiddleware, secret_key=SECRET_KEY)
+app.middleware("http")(query_stats_middleware)
+app.add_event_handler("shutdown", voice_service.aclose)
+app.add_event_handler("shutdown", shutdown_pdf_pool)
 
 app.mount("/static", StaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
@@ -51,6 +58,7 @@ app.include_router(dashboard_router)
 app.include_router(voice_router)
 app.include_router(interview_router)
 app.include_router(public_interview_router)
+app.include_router(monitoring_router)
 
 if __name__ == '__main__':
     uvicorn.run(
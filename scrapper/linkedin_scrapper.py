@@ -15,13 +15,17 @@ token = sys.argv[1]
 job_title = sys.argv[2]
 job_location = sys.argv[3]
 
-API_URL = "http://127.0.0.1:8000/add-job"
+API_URL = "http://127.0.0.1:8000/api/jobs/bulk"
 
-def save_job_to_api(record, user_token):
+def save_jobs_to_api(records, user_token):
+    """Send every scraped job in one request, the API dedupes them in a single transaction."""
+    if not records:
+        return
     cookies = {"access_token": user_token}
-    response = requests.post(API_URL, json=record, cookies=cookies)
+    response = requests.post(API_URL, json=records, cookies=cookies)
     try:
-        print("Save response:", response.json())
+        result = response.json()
+        print(f"Saved jobs: {result['created']} created, {result['skipped'] + result['duplicate']} already stored, {result['invalid']} invalid")
     except Exception:
         print("Save response (raw):", response.text)
 
@@ -250,8 +254,8 @@ def scrape_linkedin_jobs(max_jobs=20, pages=1):
         }
         jobs.append(new_job)
         print(new_job)
-        save_job_to_api(new_job, token)
     driver.quit()
+    save_jobs_to_api(jobs, token)
     return jobs
 
 
@@ -15,13 +15,17 @@ location = sys.argv[3]
 
 print(token, job_title, location)
 
-API_URL = "http://127.0.0.1:8000/add-job"
+API_URL = "http://127.0.0.1:8000/api/jobs/bulk"
 
-def save_job_to_api(record, user_token):
+def save_jobs_to_api(records, user_token):
+    """Send every scraped job in one request, the API dedupes them in a single transaction."""
+    if not records:
+        return
     cookies = {"access_token": user_token}
-    response = requests.post(API_URL, json=record, cookies=cookies)
+    response = requests.post(API_URL, json=records, cookies=cookies)
     try:
-        print("Save response:", response.json())
+        result = response.json()
+        print(f"Saved jobs: {result['created']} created, {result['skipped'] + result['duplicate']} already stored, {result['invalid']} invalid")
     except Exception:
         print("Save response (raw):", response.text)
 
@@ -202,9 +206,8 @@ while True:
         print(f"{record['title']} is posted on {record["posted_on"]}")
 
         if is_posted_today(posted_on):
-            save_job_to_api(record, user_token=token)
             jobs_data.append(record)
-            print(f"Added: {record['title']} ({record['posted_on']})")
+            print(f"Queued: {record['title']} ({record['posted_on']})")
         else:
             print(f"Skipped (not today): {record['title']} ({record['posted_on']})")
 
@@ -221,6 +224,8 @@ while True:
         print("No more pages.")
         break
 
+save_jobs_to_api(jobs_data, user_token=token)
+
 # ---------------- Save to CSV ----------------
 fieldnames = [
     "link", "logo", "source", "title", "company", "location", "salary", "description",
@@ -20,6 +20,7 @@ let isListening = false;
 let interviewStarted = false;
 let silenceTimer = null;
 let finalTranscript = "";
+let streamingQuestion = null; // { index, textEl } while question_delta chunks arrive
 
 // ======================= CAMERA =======================
 async function startCamera() {
@@ -110,9 +111,32 @@ function speakText(text) {
 function addMessage(sender, text) {
   const msg = document.createElement("div");
   msg.className = `message ${sender === "AI" ? "ai" : "user"}`;
-  msg.innerHTML = `<strong>${sender}:</strong> ${escapeHtml(text)}`;
+  msg.innerHTML = `<strong>${sender}:</strong> <span class="message-text">${escapeHtml(text)}</span>`;
   chatBox.appendChild(msg);
   chatBox.scrollTop = chatBox.scrollHeight;
+  return msg.querySelector(".message-text");
+}
+
+// Render interviewer tokens as they stream in
+function appendQuestionDelta(data) {
+  if (!streamingQuestion || streamingQuestion.index !== data.index) {
+    streamingQuestion = {
+      index: data.index,
+      textEl: addMessage("AI", `${data.index}/${data.total_questions}: `),
+    };
+  }
+  streamingQuestion.textEl.textContent += data.delta;
+  chatBox.scrollTop = chatBox.scrollHeight;
+}
+
+function finishQuestion(data) {
+  const text = `${data.index}/${data.total_questions}: ${data.question}`;
+  if (streamingQuestion && streamingQuestion.index === data.index) {
+    streamingQuestion.textEl.textContent = text;
+  } else {
+    addMessage("AI", text);
+  }
+  streamingQuestion = null;
 }
 
 function escapeHtml(str) {
@@ -204,8 +228,10 @@ function connectWebSocket() {
       const data = JSON.parse(event.data);
       if (data.type === "welcome") interviewStarted = true;
 
-      else if (data.type === "question") {
-        addMessage("AI", `${data.index}/${data.total_questions}: ${data.question}`);
+      else if (data.type === "question_delta") appendQuestionDelta(data);
+
+      else if (data.type === "question_done") {
+        finishQuestion(data);
         await speakText(`Question ${data.index}. ${data.question}`);
         startListening();
       }
@@ -1,50 +1,29 @@
 // static/js/dashboard.js
 document.addEventListener("DOMContentLoaded", () => {
-    const allJobs = document.querySelectorAll("#all-jobs .job-item");
-
-    // Split jobs by source
-    const linkedinJobs = Array.from(allJobs).filter(job => job.dataset.source === "linkedin");
-    const rozeeJobs = Array.from(allJobs).filter(job => job.dataset.source === "rozee.pk");
-    const userPosted = Array.from(allJobs).filter(job => job.dataset.source === "manual");
-
-    setupPagination(
-        linkedinJobs,
-        "linkedin-jobs-container",
-        "linkedin-pagination",
-        "linkedin-prev",
-        "linkedin-next",
-        "linkedin-info",
-        "linkedin-page-size",
-        "linkedin-count"
-    );
-
-    setupPagination(
-        rozeeJobs,
-        "rozee-jobs-container",
-        "rozee-pagination",
-        "rozee-prev",
-        "rozee-next",
-        "rozee-info",
-        "rozee-page-size",
-        "rozee-count"
-    );
-
-    setupPagination(
-        userPosted,
-        "user-posted-jobs-container",
-        "user-posted-pagination",
-        "user-posted-prev",
-        "user-posted-next",
-        "user-posted-info",
-        "user-posted-page-size",
-        "user-posted-count"
-    );
+    const feedRoot = document.getElementById("jobTabsContent");
+    const feedUrl = feedRoot.dataset.feedUrl;
+    const isRecruiter = feedRoot.dataset.isRecruiter === "true";
+
+    ["linkedin", "rozee", "user-posted"].forEach(tab => {
+        setupPagination(
+            feedUrl,
+            isRecruiter,
+            `${tab}-jobs-container`,
+            `${tab}-pagination`,
+            `${tab}-prev`,
+            `${tab}-next`,
+            `${tab}-info`,
+            `${tab}-page-size`,
+            `${tab}-count`
+        );
+    });
 });
 
 /**
- * Setup pagination for a job source
+ * Setup cursor pagination for a job source.
+ * The first page is rendered by the server; later pages come from /api/jobs/feed.
  */
-function setupPagination(jobs, containerId, paginationId, prevBtnId, nextBtnId, infoId, pageSizeId, countBadgeId) {
+function setupPagination(feedUrl, isRecruiter, containerId, paginationId, prevBtnId, nextBtnId, infoId, pageSizeId, countBadgeId) {
     const container = document.getElementById(containerId);
     const pagination = document.getElementById(paginationId);
     const prevBtn = document.getElementById(prevBtnId);
@@ -53,54 +32,127 @@ function setupPagination(jobs, containerId, paginationId, prevBtnId, nextBtnId,
     const pageSizeSelect = document.getElementById(pageSizeId);
     const countBadge = document.getElementById(countBadgeId);
 
+    const source = container.dataset.source;
+    const totalJobs = parseInt(countBadge.textContent) || 0;
+
+    // pageCursors[i] is the cursor that loads page i + 1 (page 1 has none)
+    let pageCursors = [null];
+    let nextCursor = container.dataset.nextCursor || null;
     let currentPage = 1;
     let pageSize = parseInt(pageSizeSelect.value);
+    let loading = false;
 
-    countBadge.textContent = jobs.length;
+    function updateControls() {
+        const totalPages = Math.max(Math.ceil(totalJobs / pageSize), 1);
+        info.textContent = `Page ${currentPage} of ${totalPages}`;
 
-    function renderPage() {
-        container.innerHTML = "";
+        prevBtn.disabled = loading || currentPage === 1;
+        nextBtn.disabled = loading || !nextCursor;
 
-        const start = (currentPage - 1) * pageSize;
-        const end = start + pageSize;
-        const paginatedJobs = jobs.slice(start, end);
+        pagination.style.display = totalJobs > 0 ? "flex" : "none";
+    }
 
-        if (paginatedJobs.length === 0 && currentPage > 1) {
-            currentPage--; // go back if last page is empty
-            return renderPage();
+    async function loadPage(page) {
+        loading = true;
+        updateControls();
+
+        const params = new URLSearchParams({ source: source, limit: pageSize });
+        const cursor = pageCursors[page - 1];
+        if (cursor) params.set("cursor", cursor);
+
+        try {
+            const response = await fetch(`${feedUrl}?${params.toString()}`, { credentials: "same-origin" });
+            if (!response.ok) throw new Error(`Feed request failed (${response.status})`);
+            const data = await response.json();
+
+            container.innerHTML = "";
+            data.jobs.forEach(job => container.appendChild(renderJob(job, isRecruiter)));
+
+            currentPage = page;
+            nextCursor = data.next_cursor;
+            pageCursors[page] = data.next_cursor;
+        } catch (error) {
+            console.error(error);
+        } finally {
+            loading = false;
+            updateControls();
         }
-
-        paginatedJobs.forEach(job => container.appendChild(job.cloneNode(true)));
-
-        const totalPages = Math.ceil(jobs.length / pageSize);
-        info.textContent = `Page ${currentPage} of ${totalPages}`;
-
-        prevBtn.disabled = currentPage === 1;
-        nextBtn.disabled = currentPage === totalPages || totalPages === 0;
-
-        pagination.style.display = jobs.length > 0 ? "flex" : "none";
     }
 
     prevBtn.addEventListener("click", () => {
-        if (currentPage > 1) {
-            currentPage--;
-            renderPage();
-        }
+        if (currentPage > 1) loadPage(currentPage - 1);
     });
 
     nextBtn.addEventListener("click", () => {
-        const totalPages = Math.ceil(jobs.length / pageSize);
-        if (currentPage < totalPages) {
-            currentPage++;
-            renderPage();
+        if (nextCursor) {
+            pageCursors[currentPage] = nextCursor;
+            loadPage(currentPage + 1);
         }
     });
 
     pageSizeSelect.addEventListener("change", () => {
         pageSize = parseInt(pageSizeSelect.value);
-        currentPage = 1;
-        renderPage();
+        pageCursors = [null];
+        loadPage(1);
     });
 
-    renderPage(); // Initial load
+    updateControls(); // Initial load is server-rendered
+}
+
+/**
+ * Build a job card matching the server-rendered markup in dashboard.html
+ */
+function renderJob(job, isRecruiter) {
+    const item = document.createElement("div");
+    item.className = "job-item";
+    item.dataset.source = job.source;
+
+    const bookmarkIcon = job.saved
+        ? '<i class="fa-solid fa-bookmark fa-lg text-warning"></i>'
+        : '<i class="fa-regular fa-bookmark fa-lg text-muted"></i>';
+
+    let actions;
+    if (isRecruiter) {
+        actions = `
+            <div class="position-absolute bottom-0 end-0 m-3">
+                <div class="recruiter-actions">
+                    <a class="btn-edit" href="${job.edit_url}">
+                        <i class="fas fa-edit me-1"></i>Edit
+                    </a>
+                    <a class="btn-delete" href="${job.delete_url}">
+                        <i class="fas fa-trash me-1"></i>Delete
+                    </a>
+                </div>
+            </div>`;
+    } else if (job.applied) {
+        actions = `
+            <div class="position-absolute bottom-0 end-0 m-3">
+                <button class="applied-btn" disabled>
+                    <i class="fas fa-check me-1"></i>Already Applied
+                </button>
+            </div>`;
+    } else {
+        actions = `
+            <div class="position-absolute bottom-0 end-0 m-3">
+                <a href="${job.apply_url}" class="apply-btn">
+                    <i class="fas fa-paper-plane me-1"></i>Apply Now
+                </a>
+            </div>`;
+    }
+
+    item.innerHTML = `
+        <form action="${job.save_url}" method="post" class="position-absolute top-0 end-0 m-3">
+            <button class="bookmark-btn" ${job.saved ? "disabled" : ""}>${bookmarkIcon}</button>
+        </form>
+        <div class="pe-5">
+            <a href="${job.detail_url}" class="job-title"></a>
+            <div class="job-company"><i class="fas fa-building me-1"></i><span></span></div>
+            <div class="job-posted"><i class="fas fa-calendar me-1"></i>Posted on: ${job.posted}</div>
+        </div>
+        ${actions}`;
+
+    // Scraped titles/companies are untrusted, set them as text
+    item.querySelector(".job-title").textContent = job.title;
+    item.querySelector(".job-company span").textContent = job.company || "";
+    return item;
 }
@@ -1,3 +1,11 @@
+// Binary audio frame header, mirrors AUDIO_FRAME_HEADER in websocket_route.py
+const AUDIO_FRAME_HEADER_SIZE = 6;
+const FRAME_QUESTION_AUDIO = 1;
+const FRAME_ANSWER_AUDIO = 2;
+const FRAME_ANSWER_CHUNK = 3;
+const FLAG_LAST_CHUNK = 0x02;
+const STT_CLIP_MS = 3000; // answer clip length in stt "stream" mode; each clip is transcribed on its own
+
 class PublicInterviewChat {
   constructor() {
     this.ws = null;
@@ -12,6 +20,15 @@ class PublicInterviewChat {
     this.silenceThreshold = 0.3;
     this.silenceDuration = 1500;
     this.currentUserMsg = null; // 🆕 track current user message
+    this.streamingQuestion = null; // { index, textEl } while question_delta chunks arrive
+    this.audioQueue = []; // question_audio segments waiting to play, in order
+    this.audioPlaying = false;
+    this.awaitingAnswer = false; // question_done received, record once the audio queue drains
+    this.binaryAudio = true; // ask for raw audio frames; the welcome message says if the server agreed
+    this.questionIndex = 0;
+    this.streamingStt = false; // send the answer as short clips for partial transcripts; the server's welcome turns it on (STT_TRANSCRIBE_CLIPS)
+    this.clipTimer = null;
+    this.chunkSend = Promise.resolve(); // keeps answer chunks in order while they are encoded
 
     // Elements
     this.interviewId = document.getElementById("interview_id")?.textContent?.trim();
@@ -74,8 +91,10 @@ class PublicInterviewChat {
 
   // 🌐 WebSocket connection
   connectWebSocket() {
-    const wsUrl = `${location.origin.replace("http", "ws")}/ws/public-interview/${this.interviewId}?attempt_id=${this.attemptId}`;
+    const audioParam = this.binaryAudio ? "&audio=binary" : "";
+    const wsUrl = `${location.origin.replace("http", "ws")}/ws/public-interview/${this.interviewId}?attempt_id=${this.attemptId}${audioParam}`;
     this.ws = new WebSocket(wsUrl);
+    this.ws.binaryType = "arraybuffer";
 
     this.ws.onopen = () => {
       this.updateStatus("Connected", "green");
@@ -83,16 +102,33 @@ class PublicInterviewChat {
     };
 
     this.ws.onmessage = async (event) => {
+      if (event.data instanceof ArrayBuffer) {
+        this.handleAudioFrame(event.data);
+        return;
+      }
       const data = JSON.parse(event.data);
       console.log("📩 WS Message:", data);
 
       switch (data.type) {
-        case "question":
+        case "welcome":
+          this.binaryAudio = data.audio_transport === "binary";
+          this.streamingStt = data.stt === "stream";
+          break;
+
+        case "question_delta":
+          this.appendQuestionDelta(data);
+          break;
+
+        case "question_audio":
+          this.enqueueQuestionAudio(data);
+          break;
+
+        case "question_done":
           await this.handleQuestion(data);
           break;
 
         case "user_transcript":
-          this.updateUserMessage(data.text);
+          this.updateUserMessage(data.text, data.partial);
           break;
 
         case "evaluation_start":
@@ -121,49 +157,151 @@ class PublicInterviewChat {
     };
   }
 
-  // 🎧 Handle AI question
-  async handleQuestion(data) {
-    const { text, audio } = data;
-    this.addMessage("ai", text);
+  // ✍️ Render interviewer tokens as they stream in
+  appendQuestionDelta(data) {
+    if (!this.streamingQuestion || this.streamingQuestion.index !== data.index) {
+      this.streamingQuestion = { index: data.index, textEl: this.addMessage("ai", "") };
+    }
+    this.streamingQuestion.textEl.textContent += data.delta;
+    this.chatBox.scrollTop = this.chatBox.scrollHeight;
+  }
 
-    if (audio) {
-      const audioBlob = await this.base64ToBlob(audio);
-      const audioUrl = URL.createObjectURL(audioBlob);
-      const audioPlayer = new Audio(audioUrl);
-      audioPlayer.play();
+  // 📦 Binary frame: kind (u8), flags (u8), question index (u16), seq (u16), then the MP3 bytes
+  handleAudioFrame(buffer) {
+    const header = new DataView(buffer, 0, AUDIO_FRAME_HEADER_SIZE);
+    if (header.getUint8(0) !== FRAME_QUESTION_AUDIO) return;
+    this.audioQueue.push(new Blob([buffer.slice(AUDIO_FRAME_HEADER_SIZE)], { type: "audio/mpeg" }));
+    if (!this.audioPlaying) this.playNextAudio();
+  }
 
-      audioPlayer.onended = () => this.startRecording();
-    } else {
+  // 🔊 Play sentence audio in order while later sentences are still being generated
+  async enqueueQuestionAudio(data) {
+    this.audioQueue.push(await this.base64ToBlob(data.audio));
+    if (!this.audioPlaying) this.playNextAudio();
+  }
+
+  playNextAudio() {
+    const audioBlob = this.audioQueue.shift();
+    if (!audioBlob) {
+      this.audioPlaying = false;
+      this.startRecordingIfReady();
+      return;
+    }
+    this.audioPlaying = true;
+    const audioUrl = URL.createObjectURL(audioBlob);
+    const audioPlayer = new Audio(audioUrl);
+    const next = () => {
+      URL.revokeObjectURL(audioUrl);
+      this.playNextAudio();
+    };
+    audioPlayer.onended = next;
+    audioPlayer.onerror = next;
+    audioPlayer.play().catch(next);
+  }
+
+  startRecordingIfReady() {
+    if (this.awaitingAnswer && !this.audioPlaying && this.audioQueue.length === 0) {
+      this.awaitingAnswer = false;
       this.startRecording();
     }
   }
 
+  // 🎧 Handle AI question (its audio arrived before this as question_audio segments)
+  async handleQuestion(data) {
+    const { index, text } = data;
+    this.questionIndex = index;
+    if (this.streamingQuestion && this.streamingQuestion.index === index) {
+      this.streamingQuestion.textEl.textContent = text;
+    } else {
+      this.addMessage("ai", text);
+    }
+    this.streamingQuestion = null;
+
+    this.awaitingAnswer = true;
+    this.startRecordingIfReady();
+  }
+
   // 🎙️ Start recording
   startRecording() {
     if (this.isRecording || !this.stream) return;
 
     this.audioChunks = [];
-    this.mediaRecorder = new MediaRecorder(this.stream);
-    this.mediaRecorder.ondataavailable = (e) => this.audioChunks.push(e.data);
-    this.mediaRecorder.onstop = async () => {
-      const audioBlob = new Blob(this.audioChunks, { type: "audio/webm" });
-      const base64Audio = await this.blobToBase64(audioBlob);
-
-      // 🧠 Show “Processing…” placeholder for user
-      this.currentUserMsg = this.addMessage("user", "Processing your response...");
-      this.ws.send(JSON.stringify({ audio: base64Audio }));
-      this.voiceStatus.querySelector(".status-label").textContent = "Processing...";
-    };
-
     this.isRecording = true;
     this.startTimer();
     this.voiceStatus.querySelector(".status-label").textContent = "Listening...";
     this.recordingStatus.classList.remove("hidden");
-    this.mediaRecorder.start();
+
+    if (this.streamingStt) {
+      this.recordClip();
+    } else {
+      this.mediaRecorder = new MediaRecorder(this.stream);
+      this.mediaRecorder.ondataavailable = (e) => this.audioChunks.push(e.data);
+      this.mediaRecorder.onstop = async () => {
+        const audioBlob = new Blob(this.audioChunks, { type: "audio/webm" });
+
+        // 🧠 Show “Processing…” placeholder for user
+        this.currentUserMsg = this.addMessage("user", "Processing your response...");
+        if (this.binaryAudio) {
+          const header = new DataView(new ArrayBuffer(AUDIO_FRAME_HEADER_SIZE));
+          header.setUint8(0, FRAME_ANSWER_AUDIO);
+          header.setUint16(2, this.questionIndex);
+          this.ws.send(new Blob([header.buffer, audioBlob]));
+        } else {
+          const base64Audio = await this.blobToBase64(audioBlob);
+          this.ws.send(JSON.stringify({ audio: base64Audio }));
+        }
+        this.voiceStatus.querySelector(".status-label").textContent = "Processing...";
+      };
+      this.mediaRecorder.start();
+    }
 
     this.monitorSilence();
   }
 
+  // 📤 Streaming STT: record the answer as short clips, each one a complete file (MediaRecorder
+  // timeslice chunks cannot be decoded on their own), so the server transcribes every clip once
+  recordClip() {
+    const recorder = new MediaRecorder(this.stream);
+    const parts = [];
+    recorder.ondataavailable = (e) => parts.push(e.data);
+    recorder.stopped = new Promise((resolve) => {
+      recorder.onstop = () => resolve(new Blob(parts, { type: "audio/webm" }));
+    });
+    recorder.start();
+    this.mediaRecorder = recorder;
+    this.clipTimer = setTimeout(() => {
+      if (!this.isRecording) return;
+      this.recordClip();
+      this.endClip(recorder, false);
+    }, STT_CLIP_MS);
+  }
+
+  endClip(recorder, last) {
+    recorder.stop();
+    this.sendAnswerChunk(recorder.stopped, last);
+    if (last) {
+      if (!this.currentUserMsg) this.currentUserMsg = this.addMessage("user", "Processing your response...");
+      this.voiceStatus.querySelector(".status-label").textContent = "Processing...";
+    }
+  }
+
+  // Clips are sent in the order they end; the server sends partial transcripts back
+  sendAnswerChunk(clip, last) {
+    this.chunkSend = this.chunkSend.then(async () => {
+      const blob = await clip;
+      if (this.binaryAudio) {
+        const header = new DataView(new ArrayBuffer(AUDIO_FRAME_HEADER_SIZE));
+        header.setUint8(0, FRAME_ANSWER_CHUNK);
+        header.setUint8(1, last ? FLAG_LAST_CHUNK : 0);
+        header.setUint16(2, this.questionIndex);
+        this.ws.send(new Blob([header.buffer, blob]));
+      } else {
+        const audioChunk = blob.size ? await this.blobToBase64(blob) : "";
+        this.ws.send(JSON.stringify({ audio_chunk: audioChunk, final: last }));
+      }
+    });
+  }
+
   // 🕵️ Silence detection logic
   monitorSilence() {
     let userHasSpoken = false;
@@ -200,8 +338,13 @@ class PublicInterviewChat {
 
   stopRecording() {
     if (this.isRecording && this.mediaRecorder.state !== "inactive") {
-      this.mediaRecorder.stop();
       this.isRecording = false;
+      if (this.streamingStt) {
+        clearTimeout(this.clipTimer);
+        this.endClip(this.mediaRecorder, true);
+      } else {
+        this.mediaRecorder.stop();
+      }
       this.stopTimer();
       this.recordingStatus.classList.add("hidden");
       clearTimeout(this.silenceTimer);
@@ -249,8 +392,13 @@ class PublicInterviewChat {
     return textEl; // 🆕 return the text element for updating later
   }
 
-  // 🆕 Update user message with final STT text
-  updateUserMessage(finalText) {
+  // 🆕 Update user message with partial or final STT text
+  updateUserMessage(finalText, partial = false) {
+    if (partial) {
+      if (!this.currentUserMsg) this.currentUserMsg = this.addMessage("user", "");
+      this.currentUserMsg.textContent = finalText;
+      return;
+    }
     if (this.currentUserMsg) {
       this.currentUserMsg.textContent = finalText;
       this.currentUserMsg = null;
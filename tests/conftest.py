@@ -0,0 +1,10 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Settings the app modules read at import; the tests never reach these services
+os.environ.setdefault("ELEVEN_LABS", "test")
+os.environ.setdefault("SECRET_KEY", "test" * 8)
+os.environ.setdefault("DATABASE_URI", "sqlite:///:memory:")
@@ -0,0 +1,37 @@
+import asyncio
+import os
+import time
+
+from utils.audio_cache import AudioCache
+
+
+def make_cache(tmp_path, name, max_disk_bytes=1000, ttl=60):
+    return AudioCache(name, directory=str(tmp_path), memory_items=0, max_disk_bytes=max_disk_bytes, ttl=ttl)
+
+
+def test_disk_entries_expire_after_ttl(tmp_path):
+    cache = make_cache(tmp_path, "test_audio_ttl")
+    asyncio.run(cache.set("a", b"x" * 10))
+    assert asyncio.run(cache.get("a")) == b"x" * 10
+
+    written = time.time() - 120
+    os.utime(tmp_path / "a.mp3", (written, written))
+    assert asyncio.run(cache.get("a")) is None
+    assert not (tmp_path / "a.mp3").exists()
+    assert cache.stats()["disk_expirations"] == 1
+
+
+def test_eviction_trims_to_low_water_mark_least_recently_used_first(tmp_path):
+    cache = make_cache(tmp_path, "test_audio_evict")
+    now = time.time()
+    for i in range(5):
+        asyncio.run(cache.set(f"k{i}", b"x" * 200))
+        os.utime(tmp_path / f"k{i}.mp3", (now - 100 + i, now - 1))
+    os.utime(tmp_path / "k0.mp3", (now, now - 1))  # k0 used most recently
+
+    asyncio.run(cache.set("k5", b"x" * 200))
+
+    remaining = sorted(p.stem for p in tmp_path.iterdir())
+    # 1200 bytes trimmed below 900 (90% of the cap), not just below 1000
+    assert remaining == ["k0", "k3", "k4", "k5"]
+    assert cache.stats()["disk_bytes"] == 800
@@ -0,0 +1,39 @@
+import asyncio
+from datetime import timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from starlette.requests import Request
+
+from apps.auth.utils import create_access_token, get_current_user_async, user_cache
+from database.database import Base
+from database.models import User
+
+
+def request_for(email):
+    token = create_access_token({"sub": email}, timedelta(minutes=5))
+    return Request({"type": "http", "method": "GET", "path": "/dashboard", "query_string": b"",
+                    "headers": [(b"cookie", f"access_token={token}".encode())]})
+
+
+def test_async_current_user_loads_then_serves_from_cache():
+    async def run():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            db.add(User(name="Ada", email="ada@example.com", password="x", is_recruiter=True))
+            await db.commit()
+        user_cache.pop("ada@example.com")
+
+        async with AsyncSession(engine) as db:
+            loaded = await get_current_user_async(request_for("ada@example.com"), db)
+        async with AsyncSession(engine) as db:
+            cached = await get_current_user_async(request_for("ada@example.com"), db)
+            attached = cached in db
+        await engine.dispose()
+        return loaded, cached, attached
+
+    loaded, cached, attached = asyncio.run(run())
+    assert (loaded.id, loaded.name, loaded.is_recruiter) == (cached.id, cached.name, cached.is_recruiter)
+    assert attached
+    assert user_cache.get("ada@example.com")["email"] == "ada@example.com"
@@ -0,0 +1,47 @@
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from database.database import Base
+from database.ingest import ingest_jobs
+from database.models import Job
+
+
+def make_session():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(text("""
+            CREATE VIRTUAL TABLE job_fts USING fts5(
+                title, company, location, description, skills,
+                tokenize = 'porter unicode61 remove_diacritics 2'
+            )
+        """))
+    return Session(engine)
+
+
+def job(title, description="python fastapi"):
+    return {"title": title, "company": "Acme", "location": "Lahore", "description": description,
+            "source": "linkedin", "posted_on": "today"}
+
+
+def statuses(results):
+    return [result["status"] for result in results]
+
+
+def test_outcomes_come_from_the_write_not_an_earlier_lookup():
+    db = make_session()
+    # Another user stored "Dev 0" first, e.g. a concurrent ingest that committed before ours
+    ingest_jobs(db, [job("Dev 0")], user_id=2)
+
+    results = ingest_jobs(db, [job("Dev 0", "changed"), job("Dev 1")], user_id=1, on_conflict="update")
+    assert statuses(results) == ["skipped", "created"]
+    assert db.scalar(select(Job.description).filter_by(id=results[0]["job_id"])) == "python fastapi"
+
+    results = ingest_jobs(db, [job("Dev 1", "rewritten"), job("Dev 2")], user_id=1, on_conflict="update")
+    assert statuses(results) == ["updated", "created"]
+    assert db.execute(text("SELECT rowid FROM job_fts WHERE job_fts MATCH 'rewritten'")).scalars().all() == [
+        results[0]["job_id"]
+    ]
+
+    assert statuses(ingest_jobs(db, [job("Dev 2", "ignored")], user_id=1)) == ["skipped"]
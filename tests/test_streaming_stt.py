@@ -0,0 +1,79 @@
+import asyncio
+import base64
+import json
+
+from config import Config
+from apps.stt_tts.streaming import ClipRecognizer
+from apps.websocket import websocket_route
+from apps.websocket.websocket_route import FRAME_ANSWER_CHUNK, FLAG_LAST_CHUNK, pack_audio_frame
+
+
+class FakeWebSocket:
+    """Replays candidate messages and records what the server sends."""
+
+    def __init__(self, messages):
+        self.incoming = list(messages)
+        self.sent = []
+
+    async def receive(self):
+        return self.incoming.pop(0)
+
+    async def send_json(self, data):
+        self.sent.append(data)
+
+
+def text_chunk(text, final=False):
+    payload = {"audio_chunk": base64.b64encode(text.encode()).decode(), "final": final}
+    return {"type": "websocket.receive", "text": json.dumps(payload)}
+
+
+def test_fake_recognizer_partial_and_final_transcripts(monkeypatch):
+    monkeypatch.setattr(Config, "STT_STREAMING_PROVIDER", "fake")
+    websocket = FakeWebSocket([
+        text_chunk("built a "),
+        {"type": "websocket.receive", "bytes": pack_audio_frame(FRAME_ANSWER_CHUNK, 1, 0, b"billing API ")},
+        {"type": "websocket.receive", "bytes": pack_audio_frame(FRAME_ANSWER_CHUNK, 1, 0, b"", flags=FLAG_LAST_CHUNK)},
+    ])
+
+    text, stt_ms, last = asyncio.run(
+        websocket_route.transcribe_answer_stream(websocket, {"audio_chunk": b"I ", "final": False})
+    )
+
+    assert [m["text"] for m in websocket.sent] == ["I", "I built a", "I built a billing API"]
+    assert all(m["type"] == "user_transcript" and m["partial"] for m in websocket.sent)
+    assert text == "I built a billing API"
+    assert last["final"] and stt_ms >= 0
+    assert not websocket.incoming
+
+
+def test_clip_recognizer_transcribes_each_clip_once_in_order():
+    calls, partials = [], []
+
+    async def transcribe(clip):
+        calls.append(clip)
+        await asyncio.sleep(0.02 if clip == b"first" else 0)  # later clips finish first
+        return clip.decode()
+
+    async def on_partial(text):
+        partials.append(text)
+
+    async def run():
+        recognizer = ClipRecognizer(on_partial, transcribe)
+        for clip in (b"first", b"second", b"", b"third"):
+            await recognizer.feed(clip)
+        return await recognizer.finish()
+
+    assert asyncio.run(run()) == "first second third"
+    assert calls == [b"first", b"second", b"third"]
+    assert partials == ["first second third"]
+
+
+def test_answer_stt_mode_follows_config_unless_requested(monkeypatch):
+    monkeypatch.setattr(Config, "STT_TRANSCRIBE_CLIPS", False)
+    assert websocket_route.answer_stt_mode({}) == "batch"
+    assert websocket_route.answer_stt_mode({"stt": "stream"}) == "stream"
+
+    monkeypatch.setattr(Config, "STT_TRANSCRIBE_CLIPS", True)
+    assert websocket_route.answer_stt_mode({}) == "stream"
+    assert websocket_route.answer_stt_mode({"stt": "batch"}) == "batch"
+    assert websocket_route.answer_stt_mode({"stt": "bogus"}) == "stream"
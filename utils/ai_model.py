@@ -113,9 +113,12 @@
 
 import os
 import json
+import asyncio
 import google.generativeai as genai
 from typing import AsyncGenerator
+from contextlib import aclosing
 import re
+from config import Config
 from .conversationMemory import ConversationMemory, summarize_text_local
 
 
@@ -123,6 +126,45 @@ GEMINI_API_KEY = os.getenv("GOOGLE_API")
 genai.configure(api_key=GEMINI_API_KEY)
 
 
+class GeminiClient:
+    """
+    Process-wide Gemini access: one GenerativeModel per model name, the SDK's async
+    (grpc.aio) API so requests never block the event loop, and a semaphore that caps
+    in-flight AI calls (a stream holds its slot until it is fully read).
+    """
+
+    def __init__(self, model_name: str, max_concurrency: int, timeout: float):
+        self.model_name = model_name
+        self.timeout = timeout
+        self._models: dict[str, genai.GenerativeModel] = {}
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    def model(self, model_name: str | None = None) -> genai.GenerativeModel:
+        model_name = model_name or self.model_name
+        if model_name not in self._models:
+            self._models[model_name] = genai.GenerativeModel(model_name)
+        return self._models[model_name]
+
+    async def generate(self, prompt: str, model_name: str | None = None) -> str:
+        async with self._semaphore:
+            response = await self.model(model_name).generate_content_async(
+                prompt, request_options={"timeout": self.timeout}
+            )
+        return response.text
+
+    async def stream(self, prompt: str, model_name: str | None = None) -> AsyncGenerator[str, None]:
+        async with self._semaphore:
+            response = await self.model(model_name).generate_content_async(
+                prompt, stream=True, request_options={"timeout": self.timeout}
+            )
+            async for chunk in response:
+                if chunk and chunk.text:
+                    yield chunk.text
+
+
+ai_client = GeminiClient(Config.AI_MODEL, Config.AI_MAX_CONCURRENCY, Config.AI_TIMEOUT_SECONDS)
+
+
 async def analyze_resume(
     job_requirement: str,
     job_description: str,
@@ -149,9 +191,7 @@ async def analyze_resume(
             """
     
     try:
-        model = genai.GenerativeModel("gemini-2.0-flash")
-        response = model.generate_content(user_prompt)
-        text_output = response.text.strip()
+        text_output = (await ai_client.generate(user_prompt)).strip()
         clean_text = re.sub(r"^```(?:json)?|```$", "", text_output, flags=re.MULTILINE).strip()
         try:
             result = json.loads(clean_text)
@@ -174,10 +214,9 @@ async def evaluate_interview_ai(transcript: list, system_prompt) -> dict:
         [f"Q: {t['question']}\nA: {t['answer']}" for t in transcript if 'question' in t and 'answer' in t]
     )
     full_prompt = f"{system_prompt}\n\nTranscript:\n{transcript_text}"
-    model = genai.GenerativeModel("gemini-2.0-flash")
-    response = model.generate_content(full_prompt)
+    response_text = await ai_client.generate(full_prompt)
     try:
-        result = json.loads(response.text)
+        result = json.loads(response_text)
         return result
     except Exception:
         return {
@@ -203,14 +242,13 @@ async def stream_ai_response(user_message: str, system_prompt: str, memory: Conv
         Always refer to the resume and job description summaries where relevant.
         """
 
-        model = genai.GenerativeModel("gemini-2.0-flash")
-        stream = model.generate_content(final_prompt, stream=True)
         ai_response = ""
-
-        for chunk in stream:
-            if chunk and chunk.text:
-                ai_response += chunk.text
-                yield chunk.text
+        # aclosing: if our caller closes us early, the model stream is closed too
+        stream = ai_client.stream(final_prompt)
+        async with aclosing(stream):
+            async for text in stream:
+                ai_response += text
+                yield text
 
         await memory.add_message("AI", ai_response)
 
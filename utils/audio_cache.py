@@ -0,0 +1,166 @@
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from utils.cache import CACHES, TTLCache
+
+
+def audio_cache_key(text: str, voice_id: str | None, model: str, voice_settings: dict | None) -> str:
+    """Content address of a synthesized clip: same text, voice, model and settings -> same audio."""
+    payload = json.dumps([text, voice_id, model, voice_settings], sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AudioCache:
+    """
+    Two-tier cache of synthesized audio: an in-memory LRU (a TTLCache) in front of
+    a directory of <key>.mp3 files. A file's mtime is its write time, checked
+    against `ttl` on every read; its atime is set on each hit. Once the directory
+    exceeds `max_disk_bytes` it is trimmed to DISK_LOW_WATER of that, expired and
+    then least recently used files first. Disk work runs in a worker thread.
+    Registered in CACHES so /debug/caches reports hit rate, bytes served from the
+    cache and TTS API calls avoided.
+    """
+
+    # Trim to this fraction of max_disk_bytes, so a full directory is not rescanned on every write
+    DISK_LOW_WATER = 0.9
+
+    def __init__(self, name: str, directory: str, memory_items: int, max_disk_bytes: int, ttl: float):
+        self.name = name
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.ttl = ttl
+        self.memory = TTLCache(f"{name}_memory", maxsize=memory_items, ttl=ttl)
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.disk_evictions = 0
+        self.disk_expirations = 0
+        self._disk_bytes = None  # sized lazily on first disk access
+        CACHES[name] = self
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.mp3")
+
+    def _disk_enabled(self) -> bool:
+        return bool(self.directory) and self.max_disk_bytes > 0 and self.ttl > 0
+
+    def _scan_disk(self):
+        if self._disk_bytes is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._disk_bytes = sum(entry.stat().st_size for entry in os.scandir(self.directory) if entry.is_file())
+
+    async def get(self, key: str) -> bytes | None:
+        audio = self.memory.get(key)
+        if audio is not None:
+            with self._lock:
+                self.memory_hits += 1
+                self.bytes_saved += len(audio)
+            return audio
+
+        if self._disk_enabled():
+            audio = await asyncio.to_thread(self._read_disk, key)
+            if audio is not None:
+                self.memory.set(key, audio)
+                with self._lock:
+                    self.disk_hits += 1
+                    self.bytes_saved += len(audio)
+                return audio
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def _read_disk(self, key: str) -> bytes | None:
+        """The stored clip, or None if there is none or it is older than the TTL."""
+        path = self._path(key)
+        try:
+            stat = os.stat(path)
+            if time.time() - stat.st_mtime > self.ttl:
+                self._remove(path, stat.st_size, expired=True)
+                return None
+            with open(path, "rb") as f:
+                audio = f.read()
+            os.utime(path, (time.time(), stat.st_mtime))
+        except FileNotFoundError:
+            return None
+        return audio
+
+    def _remove(self, path: str, size: int, expired: bool):
+        with self._lock:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                return
+            if self._disk_bytes is not None:
+                self._disk_bytes -= size
+            if expired:
+                self.disk_expirations += 1
+            else:
+                self.disk_evictions += 1
+
+    async def set(self, key: str, audio: bytes):
+        if not audio:
+            return
+        self.memory.set(key, audio)
+        if self._disk_enabled() and len(audio) <= self.max_disk_bytes:
+            await asyncio.to_thread(self._write_disk, key, audio)
+
+    def _write_disk(self, key: str, audio: bytes):
+        with self._lock:
+            self._scan_disk()
+            path = self._path(key)
+            if os.path.exists(path):
+                return
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(audio)
+            os.replace(tmp_path, path)
+            self._disk_bytes += len(audio)
+            full = self._disk_bytes > self.max_disk_bytes
+        if full:
+            self._evict_disk()
+
+    def _evict_disk(self):
+        """Remove expired, then least recently used files until the directory is under the low-water mark."""
+        now = time.time()
+        entries = []
+        for entry in os.scandir(self.directory):
+            try:
+                if entry.is_file():
+                    entries.append((entry.path, entry.stat()))
+            except FileNotFoundError:
+                pass
+        total = sum(stat.st_size for _, stat in entries)
+        target = self.max_disk_bytes * self.DISK_LOW_WATER
+        # Expired files sort first, the rest by last use
+        entries.sort(key=lambda item: (now - item[1].st_mtime <= self.ttl, item[1].st_atime))
+        for path, stat in entries:
+            expired = now - stat.st_mtime > self.ttl
+            if total <= target and not expired:
+                break
+            self._remove(path, stat.st_size, expired)
+            total -= stat.st_size
+        with self._lock:
+            self._disk_bytes = total
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "api_calls_avoided": hits,
+                "bytes_saved": self.bytes_saved,
+                "disk_bytes": self._disk_bytes or 0,
+                "max_disk_bytes": self.max_disk_bytes,
+                "disk_evictions": self.disk_evictions,
+                "disk_expirations": self.disk_expirations,
+            }
@@ -1,68 +1,94 @@
 from typing import List, Dict
+from functools import lru_cache
 import textwrap
-import heapq
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize, sent_tokenize
+import numpy as np
 from string import punctuation
+from utils.nltk_resources import load_nltk
 
-# Ensure required NLTK data is downloaded
-nltk.download('punkt', quiet=True)
-nltk.download('stopwords', quiet=True)
+SUMMARY_ERROR_PREFIX = "[NLTK Summary Error]"
+# Sentences kept in job description and resume summaries
+PROFILE_SUMMARY_SENTENCES = 4
+
+
+@lru_cache(maxsize=1)
+def get_stop_words() -> frozenset:
+    """English stopwords plus punctuation, built once per process."""
+    load_nltk()
+    from nltk.corpus import stopwords
+    return frozenset(stopwords.words("english")) | frozenset(punctuation)
 
 
 def summarize_text_local(text: str, sentence_count: int = 3) -> str:
     """
     Summarize text locally using NLTK frequency-based scoring.
     Keeps the most informative sentences while staying lightweight.
+
+    Every sentence is tokenized once into a flat list of (sentence, term) pairs;
+    term frequencies and sentence scores are then two NumPy bincounts over it.
     """
     try:
         if not text.strip():
             return "[Empty text]"
 
-        sentences = sent_tokenize(text)
+        nltk = load_nltk()  # NltkResourceError if the data is not seeded
+        sentences = nltk.sent_tokenize(text)
         if len(sentences) <= sentence_count:
             return text  # No need to summarize short text
 
-        stop_words = set(stopwords.words("english") + list(punctuation))
-        words = word_tokenize(text.lower())
-
-        # Build frequency table
-        freq_table = {}
-        for word in words:
-            if word.isalpha() and word not in stop_words:
-                freq_table[word] = freq_table.get(word, 0) + 1
+        stop_words = get_stop_words()
+        sentence_ids: Dict[str, int] = {}  # repeated sentences share one id, like the old dict of scores
+        term_ids: Dict[str, int] = {}
+        token_sentences: List[int] = []
+        token_terms: List[int] = []
+        for sent in sentences:
+            sentence_id = sentence_ids.setdefault(sent, len(sentence_ids))
+            for word in nltk.word_tokenize(sent.lower()):
+                if word.isalpha() and word not in stop_words:
+                    token_sentences.append(sentence_id)
+                    token_terms.append(term_ids.setdefault(word, len(term_ids)))
 
-        # Normalize frequencies
-        max_freq = max(freq_table.values()) if freq_table else 1
-        for word in freq_table:
-            freq_table[word] /= max_freq
+        if not token_terms:
+            return textwrap.shorten(text, width=400, placeholder="...")
 
-        # Score each sentence
-        sentence_scores = {}
-        for sent in sentences:
-            for word in word_tokenize(sent.lower()):
-                if word in freq_table:
-                    sentence_scores[sent] = sentence_scores.get(sent, 0) + freq_table[word]
+        token_sentences = np.asarray(token_sentences)
+        token_terms = np.asarray(token_terms)
 
-        # Select top N sentences
-        summary_sentences = heapq.nlargest(sentence_count, sentence_scores, key=sentence_scores.get)
-        summary = " ".join(summary_sentences)
+        # Normalized frequency of each term, then each sentence's sum over its tokens
+        term_freq = np.bincount(token_terms, minlength=len(term_ids)).astype(np.float64)
+        term_freq /= term_freq.max()
+        scores = np.bincount(token_sentences, weights=term_freq[token_terms], minlength=len(sentence_ids))
 
-        return summary if summary else textwrap.shorten(text, width=400, placeholder="...")
+        # Top N sentences with at least one scored word; ties keep text order (as heapq.nlargest did)
+        candidates = np.flatnonzero(np.bincount(token_sentences, minlength=len(sentence_ids)))
+        top = candidates[np.argsort(-scores[candidates], kind="stable")[:sentence_count]]
+        unique_sentences = list(sentence_ids)
+        return " ".join(unique_sentences[i] for i in top)
 
     except Exception as e:
-        return f"[NLTK Summary Error] {str(e)}"
+        return f"{SUMMARY_ERROR_PREFIX} {str(e)}"
+
+
+def summarize_profile(text: str | None) -> str | None:
+    """
+    Job description or resume summary to store, or None if the summarizer failed
+    (e.g. NLTK data not seeded) so it is computed again instead of persisting the error.
+    """
+    summary = summarize_text_local(text or "", sentence_count=PROFILE_SUMMARY_SENTENCES)
+    return None if summary.startswith(SUMMARY_ERROR_PREFIX) else summary
 
 
 class ConversationMemory:
-    def __init__(self, job_desc: str, resume: str, summarize_every=3):
+    def __init__(
+        self, job_desc: str, resume: str, summarize_every=3,
+        job_summary: str | None = None, resume_summary: str | None = None
+    ):
         self.summary = "The conversation has just begun."
         self.recent_messages: List[Dict[str, str]] = []
 
-        # 🔹 Summarize job description and resume using NLTK
-        self.job_summary = summarize_text_local(job_desc, sentence_count=4)
-        self.resume_summary = summarize_text_local(resume, sentence_count=4)
+        # 🔹 Summaries precomputed at job create/edit and resume upload (database/summaries.py);
+        # summarized here with NLTK only when the caller has none
+        self.job_summary = job_summary or summarize_text_local(job_desc, sentence_count=PROFILE_SUMMARY_SENTENCES)
+        self.resume_summary = resume_summary or summarize_text_local(resume, sentence_count=PROFILE_SUMMARY_SENTENCES)
 
         self.turn_count = 0
         self.summarize_every = summarize_every
@@ -0,0 +1,94 @@
+"""
+NLTK data for the local summarizer (utils/conversationMemory.py), read from
+Config.NLTK_DATA_DIR and never downloaded at runtime.
+
+Seed the directory once per build or deploy (this is the only step that needs
+the network):
+
+    python -m utils.nltk_resources
+
+nltk itself is imported on first use, not at app startup. If a resource is
+missing, load_nltk() raises NltkResourceError right away, naming the directory
+and the command above.
+"""
+import argparse
+import os
+import sys
+from functools import lru_cache
+from config import Config
+
+
+# NLTK package id -> resource path checked with nltk.data.find
+# (sent_tokenize / word_tokenize read punkt_tab since NLTK 3.8.2; punkt is the pickled predecessor)
+RESOURCES = {
+    "punkt_tab": "tokenizers/punkt_tab/english/",
+    "stopwords": "corpora/stopwords",
+}
+
+
+class NltkResourceError(LookupError):
+    """Required NLTK data is not installed."""
+
+
+def _data_dir() -> str:
+    return os.path.abspath(Config.NLTK_DATA_DIR)
+
+
+def missing_resources(nltk) -> list[str]:
+    missing = []
+    for name, path in RESOURCES.items():
+        try:
+            nltk.data.find(path)
+        except LookupError:
+            missing.append(name)
+    return missing
+
+
+@lru_cache(maxsize=1)
+def load_nltk():
+    """
+    The nltk module, with NLTK_DATA_DIR searched before NLTK's default locations,
+    once every resource in RESOURCES is found. Failures are not cached, so
+    seeding the directory takes effect without a restart.
+    """
+    import nltk
+
+    directory = _data_dir()
+    if directory not in nltk.data.path:
+        nltk.data.path.insert(0, directory)
+    missing = missing_resources(nltk)
+    if missing:
+        raise NltkResourceError(
+            f"NLTK data missing: {', '.join(missing)} (looked in {directory} and NLTK's default paths). "
+            f"Seed it with `python -m utils.nltk_resources`."
+        )
+    return nltk
+
+
+def seed(directory: str) -> list[str]:
+    """Download every resource not yet installed into `directory`; returns the ids downloaded."""
+    import nltk
+
+    os.makedirs(directory, exist_ok=True)
+    if directory not in nltk.data.path:
+        nltk.data.path.insert(0, directory)
+    missing = missing_resources(nltk)
+    for name in missing:
+        if not nltk.download(name, download_dir=directory, quiet=True, raise_on_error=True):
+            raise NltkResourceError(f"Could not download NLTK resource {name!r}")
+    return missing
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Download the NLTK data the app needs.")
+    parser.add_argument("--dir", default=_data_dir(), help="target directory (default: NLTK_DATA_DIR)")
+    args = parser.parse_args()
+    try:
+        downloaded = seed(os.path.abspath(args.dir))
+    except Exception as e:
+        sys.exit(f"Seeding NLTK data failed: {e}")
+    print(f"Downloaded {', '.join(downloaded)} into {args.dir}" if downloaded else "NLTK data already installed")
+
+
+if __name__ == "__main__":
+    main()
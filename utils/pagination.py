@@ -0,0 +1,43 @@
+import base64
+from datetime import datetime
+from sqlalchemy import and_, or_
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Opaque keyset cursor pointing just after the (created_at, id) of the last row on a page."""
+    raw = f"{created_at.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Inverse of encode_cursor. Raises ValueError on anything that was not produced by it."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def keyset_page(query, created_at_column, id_column, cursor: str | None, limit: int):
+    """
+    Order a select newest first on (created_at, id) and, when a cursor is given,
+    keep only the rows after it. Fetches limit + 1 rows so the caller can tell
+    whether another page exists (see split_page).
+    """
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.filter(or_(
+            created_at_column < created_at,
+            and_(created_at_column == created_at, id_column < row_id),
+        ))
+    return query.order_by(created_at_column.desc(), id_column.desc()).limit(limit + 1)
+
+
+def split_page(rows, limit: int):
+    """Trim the extra look-ahead row and return (rows, next_cursor)."""
+    rows = list(rows)
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1].created_at, rows[-1].id)
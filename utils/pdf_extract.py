@@ -0,0 +1,122 @@
+"""
+PDF text extraction on a process pool.
+
+PyPDF2 is pure Python: a long or hostile PDF can hold a CPU for seconds or
+blow up memory. Parsing therefore runs in worker processes, never on the event
+loop, under limits from Config:
+
+- PDF_MAX_BYTES: larger files are rejected before they reach a worker
+- PDF_MAX_PAGES: documents with more pages are rejected
+- PDF_TEXT_PAGES: only the first N pages are parsed for text
+- PDF_TIMEOUT_SECONDS: per document, enforced inside the worker with a timer
+- PDF_WORKER_MEMORY_MB: address space limit of each worker (0 = unlimited)
+"""
+import asyncio
+import io
+import multiprocessing
+import signal
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from config import Config
+
+
+class PdfLimitError(ValueError):
+    """The PDF exceeds a size, page or time limit."""
+
+
+class PdfParseError(ValueError):
+    """The PDF could not be parsed."""
+
+
+_pool: ProcessPoolExecutor | None = None
+
+
+def _limit_worker_memory(memory_mb: int):
+    if memory_mb > 0:
+        try:
+            import resource
+            limit = memory_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ImportError, ValueError, OSError):
+            pass
+
+
+class _ParseTimeout(BaseException):
+    """Raised by the worker's timer. Not an Exception, so PyPDF2's own handlers cannot swallow it."""
+
+
+def _raise_timeout(signum, frame):
+    raise _ParseTimeout
+
+
+def _extract_in_worker(pdf_bytes: bytes, max_pages: int, text_pages: int, timeout: float) -> tuple[str, int]:
+    from PyPDF2 import PdfReader
+
+    timed = hasattr(signal, "setitimer")
+    if timed:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        reader = PdfReader(io.BytesIO(pdf_bytes))
+        page_count = len(reader.pages)
+        if page_count > max_pages:
+            raise PdfLimitError(f"PDF has {page_count} pages; the limit is {max_pages}")
+        # reader.pages is lazy: pages past text_pages are never parsed
+        text = "".join(reader.pages[i].extract_text() or "" for i in range(min(page_count, text_pages)))
+        return text, page_count
+    except _ParseTimeout:
+        raise PdfLimitError(f"PDF parsing took longer than {timeout:g} s")
+    except PdfLimitError:
+        raise
+    except Exception as e:
+        raise PdfParseError(f"{type(e).__name__}: {e}")
+    finally:
+        if timed:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=Config.PDF_WORKERS,
+            # Forking a process that runs an event loop and thread pools is unsafe
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_limit_worker_memory,
+            initargs=(Config.PDF_WORKER_MEMORY_MB,),
+        )
+    return _pool
+
+
+async def extract_pdf(pdf_bytes: bytes, text_pages: int | None = None) -> tuple[str, int]:
+    """
+    (text of the first `text_pages` pages, total page count). Raises PdfLimitError
+    for documents over the limits and PdfParseError for unreadable ones.
+    """
+    if len(pdf_bytes) > Config.PDF_MAX_BYTES:
+        raise PdfLimitError(f"PDF is {len(pdf_bytes)} bytes; the limit is {Config.PDF_MAX_BYTES}")
+
+    global _pool
+    loop = asyncio.get_running_loop()
+    job = loop.run_in_executor(
+        _get_pool(), _extract_in_worker, pdf_bytes,
+        Config.PDF_MAX_PAGES, text_pages or Config.PDF_TEXT_PAGES, Config.PDF_TIMEOUT_SECONDS,
+    )
+    try:
+        if hasattr(signal, "setitimer"):
+            return await job
+        # No in-worker timer on this platform: stop waiting, the worker finishes on its own
+        return await asyncio.wait_for(job, Config.PDF_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        raise PdfLimitError(f"PDF parsing took longer than {Config.PDF_TIMEOUT_SECONDS:g} s")
+    except BrokenProcessPool:
+        # A worker died (e.g. hit the memory limit); start a fresh pool for the next document
+        _pool = None
+        raise PdfParseError("PDF worker crashed while parsing this document")
+
+
+def shutdown_pdf_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None